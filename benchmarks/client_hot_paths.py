@@ -0,0 +1,258 @@
+"""
+Measures the hot paths of the client against the in-process fake Flink REST server, and compares the results with a
+baseline, so performance regressions are caught.
+
+Throughput (calls/sec) and p50/p99 latency are measured for JobsClient.all, TaskManagersClient.metrics,
+JobVertexSubtaskClient.metrics, get_checkpoint_details(show_subtasks=True) and the jar upload. Peak memory (traced
+Python allocations) is measured for the download of a large log file and of a long checkpoint history, both
+materialized and streamed.
+
+The results are written to a JSON file. If a baseline file exists, every metric is compared with it, and the script
+exits with status 1 if any of them is worse than the tolerance. Every benchmark is run several rounds and the best
+result is kept, and the tail latencies have a separate, wider tolerance, which makes the comparison less sensitive to
+the noise of the machine. Baselines depend on the machine, so they should be recorded and compared on the same host.
+
+No baseline is shipped with the repository, for that reason. Record one with --save first, e.g. on the main branch,
+then run the script again without --save to compare. Without a baseline file the comparison is skipped, which is
+reported on the standard error, and the script exits with status 0.
+
+Usage: python benchmarks/client_hot_paths.py [--calls N] [--rounds N] [--baseline PATH] [--output PATH] [--save]
+                                             [--tolerance T] [--tail-tolerance T]
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import requests
+
+from flink_rest_client.common import RestSession
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Metrics where a higher value is better, every other metric is a cost.
+HIGHER_IS_BETTER = {"calls_per_sec", "mib_per_sec"}
+
+MIB = 1024 * 1024
+
+
+def percentile(sorted_values, percent):
+    index = max(
+        0, min(len(sorted_values) - 1, round(len(sorted_values) * percent / 100) - 1)
+    )
+    return sorted_values[index]
+
+
+def measure_calls(func, calls, warmup=None):
+    for _ in range(max(1, calls // 10) if warmup is None else warmup):
+        func()
+    latencies = []
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        call_started_at = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_started_at)
+    elapsed = time.perf_counter() - started_at
+    latencies.sort()
+    return {
+        "calls_per_sec": calls / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def measure_peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_mib": peak / MIB}
+
+
+def serve_precomputed(server, url, template):
+    # Serves a fixed response body, so the allocations of the server thread do not distort the memory measurements.
+    body = requests.get(url).content
+    server.set_route("GET", template, lambda request: (200, body))
+
+
+def run(calls):
+    results = {}
+    cluster = FakeFlinkCluster(
+        jobs=100,
+        vertices=10,
+        parallelism=8,
+        taskmanagers=20,
+        metrics=100,
+        checkpoints=10000,
+        log_size=32 * MIB,
+        seed=0,
+    )
+    with FakeFlinkServer(cluster, seed=0) as server, RestSession() as session:
+        client = FlinkRestClientV1(server.host, server.port, session=session)
+        job_id = client.jobs.job_ids()[0]
+        vertex = client.jobs.get_vertex(job_id, client.jobs.get_vertex_ids(job_id)[0])
+        checkpoint_id = client.jobs.get_checkpoint_ids(job_id)[0]
+        taskmanager_id = client.taskmanagers.taskmanager_ids()[0]
+
+        results["jobs.all"] = measure_calls(client.jobs.all, calls)
+        results["taskmanagers.metrics"] = measure_calls(
+            client.taskmanagers.metrics, calls
+        )
+        results["subtasks.metrics"] = measure_calls(vertex.subtasks.metrics, calls)
+        results["jobs.get_checkpoint_details(show_subtasks=True)"] = measure_calls(
+            lambda: client.jobs.get_checkpoint_details(
+                job_id, checkpoint_id, show_subtasks=True
+            ),
+            calls,
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            jar_path = os.path.join(directory, "benchmark.jar")
+            with open(jar_path, "wb") as jar:
+                jar.write(os.urandom(16 * MIB))
+            uploads = max(3, calls // 50)
+            upload = measure_calls(
+                lambda: client.jars.upload(jar_path), uploads, warmup=1
+            )
+            upload["mib_per_sec"] = upload["calls_per_sec"] * 16
+            results["jars.upload(16 MiB)"] = upload
+
+            log_file = client.taskmanagers.get_logs(taskmanager_id)[0]["name"]
+            results["taskmanagers.get_log(32 MiB)"] = measure_peak_memory(
+                lambda: client.taskmanagers.get_log(taskmanager_id, log_file)
+            )
+            results["taskmanagers.download_log(32 MiB)"] = measure_peak_memory(
+                lambda: client.taskmanagers.download_log(
+                    taskmanager_id, log_file, os.path.join(directory, "taskmanager.log")
+                )
+            )
+
+        serve_precomputed(
+            server,
+            f"{client.api_url}/jobs/{job_id}/checkpoints",
+            "/jobs/:jobid/checkpoints",
+        )
+        results["jobs.get_checkpoints(10000 checkpoints)"] = measure_peak_memory(
+            lambda: client.jobs.get_checkpoints(job_id)
+        )
+        results["jobs.iter_checkpoints(10000 checkpoints)"] = measure_peak_memory(
+            lambda: collections.deque(client.jobs.iter_checkpoints(job_id), maxlen=0)
+        )
+    return results
+
+
+def best_of(rounds):
+    # The best value of every metric over the rounds is the least disturbed by the noise of the machine.
+    best = {}
+    for results in rounds:
+        for name, metrics in results.items():
+            for metric, value in metrics.items():
+                current = best.setdefault(name, {}).get(metric)
+                if current is None:
+                    best[name][metric] = value
+                elif metric in HIGHER_IS_BETTER:
+                    best[name][metric] = max(current, value)
+                else:
+                    best[name][metric] = min(current, value)
+    return best
+
+
+def compare(results, baseline, tolerance, tail_tolerance):
+    """
+    Prints the change of every metric, and returns the list of regressions.
+    """
+    regressions = []
+    print(
+        f"{'benchmark':<50} {'metric':<14} {'baseline':>12} {'current':>12} {'change':>8}"
+    )
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(name, {}).get(metric)
+            if previous is None:
+                print(f"{name:<50} {metric:<14} {'-':>12} {value:>12.2f}")
+                continue
+            change = (value - previous) / previous if previous else 0.0
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            limit = tail_tolerance if metric == "p99_ms" else tolerance
+            flag = "  REGRESSION" if worse > limit else ""
+            if flag:
+                regressions.append((name, metric, previous, value))
+            print(
+                f"{name:<50} {metric:<14} {previous:>12.2f} {value:>12.2f} {change:>+8.1%}{flag}"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--calls", type=int, default=200, help="measured calls per benchmark"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="the best result of the rounds is kept"
+    )
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="baseline JSON file"
+    )
+    parser.add_argument(
+        "--output", help="file of the JSON results (default: standard output)"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="accepted relative change of a metric",
+    )
+    parser.add_argument(
+        "--tail-tolerance",
+        type=float,
+        default=1.0,
+        help="accepted relative change of the p99 latencies",
+    )
+    args = parser.parse_args(argv)
+
+    results = best_of(run(args.calls) for _ in range(args.rounds))
+    document = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as target:
+            target.write(document + "\n")
+    else:
+        print(document)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline) as source:
+            regressions = compare(
+                results, json.load(source), args.tolerance, args.tail_tolerance
+            )
+    elif not args.save:
+        print(
+            f"No baseline at {args.baseline}, the comparison is skipped. Record one with --save.",
+            file=sys.stderr,
+        )
+    if args.save:
+        with open(args.baseline, "w") as target:
+            target.write(document + "\n")
+        print(f"Baseline saved to {args.baseline}")
+    for name, metric, previous, value in regressions:
+        print(
+            f"Regression: {name} {metric} {previous:.2f} -> {value:.2f}",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Compares the per-call latency of fresh connections with pooled keep-alive connections.
+
+The benchmark starts a local stub server that answers every GET request with a small JSON document, then calls the
+/overview endpoint through the module level requests API and through a RestSession.
+
+Usage: python benchmarks/connection_reuse.py [number_of_calls]
+"""
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from flink_rest_client.common import RestSession, _execute_rest_request
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps({"taskmanagers": 1, "flink-version": "1.12.4"}).encode()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(url, calls, session=None):
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        _execute_rest_request(url=url, session=session)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:<12} mean: {statistics.mean(latencies) * 1e6:8.1f} us   "
+        f"p50: {statistics.median(latencies) * 1e6:8.1f} us   p99: {p99 * 1e6:8.1f} us"
+    )
+
+
+def main(calls):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/overview"
+    try:
+        # Warm-up, so the first measured call does not pay for imports and lazy initialization.
+        requests.get(url)
+        report("no pooling", measure(url, calls))
+        with RestSession() as session:
+            report("pooled", measure(url, calls, session=session))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,157 @@
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from flink_rest_client.common import RestException
+from flink_rest_client.json_decoder import decode_json
+
+
+class AsyncRestSession:
+    """
+    Non-blocking HTTP session shared by an async client and all of its sub-clients.
+
+    The session is backed by an aiohttp connection pool, so a single event loop can keep many requests in flight.
+    The aiohttp package is an optional dependency: pip install flink_rest_client[async]
+    """
+
+    def __init__(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        idle_timeout=None,
+        connect_timeout=None,
+        read_timeout=None,
+        json_decoder=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        pool_connections: int
+            (Optional) Maximum number of connections kept open in total. Default: 100
+        pool_maxsize: int
+            (Optional) Maximum number of connections kept open to a single host. Default: 100
+        idle_timeout: float
+            (Optional) Number of seconds after which idle connections are dropped. Default: 15
+        connect_timeout: float
+            (Optional) Number of seconds to wait for establishing a connection. Default: no timeout.
+        read_timeout: float
+            (Optional) Number of seconds to wait for the server between two received bytes. Default: no timeout.
+        json_decoder: callable
+            (Optional) Function decoding the bytes of a JSON response body. Default: decode_json, which uses orjson or
+            ujson if one of them is installed.
+        """
+        if aiohttp is None:
+            raise RestException(
+                "The async client requires the aiohttp package: pip install flink_rest_client[async]"
+            )
+        self.pool_connections = 100 if pool_connections is None else pool_connections
+        self.pool_maxsize = 100 if pool_maxsize is None else pool_maxsize
+        self.idle_timeout = 15 if idle_timeout is None else idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.json_decoder = decode_json if json_decoder is None else json_decoder
+        self._session = None
+
+    def _client_session(self):
+        # aiohttp binds the session to the running event loop, so it is created on first use.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections,
+                limit_per_host=self.pool_maxsize,
+                keepalive_timeout=self.idle_timeout,
+            )
+            # The same timeouts as the ones of RestSession, instead of the 5 minutes total timeout of aiohttp.
+            timeout = aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=self.connect_timeout,
+                sock_read=self.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    def request(self, method, url, **kwargs):
+        """
+        Executes an HTTP request over the pooled connections.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method.
+        url: str
+            Request url.
+        kwargs
+            Keyword arguments forwarded to aiohttp.ClientSession.request.
+
+        Returns
+        -------
+        aiohttp.client._RequestContextManager
+            Async context manager yielding the received response.
+        """
+        return self._client_session().request(method=method, url=url, **kwargs)
+
+    async def close(self):
+        """
+        Closes every pooled connection.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+async def _decode_body(response, session):
+    body = await response.read()
+    # An empty body is decoded as None, like aiohttp does.
+    return session.json_decoder(body) if body.strip() else None
+
+
+async def _raise_for_response(response, session):
+    try:
+        body = await _decode_body(response, session)
+    except ValueError:
+        body = None
+    if isinstance(body, dict) and "errors" in body.keys():
+        error_str = "\n".join(body["errors"])
+    else:
+        error_str = ""
+    raise RestException(f"REST response error ({response.status}): {error_str}")
+
+
+async def _execute_async_rest_request(
+    url,
+    session,
+    http_method=None,
+    accepted_status_code=None,
+    data=None,
+    params=None,
+    json=None,
+):
+    if http_method is None:
+        http_method = "GET"
+    if accepted_status_code is None:
+        accepted_status_code = 200
+    # aiohttp only accepts str query values.
+    if params is not None:
+        params = {key: str(value) for key, value in params.items()}
+
+    async with session.request(
+        http_method, url, params=params, data=data, json=json
+    ) as response:
+        if response.status != accepted_status_code:
+            await _raise_for_response(response, session)
+        return await _decode_body(response, session)
+
+
+async def _execute_async_text_request(url, session):
+    async with session.request("GET", url) as response:
+        if response.status != 200:
+            await _raise_for_response(response, session)
+        return await response.text()
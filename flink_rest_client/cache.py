@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Thread-safe key-value cache with per-entry expiration and LRU eviction.
+    """
+
+    def __init__(self, ttl, maxsize=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        ttl: float
+            Number of seconds an entry stays valid.
+        maxsize: int
+            (Optional) Maximum number of entries. The least recently used entry is evicted first. Default: 256
+        """
+        self.ttl = ttl
+        self.maxsize = 256 if maxsize is None else maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a not yet expired entry.
+
+        Parameters
+        ----------
+        key: hashable
+            Key of the entry.
+        default: object
+            (Optional) Value returned if the key is missing or expired. Default: None
+
+        Returns
+        -------
+        object
+            The cached value or default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl=None):
+        """
+        Stores a value.
+
+        Parameters
+        ----------
+        key: hashable
+            Key of the entry.
+        value: object
+            Value to be cached.
+        ttl: float
+            (Optional) Entry specific time-to-live in seconds. Default: the ttl of the cache.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value of key, or calls loader and caches its result on a miss.
+
+        Parameters
+        ----------
+        key: hashable
+            Key of the entry.
+        loader: callable
+            Function without parameters that produces the value.
+
+        Returns
+        -------
+        object
+            The cached or freshly loaded value.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = loader()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key=None):
+        """
+        Drops a single entry, or every entry if key is not set.
+
+        Parameters
+        ----------
+        key: hashable
+            (Optional) Key of the entry to be dropped. Default: all entries.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix):
+        """
+        Drops every entry whose string key starts with the given prefix.
+
+        Parameters
+        ----------
+        prefix: str
+            Key prefix, e.g. the url prefix of a sub-client.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if str(key).startswith(prefix)]:
+                del self._entries[key]
@@ -1,24 +1,46 @@
-from flink_rest_client.common import RestException
+from urllib.parse import urlsplit
+
+from flink_rest_client.aio import AsyncRestSession
+from flink_rest_client.common import RestException, RestSession
+from flink_rest_client.failover import EndpointPool
+from flink_rest_client.v1.aio.client import AsyncFlinkRestClientV1
 from flink_rest_client.v1.client import FlinkRestClientV1
 
 VERSIONS = {"v1": FlinkRestClientV1}
+ASYNC_VERSIONS = {"v1": AsyncFlinkRestClientV1}
 
 
 class FlinkRestClient:
     @staticmethod
-    def get(host, port=None, version=None):
+    def get(
+        host,
+        port=None,
+        version=None,
+        jar_index=None,
+        resource_cache=None,
+        **session_options,
+    ):
         """
         Constructs a new rest client instance.
 
         Parameters
         ----------
-        host: str
-            Hostname of Flink Jobmanager
+        host: str or list
+            Hostname of Flink Jobmanager, or the list of the JobManager addresses ('host' or 'host:port') of a
+            high-availability cluster. With several addresses, requests go to the leader or the fastest healthy
+            JobManager and fail over transparently.
         port: int
             Port number. Default value: 8081
         version: str
             Version of the REST API. Default value: v1
-        version
+        jar_index: JarIndex
+            (Optional) Index of the already uploaded jars, used to skip re-uploading unchanged jars.
+        resource_cache: ResourceCache
+            (Optional) Persistent cache of the immutable job resources, e.g. completed checkpoint details.
+        session_options
+            (Optional) Keyword arguments of the shared RestSession, e.g. pool_connections, pool_maxsize,
+            idle_timeout, connect_timeout, read_timeout, retry_policy, coalesce_requests,
+            response_cache, instrumentation, tracer and json_decoder.
         """
         port = 8081 if port is None else port
         version = "v1" if version is None else version
@@ -26,4 +48,46 @@ class FlinkRestClient:
         if version not in VERSIONS.keys():
             raise RestException(f"Unknown REST API version: {version}")
         api_client_cls = VERSIONS[version]
-        return api_client_cls(host=host, port=port)
+        scheme = None
+        if isinstance(host, (list, tuple)):
+            endpoints = EndpointPool(host, default_port=port)
+            session_options["endpoints"] = endpoints
+            # The request urls are built against the first endpoint, so they carry its scheme as well.
+            primary = urlsplit(endpoints.primary)
+            scheme, host, port = primary.scheme, primary.hostname, primary.port
+        return api_client_cls(
+            host=host,
+            port=port,
+            scheme=scheme,
+            session=RestSession(**session_options),
+            jar_index=jar_index,
+            resource_cache=resource_cache,
+        )
+
+    @staticmethod
+    def get_async(host, port=None, version=None, **session_options):
+        """
+        Constructs a new asyncio based rest client instance. It requires the optional aiohttp dependency:
+        pip install flink_rest_client[async]
+
+        Parameters
+        ----------
+        host: str
+            Hostname of Flink Jobmanager
+        port: int
+            Port number. Default value: 8081
+        version: str
+            Version of the REST API. Default value: v1
+        session_options
+            (Optional) Keyword arguments of the shared AsyncRestSession, e.g. pool_connections, pool_maxsize and
+            idle_timeout.
+        """
+        port = 8081 if port is None else port
+        version = "v1" if version is None else version
+
+        if version not in ASYNC_VERSIONS.keys():
+            raise RestException(f"Unknown REST API version: {version}")
+        api_client_cls = ASYNC_VERSIONS[version]
+        return api_client_cls(
+            host=host, port=port, session=AsyncRestSession(**session_options)
+        )
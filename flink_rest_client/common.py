@@ -1,4 +1,24 @@
+import codecs
+import collections
+import contextvars
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import quote, urljoin, urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from flink_rest_client.cache import TTLCache
+from flink_rest_client.endpoints import endpoint_template
+from flink_rest_client.instrumentation import (
+    RequestEvent,
+    _TimedHTTPAdapter,
+    _current_event,
+)
+from flink_rest_client.json_decoder import decode_json, iter_json_array
 
 
 class RestException(Exception):
@@ -10,6 +30,715 @@ class RestException(Exception):
         super().__init__(*args)
 
 
+class RestTimeoutException(RestException):
+    """
+    Exception raised when a request or a deadline of a composite call times out.
+    """
+
+
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+_MAX_LEADER_REDIRECTS = 3
+
+_current_deadline = contextvars.ContextVar("flink_rest_client_deadline", default=None)
+
+
+class Deadline:
+    """
+    End-to-end time budget of a group of requests.
+
+    Used as a context manager, every request executed inside the block gets at most the remaining time of the budget as
+    its connect and read timeout, and no further request is started once the budget is exhausted. Nested deadlines
+    never extend the enclosing one.
+    """
+
+    def __init__(self, timeout):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        timeout: float
+            Time budget in seconds. If it is None, the deadline never expires.
+        """
+        self.timeout = timeout
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+        self._token = None
+
+    def remaining(self):
+        """
+        Returns the remaining time budget.
+
+        Returns
+        -------
+        float
+            Remaining seconds (negative if the deadline has passed) or None if the deadline never expires.
+        """
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self):
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def __enter__(self):
+        outer = _current_deadline.get()
+        if outer is not None and outer.expires_at is not None:
+            if self.expires_at is None or outer.expires_at < self.expires_at:
+                self.expires_at = outer.expires_at
+        self._token = _current_deadline.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _current_deadline.reset(self._token)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+class _SingleFlight:
+    """
+    Executes concurrent calls with the same key only once and shares the result between the callers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, func):
+        """
+        Calls func, unless a call with the same key is already in flight, in which case its result is awaited.
+
+        Parameters
+        ----------
+        key: hashable
+            Identifier of the call.
+        func: callable
+            Function without parameters.
+
+        Returns
+        -------
+        tuple
+            The result of the call and the position of the caller among the callers sharing it, 0 for the one that
+            executed the call. Shared results are deep copies, so the callers cannot modify each other's result.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                position = 0
+            else:
+                flight.followers += 1
+                position = flight.followers
+
+        if position == 0:
+            try:
+                flight.result = func()
+            except Exception as exc:
+                flight.error = exc
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+            return flight.result, 0
+
+        deadline = _current_deadline.get()
+        # A deadline without a time budget does not limit the wait.
+        remaining = None if deadline is None else deadline.remaining()
+        if remaining is not None:
+            remaining = max(remaining, 0)
+        if not flight.done.wait(timeout=remaining):
+            raise RestTimeoutException(
+                f"Deadline of {deadline.timeout} seconds exceeded."
+            )
+        if flight.error is not None:
+            raise flight.error
+        return copy.deepcopy(flight.result), position
+
+
+class RestSession:
+    """
+    Pooled HTTP session shared by a client and all of its sub-clients.
+
+    The underlying connections are kept alive between calls, so consecutive requests to the same JobManager reuse
+    the already opened TCP connections instead of creating a new one for every call.
+    """
+
+    def __init__(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        idle_timeout=None,
+        metadata_ttl=None,
+        metadata_cache_size=None,
+        max_metric_query_length=None,
+        connect_timeout=None,
+        read_timeout=None,
+        retry_policy=None,
+        endpoints=None,
+        coalesce_requests=False,
+        response_cache=None,
+        instrumentation=None,
+        tracer=None,
+        json_decoder=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        pool_connections: int
+            (Optional) Number of per-host connection pools to keep. Default: 10
+        pool_maxsize: int
+            (Optional) Maximum number of connections kept open to a single host. Default: 10
+        idle_timeout: float
+            (Optional) Number of seconds after which idle connections are dropped. Default: connections are never
+            dropped because of inactivity.
+        metadata_ttl: float
+            (Optional) Number of seconds the metric name catalogs and entity id lists (job, taskmanager and subtask
+            ids) are cached for. Default: no caching.
+        metadata_cache_size: int
+            (Optional) Maximum number of cached catalogs and id lists. Default: 256
+        max_metric_query_length: int
+            (Optional) Maximum length of the url encoded 'get' query parameter of a metrics request. Longer metric
+            name lists are split into chunks that are fetched concurrently. Default: 4000
+        connect_timeout: float
+            (Optional) Number of seconds to wait for establishing a connection. Default: no timeout.
+        read_timeout: float
+            (Optional) Number of seconds to wait for the server between two received bytes. Default: no timeout.
+        retry_policy: RetryPolicy
+            (Optional) Retry policy of transient failures. Default: failed requests are not retried.
+        endpoints: EndpointPool
+            (Optional) REST endpoints of a high-availability cluster. Requests to any of them are routed to the leader
+            or the fastest healthy endpoint and fail over to the others. Default: requests go to the url they are
+            sent to.
+        coalesce_requests: bool
+            (Optional) If it is True, concurrent identical GET requests share a single HTTP call and its decoded
+            result. Default: False
+        response_cache: ResponseCache
+            (Optional) Cache of GET responses with per endpoint time-to-live rules. Default: no caching.
+        instrumentation: Instrumentation
+            (Optional) Observer of every client call, with timings and latency histograms. Default: calls are not
+            measured.
+        tracer: Tracer
+            (Optional) Collector of the spans of the client methods and their requests. Default: no tracing.
+        json_decoder: callable
+            (Optional) Function decoding the bytes of a JSON response body. Default: decode_json, which uses orjson or
+            ujson if one of them is installed.
+        """
+        self.pool_connections = 10 if pool_connections is None else pool_connections
+        self.pool_maxsize = 10 if pool_maxsize is None else pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_policy = retry_policy
+        self.endpoints = endpoints
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation
+        self.tracer = tracer
+        self.json_decoder = decode_json if json_decoder is None else json_decoder
+        self.max_metric_query_length = (
+            4000 if max_metric_query_length is None else max_metric_query_length
+        )
+        self.metadata_cache = (
+            None
+            if metadata_ttl is None
+            else TTLCache(ttl=metadata_ttl, maxsize=metadata_cache_size)
+        )
+
+        self._lock = threading.Lock()
+        self._last_used = None
+        self._counters = collections.Counter()
+        self._decode_stats = collections.Counter(decodes=0, bytes=0, seconds=0.0)
+        self._single_flight = _SingleFlight() if coalesce_requests else None
+        self._session = requests.Session()
+        adapter_cls = HTTPAdapter if instrumentation is None else _TimedHTTPAdapter
+        adapter = adapter_cls(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _drop_idle_connections(self):
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self.idle_timeout is not None
+                and self._last_used is not None
+                and now - self._last_used > self.idle_timeout
+            ):
+                for adapter in self._session.adapters.values():
+                    adapter.close()
+            self._last_used = now
+
+    def _increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] += value
+
+    @property
+    def counters(self):
+        """
+        Returns a snapshot of the client-side request counters, e.g. 'requests', 'retries', 'retries_exhausted',
+        'coalesce_hits' (calls served by another caller's request), 'coalesce_merges' (requests shared by more
+        than one caller), 'cache_hits', 'cache_misses' and 'cache_stale_hits'.
+
+        Returns
+        -------
+        dict
+            Counter name -> value pairs.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def decode_stats(self):
+        """
+        Returns the time spent with decoding JSON response bodies, so the CPU cost of parsing can be compared with the
+        time spent waiting for the cluster.
+
+        Returns
+        -------
+        dict
+            'decodes' (number of decoded bodies), 'bytes' (their total size) and 'seconds' (total decoding time).
+        """
+        with self._lock:
+            return dict(self._decode_stats)
+
+    def _coalesce(self, key, func):
+        if self._single_flight is None:
+            return func()
+        result, position = self._single_flight.do(key, func)
+        if position > 0:
+            self._increment("coalesce_hits")
+        if position == 1:
+            self._increment("coalesce_merges")
+        return result
+
+    def invalidate_cache(self, prefix=None):
+        """
+        Drops the cached responses, metric catalogs and id lists of the urls starting with prefix, e.g. after a job
+        has been stopped or rescaled.
+
+        Parameters
+        ----------
+        prefix: str
+            (Optional) Url prefix, e.g. the url of a job. Default: everything is dropped.
+        """
+        if self.response_cache is not None:
+            self.response_cache.invalidate(prefix)
+        if self.metadata_cache is not None:
+            if prefix is None:
+                self.metadata_cache.invalidate()
+            else:
+                self.metadata_cache.invalidate_prefix(prefix)
+
+    def request(self, method, url, **kwargs):
+        """
+        Executes an HTTP request over the pooled connections.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method.
+        url: str
+            Request url.
+        kwargs
+            Keyword arguments forwarded to requests.Session.request.
+
+        Returns
+        -------
+        requests.Response
+            The received response.
+        """
+        self._drop_idle_connections()
+        return self._session.request(method=method, url=url, **kwargs)
+
+    def close(self):
+        """
+        Closes every pooled connection.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _cached_metadata(session, key, loader):
+    # Metric catalogs and id lists are only cached if the session enables it.
+    if session is None or session.metadata_cache is None:
+        return loader()
+    return list(session.metadata_cache.get_or_load(key, loader))
+
+
+def _refresh_response(session, key, ttl, load, generation):
+    cache = session.response_cache
+    try:
+        cache.put(key, load(), ttl, generation=generation)
+    except Exception:
+        # The stale response is served until it expires, the next reader retries the refresh.
+        pass
+    finally:
+        cache.end_refresh(key)
+
+
+def _cached_response(session, key, ttl, load):
+    cache = session.response_cache
+    # A response loaded while the cache is invalidated, e.g. after a job was stopped, is not stored.
+    generation = cache.generation
+    entry = cache.get(key)
+    if entry is None:
+        session._increment("cache_misses")
+        value = load()
+        cache.put(key, value, ttl, generation=generation)
+    else:
+        value, fresh = entry
+        if fresh:
+            session._increment("cache_hits")
+        else:
+            session._increment("cache_stale_hits")
+            if cache.start_refresh(key):
+                # The refresh runs in an empty context, it is not bound to the deadline of the reader.
+                threading.Thread(
+                    target=contextvars.Context().run,
+                    args=(_refresh_response, session, key, ttl, load, generation),
+                    daemon=True,
+                ).start()
+    # Cached responses are shared, every caller gets its own copy.
+    return copy.deepcopy(value)
+
+
+def _decode_response(response, session=None):
+    # Every body is decoded exactly once, and the time spent with decoding is reported.
+    if session is None:
+        return decode_json(response.content)
+    body = response.content
+    started_at = time.perf_counter()
+    try:
+        return session.json_decoder(body)
+    finally:
+        elapsed = time.perf_counter() - started_at
+        with session._lock:
+            session._decode_stats["decodes"] += 1
+            session._decode_stats["bytes"] += len(body)
+            session._decode_stats["seconds"] += elapsed
+        if session.instrumentation is not None:
+            session.instrumentation.record_decode(
+                response.request.method, response.url, elapsed
+            )
+
+
+def _raise_rest_exception(response, session=None):
+    try:
+        body = _decode_response(response, session=session)
+    except ValueError:
+        body = None
+    errors = body.get("errors", []) if isinstance(body, dict) else []
+    error_str = "\n".join(errors)
+    raise RestException(f"REST response error ({response.status_code}): {error_str}")
+
+
+def _request_timeout(session):
+    connect, read = (
+        (None, None)
+        if session is None
+        else (session.connect_timeout, session.read_timeout)
+    )
+    deadline = _current_deadline.get()
+    remaining = None if deadline is None else deadline.remaining()
+    if remaining is not None:
+        if remaining <= 0:
+            raise RestTimeoutException(
+                f"Deadline of {deadline.timeout} seconds exceeded."
+            )
+        connect = remaining if connect is None else min(connect, remaining)
+        read = remaining if read is None else min(read, remaining)
+    if connect is None and read is None:
+        return None
+    return connect, read
+
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _send_once(method, url, session=None, **kwargs):
+    # Without a session every call opens (and drops) its own connection.
+    request = requests.request if session is None else session.request
+    timeout = _request_timeout(session)
+    event = _current_event.get()
+    if event is not None:
+        # Only the connection of the final attempt is reported.
+        event.dns, event.connect = None, None
+    try:
+        return request(method=method, url=url, timeout=timeout, **kwargs)
+    except requests.exceptions.Timeout as exc:
+        raise RestTimeoutException(f"REST request timed out: {method} {url}") from exc
+
+
+def _is_connect_error(exc):
+    # The request surely has not reached the server if the connection could not be established.
+    if isinstance(exc.__cause__, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _send_routed(method, url, session=None, **kwargs):
+    pool = None if session is None else session.endpoints
+    if pool is None or not pool.owns(url):
+        return _send_once(method, url, session=session, **kwargs)
+
+    parts = urlsplit(url)
+    path = url[len(f"{parts.scheme}://{parts.netloc}") :]
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+    candidates = pool.candidates()
+    response, error, redirects = None, None, 0
+    while candidates:
+        endpoint = candidates.pop(0)
+        if response is not None:
+            response.close()
+        response, error = None, None
+        started_at = time.monotonic()
+        try:
+            response = _send_once(
+                method,
+                f"{endpoint.base_url}{path}",
+                session=session,
+                allow_redirects=False,
+                **kwargs,
+            )
+        except (RestTimeoutException, requests.exceptions.ConnectionError) as exc:
+            pool.mark_failure(endpoint)
+            # A non-idempotent request may have been executed, unless the connection was never established.
+            if not (idempotent or _is_connect_error(exc)):
+                raise
+            error = exc
+            if candidates:
+                session._increment("failovers")
+            continue
+
+        if response.is_redirect and redirects < _MAX_LEADER_REDIRECTS:
+            # A standby JobManager points to the leader, which serves the following requests directly.
+            leader = pool.find(urljoin(response.url, response.headers["Location"]))
+            pool.mark_leader(leader)
+            candidates = [leader] + [c for c in candidates if c is not leader]
+            redirects += 1
+            session._increment("leader_redirects")
+            continue
+        if response.status_code == 503:
+            # No leader behind this endpoint (e.g. an ongoing leader election).
+            pool.mark_failure(endpoint)
+            if candidates:
+                session._increment("failovers")
+                continue
+            return response
+
+        pool.mark_success(endpoint, time.monotonic() - started_at)
+        return response
+
+    raise error
+
+
+def _send(method, url, session=None, **kwargs):
+    if session is None:
+        return _send_with_retries(method, url, **kwargs)
+    session._increment("requests")
+    if session.tracer is None:
+        return _send_measured(method, url, session=session, **kwargs)
+    with session.tracer.span(
+        f"{method} {endpoint_template(url)}",
+        kind="client",
+        attributes={"http.method": method, "http.url": url},
+    ) as span:
+        response = _send_measured(method, url, session=session, **kwargs)
+        span.set_attribute("http.status_code", response.status_code)
+        return response
+
+
+def _send_measured(method, url, session=None, **kwargs):
+    instrumentation = session.instrumentation
+    if instrumentation is None:
+        return _send_with_retries(method, url, session=session, **kwargs)
+
+    event = RequestEvent(method, url)
+    token = _current_event.set(event)
+    started_at = time.perf_counter()
+    response = None
+    try:
+        response = _send_with_retries(method, url, session=session, **kwargs)
+        return response
+    except Exception as exc:
+        event.error = exc
+        raise
+    finally:
+        _current_event.reset(token)
+        event.total = time.perf_counter() - started_at
+        if response is not None:
+            event.status_code = response.status_code
+            elapsed = response.elapsed.total_seconds()
+            event.ttfb = max(elapsed - (event.dns or 0) - (event.connect or 0), 0)
+            if not kwargs.get("stream"):
+                event.bytes_received = len(response.content)
+        instrumentation.record(event)
+
+
+def _send_with_retries(method, url, session=None, **kwargs):
+    policy = None if session is None else session.retry_policy
+    if policy is None:
+        return _send_routed(method, url, session=session, **kwargs)
+
+    attempt = 1
+    while True:
+        response, error = None, None
+        try:
+            response = _send_routed(method, url, session=session, **kwargs)
+        except (RestTimeoutException, requests.exceptions.ConnectionError) as exc:
+            error = exc
+        if response is not None and not policy.is_retryable_status(
+            response.status_code
+        ):
+            return response
+
+        retryable = policy.can_retry(method, attempt)
+        if retryable:
+            delay = policy.backoff(
+                attempt, None if response is None else _retry_after(response)
+            )
+            deadline = _current_deadline.get()
+            remaining = None if deadline is None else deadline.remaining()
+            retryable = remaining is None or remaining > delay
+        if not retryable:
+            if attempt > 1:
+                session._increment("retries_exhausted")
+            if error is not None:
+                raise error
+            return response
+
+        if response is not None:
+            response.close()
+        session._increment("retries")
+        event = _current_event.get()
+        if event is not None:
+            event.retries += 1
+        time.sleep(delay)
+        attempt += 1
+
+
+def _open_stream(url, session=None):
+    response = _send("GET", url, session=session, stream=True)
+    if response.status_code != 200:
+        try:
+            _raise_rest_exception(response, session=session)
+        finally:
+            response.close()
+    return response
+
+
+def _stream_rest_request(url, chunk_size=None, session=None):
+    """
+    Streams a text response as chunks of complete lines.
+
+    Parameters
+    ----------
+    url: str
+        Request url.
+    chunk_size: int
+        (Optional) Number of bytes read from the connection at once. Default: 65536
+    session: RestSession
+        (Optional) Shared HTTP session.
+
+    Returns
+    -------
+    generator
+        Decoded text chunks. Every chunk ends with a line break, except the last one and lines longer than
+        chunk_size.
+    """
+    chunk_size = 65536 if chunk_size is None else chunk_size
+    response = _open_stream(url, session=session)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    with response:
+        for raw in response.iter_content(chunk_size=chunk_size):
+            pending += decoder.decode(raw)
+            line_end = pending.rfind("\n") + 1
+            if line_end > 0:
+                yield pending[:line_end]
+                pending = pending[line_end:]
+            elif len(pending) >= chunk_size:
+                yield pending
+                pending = ""
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+
+def _stream_json_array(url, key=None, chunk_size=None, session=None):
+    """
+    Streams the items of an array of a JSON response, parsing the body incrementally.
+
+    Parameters
+    ----------
+    url: str
+        Request url.
+    key: str
+        (Optional) Key of the array in the top-level object of the response. Default: the response is an array.
+    chunk_size: int
+        (Optional) Number of bytes read from the connection at once. Default: 65536
+    session: RestSession
+        (Optional) Shared HTTP session.
+
+    Returns
+    -------
+    generator
+        The decoded items of the array.
+    """
+    chunk_size = 65536 if chunk_size is None else chunk_size
+    with _open_stream(url, session=session) as response:
+        yield from iter_json_array(response.iter_content(chunk_size=chunk_size), key)
+
+
+def _download_rest_request(url, path, buffer_size=None, session=None):
+    """
+    Writes a response body to a file without holding it in memory.
+
+    Parameters
+    ----------
+    url: str
+        Request url.
+    path: str
+        Path of the target file.
+    buffer_size: int
+        (Optional) Number of bytes buffered at once. Default: 65536
+    session: RestSession
+        (Optional) Shared HTTP session.
+
+    Returns
+    -------
+    int
+        Number of written bytes.
+    """
+    buffer_size = 65536 if buffer_size is None else buffer_size
+    written = 0
+    with _open_stream(url, session=session) as response, open(path, "wb") as target:
+        for raw in response.iter_content(chunk_size=buffer_size):
+            target.write(raw)
+            written += len(raw)
+    return written
+
+
 def _execute_rest_request(
     url,
     http_method=None,
@@ -18,6 +747,8 @@ def _execute_rest_request(
     params=None,
     data=None,
     json=None,
+    headers=None,
+    session=None,
 ):
     if http_method is None:
         http_method = "GET"
@@ -30,16 +761,145 @@ def _execute_rest_request(
     if accepted_status_code is None:
         accepted_status_code = 200
 
-    response = requests.request(
-        method=http_method, url=url, files=files, params=params, data=data, json=json
+    def execute():
+        response = _send(
+            http_method,
+            url,
+            session=session,
+            files=files,
+            params=params,
+            data=data,
+            json=json,
+            headers=headers,
+        )
+        if response.status_code != accepted_status_code:
+            _raise_rest_exception(response, session=session)
+        return _decode_response(response, session=session)
+
+    # Only reads without a body are coalesced and cached, they have no side effects.
+    if session is None or http_method != "GET" or files or data or json:
+        return execute()
+    key = (
+        f"{url}?{sorted(params.items())!r}"
+        f"|{sorted((headers or {}).items())!r}|{accepted_status_code}"
     )
-    if response.status_code == accepted_status_code:
-        return response.json()
-    else:
-        if "errors" in response.json().keys():
-            error_str = "\n".join(response.json()["errors"])
-        else:
-            error_str = ""
-        raise RestException(
-            f"REST response error ({response.status_code}): {error_str}"
+    ttl = (
+        None if session.response_cache is None else session.response_cache.ttl_for(url)
+    )
+    if ttl is None:
+        return session._coalesce(key, execute)
+    return _cached_response(session, key, ttl, lambda: session._coalesce(key, execute))
+
+
+def _fan_out(func, items, max_workers=None, timeout=None):
+    """
+    Calls func with every item on a bounded thread pool.
+
+    Parameters
+    ----------
+    func: callable
+        Function executed with a single item.
+    items: iterable
+        Hashable items, each of them is passed to func.
+    max_workers: int
+        (Optional) Maximum number of concurrent calls. Default: 8
+    timeout: float
+        (Optional) Number of seconds after which the unfinished calls are abandoned. Default: no deadline.
+
+    Returns
+    -------
+    tuple
+        Pair of dicts: item -> result of the successful calls and item -> exception of the failed ones.
+    """
+    items = list(items)
+    results, errors = {}, {}
+    if len(items) == 0:
+        return results, errors
+
+    deadline = _current_deadline.get()
+    remaining = None if deadline is None else deadline.remaining()
+    if remaining is not None and (timeout is None or remaining < timeout):
+        timeout = max(remaining, 0)
+
+    max_workers = 8 if max_workers is None else max_workers
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    try:
+        # Every task runs in a copy of the caller's context, so the active deadline applies to it as well.
+        futures = {
+            executor.submit(contextvars.copy_context().run, func, item): item
+            for item in items
+        }
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:
+                errors[futures[future]] = exc
+        for future in not_done:
+            future.cancel()
+            errors[futures[future]] = RestTimeoutException(
+                f"Deadline of {timeout} seconds exceeded."
+            )
+    finally:
+        # Do not wait for the abandoned calls, the deadline is already over.
+        executor.shutdown(wait=False)
+    return results, errors
+
+
+def _chunk_metric_names(metric_names, max_length):
+    chunks, chunk, chunk_length = [], [], 0
+    for metric_name in metric_names:
+        # Every name is followed by an url encoded comma (%2C).
+        name_length = len(quote(metric_name, safe="")) + 3
+        if chunk and chunk_length + name_length > max_length:
+            chunks.append(chunk)
+            chunk, chunk_length = [], 0
+        chunk.append(metric_name)
+        chunk_length += name_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _query_metrics(url, metric_names, params=None, session=None):
+    """
+    Queries the selected metrics of a metrics endpoint.
+
+    The metric names are sent in the 'get' query parameter. If it would exceed the max_metric_query_length of the
+    session, the names are split into chunks that are fetched concurrently over the shared session, and the partial
+    results are merged.
+
+    Parameters
+    ----------
+    url: str
+        Url of the metrics endpoint.
+    metric_names: list
+        List of metric names.
+    params: dict
+        (Optional) Additional query parameters, e.g. the aggregation modes.
+    session: RestSession
+        (Optional) Shared HTTP session.
+
+    Returns
+    -------
+    list
+        The metric elements of every chunk, in the order of the chunks.
+    """
+    params = {} if params is None else params
+    max_length = 4000 if session is None else session.max_metric_query_length
+    chunks = _chunk_metric_names(metric_names, max_length)
+    if len(chunks) <= 1:
+        return _execute_rest_request(
+            url=url, params={"get": ",".join(metric_names), **params}, session=session
+        )
+
+    def query_chunk(index):
+        return _execute_rest_request(
+            url=url, params={"get": ",".join(chunks[index]), **params}, session=session
         )
+
+    max_workers = None if session is None else session.pool_maxsize
+    results, errors = _fan_out(query_chunk, range(len(chunks)), max_workers=max_workers)
+    if errors:
+        raise errors[min(errors.keys())]
+    return [elem for index in range(len(chunks)) for elem in results[index]]
@@ -0,0 +1,107 @@
+import functools
+import re
+from urllib.parse import urlsplit
+
+# Endpoints of the REST API in the notation of the Flink documentation, relative to the API version.
+ENDPOINT_TEMPLATES = [
+    "/cluster",
+    "/config",
+    "/datasets",
+    "/datasets/:datasetid",
+    "/datasets/delete/:triggerid",
+    "/jars",
+    "/jars/upload",
+    "/jars/:jarid",
+    "/jars/:jarid/plan",
+    "/jars/:jarid/run",
+    "/jobmanager/config",
+    "/jobmanager/logs",
+    "/jobmanager/logs/:log_file",
+    "/jobmanager/metrics",
+    "/jobs",
+    "/jobs/metrics",
+    "/jobs/overview",
+    "/jobs/:jobid",
+    "/jobs/:jobid/accumulators",
+    "/jobs/:jobid/checkpoints",
+    "/jobs/:jobid/checkpoints/config",
+    "/jobs/:jobid/checkpoints/details/:checkpointid",
+    "/jobs/:jobid/checkpoints/details/:checkpointid/subtasks/:vertexid",
+    "/jobs/:jobid/config",
+    "/jobs/:jobid/exceptions",
+    "/jobs/:jobid/execution-result",
+    "/jobs/:jobid/metrics",
+    "/jobs/:jobid/plan",
+    "/jobs/:jobid/rescaling",
+    "/jobs/:jobid/rescaling/:triggerid",
+    "/jobs/:jobid/savepoints",
+    "/jobs/:jobid/savepoints/:triggerid",
+    "/jobs/:jobid/stop",
+    "/jobs/:jobid/vertices/:vertexid",
+    "/jobs/:jobid/vertices/:vertexid/accumulators",
+    "/jobs/:jobid/vertices/:vertexid/backpressure",
+    "/jobs/:jobid/vertices/:vertexid/metrics",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/accumulators",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/metrics",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt/accumulators",
+    "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/metrics",
+    "/jobs/:jobid/vertices/:vertexid/subtasktimes",
+    "/jobs/:jobid/vertices/:vertexid/taskmanagers",
+    "/jobs/:jobid/vertices/:vertexid/watermarks",
+    "/overview",
+    "/taskmanagers",
+    "/taskmanagers/metrics",
+    "/taskmanagers/:taskmanagerid",
+    "/taskmanagers/:taskmanagerid/logs",
+    "/taskmanagers/:taskmanagerid/logs/:log_file",
+    "/taskmanagers/:taskmanagerid/metrics",
+    "/taskmanagers/:taskmanagerid/thread-dump",
+]
+
+
+def _compile_template(template):
+    segments = template.strip("/").split("/")
+    pattern = "/".join(
+        "[^/]+" if segment.startswith(":") else re.escape(segment)
+        for segment in segments
+    )
+    # The templates are relative to the API version, e.g. /jobs/:jobid matches /v1/jobs/<job id>.
+    return re.compile(rf"^(?:/v\d+)?/{pattern}/?$")
+
+
+def _by_specificity(templates):
+    # Literal segments take precedence over path parameters, e.g. /jobs/overview over /jobs/:jobid.
+    return sorted(templates, key=lambda template: template.count(":"))
+
+
+_COMPILED_TEMPLATES = [
+    (template, _compile_template(template))
+    for template in _by_specificity(ENDPOINT_TEMPLATES)
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _endpoint_path_template(path):
+    for template, pattern in _COMPILED_TEMPLATES:
+        if pattern.match(path):
+            return template
+    return path
+
+
+def endpoint_template(url):
+    """
+    Returns the endpoint template of a request url, e.g. '/jobs/:jobid/plan' for 'http://host:8081/v1/jobs/<id>/plan'.
+
+    Parameters
+    ----------
+    url: str
+        Request url.
+
+    Returns
+    -------
+    str
+        The endpoint template, or the path of the url if it is not a known endpoint.
+    """
+    return _endpoint_path_template(urlsplit(url).path)
@@ -0,0 +1,217 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def _endpoint_base(address, default_port=None, default_scheme=None):
+    default_port = 8081 if default_port is None else default_port
+    default_scheme = "http" if default_scheme is None else default_scheme
+    if "://" not in address:
+        address = f"{default_scheme}://{address}"
+    parts = urlsplit(address)
+    port = default_port if parts.port is None else parts.port
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class Endpoint:
+    """
+    Health and latency statistics of a single JobManager REST endpoint.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.healthy = True
+        self.latency = None
+        self.failures = 0
+        self.retry_at = None
+
+    def as_dict(self):
+        return {
+            "base_url": self.base_url,
+            "healthy": self.healthy,
+            "latency": self.latency,
+            "failures": self.failures,
+        }
+
+
+class EndpointPool:
+    """
+    List of the REST endpoints of a high-availability Flink cluster.
+
+    Requests are routed to the current leader if it is known, otherwise to the healthy endpoint with the lowest
+    exponentially weighted moving average latency. An endpoint that fails is put aside for a cooldown period and the
+    request is transparently sent to the next endpoint. If an endpoint redirects to the leader, the leader is
+    remembered, so the following requests go to it directly.
+    """
+
+    def __init__(
+        self, endpoints, default_port=None, cooldown=None, latency_weight=None
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        endpoints: list
+            Addresses of the JobManagers, e.g. 'jm-0', 'jm-1:8082' or 'https://jm-2:8081'.
+        default_port: int
+            (Optional) Port of the addresses without an explicit port. Default: 8081
+        cooldown: float
+            (Optional) Number of seconds a failed endpoint is only used as a last resort. Default: 5
+        latency_weight: float
+            (Optional) Weight of the latest sample in the moving average latency, between 0 and 1. Default: 0.3
+        """
+        self.default_port = 8081 if default_port is None else default_port
+        self.cooldown = 5.0 if cooldown is None else cooldown
+        self.latency_weight = 0.3 if latency_weight is None else latency_weight
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self._leader = None
+        for address in endpoints:
+            self._add(_endpoint_base(address, default_port=self.default_port))
+        if not self._endpoints:
+            raise ValueError("At least one endpoint is required.")
+
+    def _add(self, base_url):
+        endpoint = self._endpoints.get(base_url)
+        if endpoint is None:
+            endpoint = Endpoint(base_url)
+            self._endpoints[base_url] = endpoint
+        return endpoint
+
+    @property
+    def primary(self):
+        """
+        Returns the base url of the first configured endpoint, which is used to build the request urls.
+
+        Returns
+        -------
+        str
+            Base url, e.g. 'http://jm-0:8081'.
+        """
+        return next(iter(self._endpoints))
+
+    @property
+    def leader(self):
+        """
+        Returns the base url of the leader learned from a redirect, or None if it is not known.
+        """
+        return self._leader
+
+    def owns(self, url):
+        """
+        Returns whether the url points to one of the endpoints.
+
+        Parameters
+        ----------
+        url: str
+            Request url.
+
+        Returns
+        -------
+        bool
+            True if the request can be routed by the pool.
+        """
+        if urlsplit(url).hostname is None:
+            return False
+        return _endpoint_base(url, default_port=self.default_port) in self._endpoints
+
+    def candidates(self):
+        """
+        Returns every endpoint in the order they should be tried: the leader first, then the healthy endpoints by
+        increasing latency, then the failed ones by the end of their cooldown.
+
+        Returns
+        -------
+        list
+            List of Endpoint objects.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available, failed = [], []
+            for endpoint in self._endpoints.values():
+                if endpoint.healthy or endpoint.retry_at <= now:
+                    available.append(endpoint)
+                else:
+                    failed.append(endpoint)
+            # Endpoints without latency samples sort first, so each of them is measured once.
+            available.sort(key=lambda e: (e.base_url != self._leader, e.latency or 0.0))
+            failed.sort(key=lambda e: e.retry_at)
+            return available + failed
+
+    def find(self, location):
+        """
+        Returns the endpoint of a redirect location, and registers it if it was not configured.
+
+        Parameters
+        ----------
+        location: str
+            Absolute url of the redirect target.
+
+        Returns
+        -------
+        Endpoint
+            Endpoint of the redirect target.
+        """
+        with self._lock:
+            return self._add(_endpoint_base(location, default_port=self.default_port))
+
+    def mark_success(self, endpoint, latency):
+        """
+        Records a successful request.
+
+        Parameters
+        ----------
+        endpoint: Endpoint
+            The endpoint that answered.
+        latency: float
+            Seconds until the response headers arrived.
+        """
+        with self._lock:
+            endpoint.healthy = True
+            endpoint.failures = 0
+            endpoint.retry_at = None
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += self.latency_weight * (latency - endpoint.latency)
+
+    def mark_failure(self, endpoint):
+        """
+        Records a failed request and puts the endpoint aside for the cooldown period.
+
+        Parameters
+        ----------
+        endpoint: Endpoint
+            The endpoint that failed.
+        """
+        with self._lock:
+            endpoint.healthy = False
+            endpoint.failures += 1
+            endpoint.retry_at = time.monotonic() + self.cooldown
+            if self._leader == endpoint.base_url:
+                self._leader = None
+
+    def mark_leader(self, endpoint):
+        """
+        Records the leader, so the following requests are sent to it first.
+
+        Parameters
+        ----------
+        endpoint: Endpoint
+            The endpoint of the leading JobManager.
+        """
+        with self._lock:
+            self._leader = endpoint.base_url
+
+    def status(self):
+        """
+        Returns the health and latency statistics of every endpoint.
+
+        Returns
+        -------
+        list
+            List of dicts with the base_url, healthy, latency and failures keys.
+        """
+        with self._lock:
+            return [endpoint.as_dict() for endpoint in self._endpoints.values()]
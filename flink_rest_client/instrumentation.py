@@ -0,0 +1,348 @@
+import bisect
+import contextvars
+import math
+import socket
+import sys
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import allowed_gai_family
+
+from flink_rest_client.endpoints import endpoint_template
+
+_current_event = contextvars.ContextVar("flink_rest_client_request_event", default=None)
+
+
+class RequestEvent:
+    """
+    Measurements of a single client call, including all of its retries.
+
+    Attributes
+    ----------
+    method: str
+        HTTP method.
+    url: str
+        Request url.
+    endpoint: str
+        Endpoint template, e.g. '/jobs/:jobid/vertices/:vertexid/metrics'.
+    status_code: int
+        Status code of the final response, or None if no response arrived.
+    bytes_received: int
+        Size of the response body, or None if the body is streamed.
+    dns: float
+        Seconds spent with name resolution, or None if a pooled connection was reused.
+    connect: float
+        Seconds spent with establishing the connection (including TLS), or None if a pooled connection was reused.
+    ttfb: float
+        Seconds between sending the request and receiving the response headers in the final attempt.
+    total: float
+        Seconds of the whole call, including the retries and the backoff between them.
+    retries: int
+        Number of retried attempts.
+    error: Exception
+        The raised exception, or None if the call returned a response.
+    """
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+        self.status_code = None
+        self.bytes_received = None
+        self.dns = None
+        self.connect = None
+        self.ttfb = None
+        self.total = None
+        self.retries = 0
+        self.error = None
+
+    @property
+    def endpoint(self):
+        return endpoint_template(self.url)
+
+    def as_dict(self):
+        return {
+            "method": self.method,
+            "url": self.url,
+            "endpoint": self.endpoint,
+            "status_code": self.status_code,
+            "bytes_received": self.bytes_received,
+            "dns": self.dns,
+            "connect": self.connect,
+            "ttfb": self.ttfb,
+            "total": self.total,
+            "retries": self.retries,
+            "error": None if self.error is None else repr(self.error),
+        }
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with logarithmic buckets.
+
+    Every bucket is about 19% (2 ** 0.25) wider than the previous one, so recording a value is a constant time operation
+    and the percentiles are accurate within the width of a bucket, from 10 microseconds to about 20 minutes.
+    """
+
+    _BUCKET_BOUNDS = [1e-5 * 2 ** (index / 4) for index in range(108)]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(self._BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """
+        Records a latency.
+
+        Parameters
+        ----------
+        seconds: float
+            Measured latency in seconds.
+        """
+        index = bisect.bisect_left(self._BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._buckets[index] += 1
+            self.count += 1
+            self.sum += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """
+        Returns an upper estimate of a percentile.
+
+        Parameters
+        ----------
+        percent: float
+            Percentile between 0 and 100.
+
+        Returns
+        -------
+        float
+            Upper bound of the bucket containing the percentile, or None if nothing has been recorded.
+        """
+        with self._lock:
+            if self.count == 0:
+                return None
+            rank = max(1, math.ceil(self.count * percent / 100))
+            seen = 0
+            for index, bucket in enumerate(self._buckets):
+                seen += bucket
+                if seen >= rank:
+                    if index == len(self._BUCKET_BOUNDS):
+                        return self.max
+                    return min(self._BUCKET_BOUNDS[index], self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max if self.count else None,
+        }
+
+
+class Instrumentation:
+    """
+    Observer of the requests executed by a RestSession.
+
+    Every client call produces a RequestEvent, which is passed to the registered hooks, and its total latency is
+    recorded in a histogram per method and endpoint template. The time spent with decoding the JSON response bodies
+    is recorded in separate histograms.
+    """
+
+    def __init__(self, hooks=None, histograms=True):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        hooks: list
+            (Optional) Functions called with the RequestEvent of every call. They run on the calling thread, so they
+            should return quickly and must not raise. Default: no hooks.
+        histograms: bool
+            (Optional) If it is True, latency histograms are kept per method and endpoint template. Default: True
+        """
+        self.hooks = [] if hooks is None else list(hooks)
+        self.histograms_enabled = histograms
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._decode_histograms = {}
+
+    def add_hook(self, hook):
+        """
+        Registers a hook.
+
+        Parameters
+        ----------
+        hook: callable
+            Function called with the RequestEvent of every call.
+        """
+        self.hooks.append(hook)
+
+    def record(self, event):
+        """
+        Records a finished call: updates its histogram and passes it to the hooks.
+
+        Parameters
+        ----------
+        event: RequestEvent
+            Measurements of the call.
+        """
+        if self.histograms_enabled:
+            self._record(
+                self._histograms, f"{event.method} {event.endpoint}", event.total
+            )
+        for hook in self.hooks:
+            hook(event)
+
+    def record_decode(self, method, url, seconds):
+        """
+        Records the time spent with decoding a JSON response body.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        url: str
+            Request url.
+        seconds: float
+            Decoding time in seconds.
+        """
+        if self.histograms_enabled:
+            self._record(
+                self._decode_histograms,
+                f"{method} {endpoint_template(url)}",
+                seconds,
+            )
+
+    def _record(self, histograms, key, seconds):
+        histogram = histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.setdefault(key, LatencyHistogram())
+        histogram.record(seconds)
+
+    def _snapshot(self, histograms):
+        with self._lock:
+            histograms = dict(histograms)
+        return {
+            key: histogram.as_dict() for key, histogram in sorted(histograms.items())
+        }
+
+    def histograms(self):
+        """
+        Returns a snapshot of the latency histograms.
+
+        Returns
+        -------
+        dict
+            '<method> <endpoint template>' -> dict of count, mean, p50, p90, p99 and max latency in seconds.
+        """
+        return self._snapshot(self._histograms)
+
+    def decode_histograms(self):
+        """
+        Returns a snapshot of the JSON decoding time histograms.
+
+        Returns
+        -------
+        dict
+            '<method> <endpoint template>' -> dict of count, mean, p50, p90, p99 and max decoding time in seconds.
+        """
+        return self._snapshot(self._decode_histograms)
+
+    def dump(self, file=None):
+        """
+        Writes the latency histograms as a table, the slowest endpoint by total time first. The last column is the
+        mean time spent with decoding the JSON response bodies.
+
+        Parameters
+        ----------
+        file: file object
+            (Optional) Target of the table. Default: sys.stdout
+        """
+        file = sys.stdout if file is None else file
+        decoding = self.decode_histograms()
+        rows = sorted(
+            self.histograms().items(),
+            key=lambda item: item[1]["count"] * item[1]["mean"],
+            reverse=True,
+        )
+        file.write(
+            f"{'endpoint':<72} {'count':>8} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+            f"{'decode ms':>9}\n"
+        )
+        for key, stats in rows:
+            decode = decoding.get(key)
+            decode_ms = "-" if decode is None else f"{decode['mean'] * 1000:.2f}"
+            file.write(
+                f"{key:<72} {stats['count']:>8} {stats['mean'] * 1000:>9.2f} {stats['p50'] * 1000:>9.2f} "
+                f"{stats['p99'] * 1000:>9.2f} {stats['max'] * 1000:>9.2f} {decode_ms:>9}\n"
+            )
+
+    def reset(self):
+        """
+        Drops every recorded latency.
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._decode_histograms.clear()
+
+
+class _TimedConnectionMixin:
+    # Records the name resolution and connection times of new connections in the event of the current call.
+
+    def _new_conn(self):
+        event = _current_event.get()
+        if event is not None:
+            # The resolution is only observed: it is timed with a lookup of its own, and urllib3 still resolves the
+            # name and tries every address itself. Its lookup is usually answered by the resolver cache.
+            started_at = time.perf_counter()
+            try:
+                socket.getaddrinfo(
+                    self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+                )
+            except OSError:
+                pass
+            event.dns = time.perf_counter() - started_at
+        return super()._new_conn()
+
+    def connect(self):
+        event = _current_event.get()
+        started_at = time.perf_counter()
+        super().connect()
+        if event is not None:
+            event.connect = time.perf_counter() - started_at - (event.dns or 0)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
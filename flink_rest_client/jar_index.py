@@ -0,0 +1,143 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+def _file_digest(path, chunk_size=1048576):
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JarIndex:
+    """
+    Persistent index of the already uploaded jars: cluster -> content hash -> upload result.
+
+    The index is stored as a JSON file, so it survives between process runs. JarsClient uses it to skip uploading a
+    jar whose identical content is still available on the cluster. Several processes may share the index: every
+    change re-reads the file under an exclusive file lock and merges into it, so no process overwrites the entries of
+    another one. The file lock requires a POSIX system, elsewhere only the threads of a process are synchronized.
+    """
+
+    def __init__(self, path=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        path: str
+            (Optional) Path of the index file. Default: ~/.cache/flink_rest_client/jar_index.json
+        """
+        self.path = (
+            os.path.join(
+                os.path.expanduser("~"), ".cache", "flink_rest_client", "jar_index.json"
+            )
+            if path is None
+            else path
+        )
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as source:
+                return json.load(source)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _update(self, change):
+        # Applies change to the latest content of the file, and writes the file if change returns True.
+        with self._lock, self._file_lock():
+            self._entries = self._load()
+            if change(self._entries):
+                self._save()
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, so a crash never leaves a truncated index behind.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as target:
+                json.dump(self._entries, target)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def lookup(self, cluster, digest):
+        """
+        Returns the upload result of a jar.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jars endpoint.
+        digest: str
+            SHA-256 hex digest of the jar content.
+
+        Returns
+        -------
+        dict
+            The stored upload result or None if the jar has not been uploaded yet.
+        """
+        with self._lock:
+            return self._entries.get(cluster, {}).get(digest)
+
+    def store(self, cluster, digest, result):
+        """
+        Stores the upload result of a jar and persists the index.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jars endpoint.
+        digest: str
+            SHA-256 hex digest of the jar content.
+        result: dict
+            Result of the jar upload.
+        """
+
+        def change(entries):
+            entries.setdefault(cluster, {})[digest] = result
+            return True
+
+        self._update(change)
+
+    def discard(self, cluster, digest):
+        """
+        Removes a jar from the index and persists the index.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jars endpoint.
+        digest: str
+            SHA-256 hex digest of the jar content.
+        """
+        self._update(
+            lambda entries: entries.get(cluster, {}).pop(digest, None) is not None
+        )
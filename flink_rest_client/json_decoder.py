@@ -0,0 +1,157 @@
+import codecs
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+def _fastest_loads():
+    # Every candidate accepts the raw bytes of a body, so the body is not decoded to str first.
+    if orjson is not None:
+        return "orjson", orjson.loads
+    if ujson is not None:
+        return "ujson", ujson.loads
+    return "json", None
+
+
+DECODER_NAME, _fast_loads = _fastest_loads()
+
+
+def decode_json(body):
+    """
+    Decodes a JSON document with the fastest available decoder: orjson, ujson or the json module of the standard
+    library, in this order. The faster decoders are optional dependencies: pip install flink_rest_client[fast-json]
+
+    Parameters
+    ----------
+    body: bytes
+        Encoded JSON document.
+
+    Returns
+    -------
+    object
+        The decoded document.
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(body)
+        except ValueError:
+            # Only a document with NaN or Infinity, which the standard library accepts, is decoded again. Any other
+            # error is raised right away, so an invalid body is parsed only once.
+            if not _has_non_standard_constants(body):
+                raise
+    return json.loads(body)
+
+
+def _has_non_standard_constants(body):
+    tokens = ("NaN", "Infinity") if isinstance(body, str) else (b"NaN", b"Infinity")
+    return any(token in body for token in tokens)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_RAW_DECODER = json.JSONDecoder()
+
+
+class _IncrementalReader:
+    # Buffer over the decoded text of a chunked JSON document, it only holds the not yet consumed part.
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        self.buffer += self._text_decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, characters):
+        character = self.peek()
+        if not character or character not in characters:
+            found = repr(character) if character else "the end of the document"
+            raise ValueError(
+                f"Expected one of {characters!r} in the JSON document, got {found}."
+            )
+        self.pos += 1
+        return character
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _RAW_DECODER.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk.
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Parses a JSON document incrementally and yields the items of one of its arrays, so only a single item is held in
+    memory at once.
+
+    Parameters
+    ----------
+    chunks: iterable
+        Consecutive bytes chunks of the UTF-8 encoded document, e.g. response.iter_content().
+    key: str
+        (Optional) Key of the array in the top-level object, e.g. 'jobs'. The values preceding it are decoded and
+        dropped. Default: the document itself is an array.
+
+    Returns
+    -------
+    generator
+        The decoded items of the array.
+    """
+    reader = _IncrementalReader(chunks)
+    if key is not None:
+        reader.expect("{")
+        if reader.peek() == "}":
+            raise KeyError(key)
+        while True:
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()
+            if reader.expect(",}") == "}":
+                raise KeyError(key)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
@@ -0,0 +1,93 @@
+import os
+import time
+import uuid
+
+
+class MultipartFileEncoder:
+    """
+    Streaming multipart/form-data encoder of a single file field.
+
+    The body is produced lazily in fixed-size chunks, so uploading a file never holds more than one chunk of it in
+    memory. Every iteration opens the file again and closes it as soon as the iteration finishes or is abandoned, so
+    the encoder can be re-sent (e.g. when a request is retried) without leaking file handles.
+    """
+
+    def __init__(
+        self,
+        field_name,
+        path,
+        content_type=None,
+        chunk_size=None,
+        progress_callback=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        field_name: str
+            Name of the form field.
+        path: str
+            Path of the file to be uploaded.
+        content_type: str
+            (Optional) Content type of the file. Default: application/octet-stream
+        chunk_size: int
+            (Optional) Number of bytes read from the file at once. Default: 1048576
+        progress_callback: callable
+            (Optional) Function called after every sent chunk with three arguments: the number of bytes sent so far,
+            the total number of bytes and the average throughput in bytes per second.
+        """
+        self.path = path
+        self.chunk_size = 1048576 if chunk_size is None else chunk_size
+        self.progress_callback = progress_callback
+
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        content_type = (
+            "application/octet-stream" if content_type is None else content_type
+        )
+        filename = os.path.basename(path)
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._file_size = os.path.getsize(path)
+
+    def __len__(self):
+        return len(self._head) + self._file_size + len(self._tail)
+
+    @property
+    def headers(self):
+        """
+        Returns the HTTP headers describing the encoded body.
+
+        Returns
+        -------
+        dict
+            Content-Type and Content-Length headers.
+        """
+        return {"Content-Type": self.content_type, "Content-Length": str(len(self))}
+
+    def _report(self, sent, started_at):
+        if self.progress_callback is not None:
+            elapsed = time.monotonic() - started_at
+            throughput = sent / elapsed if elapsed > 0 else 0.0
+            self.progress_callback(sent, len(self), throughput)
+
+    def __iter__(self):
+        started_at = time.monotonic()
+        sent = len(self._head)
+        yield self._head
+        with open(self.path, "rb") as source:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                sent += len(chunk)
+                yield chunk
+                self._report(sent, started_at)
+        sent += len(self._tail)
+        yield self._tail
+        self._report(sent, started_at)
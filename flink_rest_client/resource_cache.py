@@ -0,0 +1,142 @@
+import json
+import os
+import sqlite3
+import threading
+import zlib
+
+
+class ResourceCache:
+    """
+    Persistent cache of immutable Flink resources: cluster -> job id -> resource -> response.
+
+    Some responses never change once they exist, e.g. the details of a completed checkpoint or the execution result
+    of a finished job. The cache keeps them in a SQLite database as compressed JSON, so short-lived processes do not
+    have to fetch them again from the JobManager.
+    """
+
+    def __init__(self, path=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        path: str
+            (Optional) Path of the database file. Default: ~/.cache/flink_rest_client/resources.sqlite3
+        """
+        self.path = (
+            os.path.join(
+                os.path.expanduser("~"),
+                ".cache",
+                "flink_rest_client",
+                "resources.sqlite3",
+            )
+            if path is None
+            else path
+        )
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            # WAL lets concurrently running processes read while another one writes.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS resources ("
+                "cluster TEXT NOT NULL, job_id TEXT NOT NULL, resource TEXT NOT NULL, value BLOB NOT NULL, "
+                "PRIMARY KEY (cluster, job_id, resource)) WITHOUT ROWID"
+            )
+            self._connection = connection
+        return self._connection
+
+    def __len__(self):
+        with self._lock:
+            return (
+                self._connect().execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+            )
+
+    def get(self, cluster, job_id, resource):
+        """
+        Returns a cached resource.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jobs endpoint.
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        resource: str
+            Name of the resource, e.g. 'plan' or 'checkpoints/details/42'.
+
+        Returns
+        -------
+        object
+            The cached response or None if the resource is not cached.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM resources WHERE cluster = ? AND job_id = ? AND resource = ?",
+                    (cluster, job_id, resource),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, cluster, job_id, resource, value):
+        """
+        Stores a resource.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jobs endpoint.
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        resource: str
+            Name of the resource, e.g. 'plan' or 'checkpoints/details/42'.
+        value: object
+            JSON serializable response.
+        """
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO resources (cluster, job_id, resource, value) VALUES (?, ?, ?, ?)",
+                (cluster, job_id, resource, blob),
+            )
+
+    def discard(self, cluster, job_id, resource=None):
+        """
+        Removes a resource, or every resource of a job if resource is not set.
+
+        Parameters
+        ----------
+        cluster: str
+            Identifier of the cluster, e.g. the url prefix of the jobs endpoint.
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        resource: str
+            (Optional) Name of the resource. Default: all resources of the job.
+        """
+        query = "DELETE FROM resources WHERE cluster = ? AND job_id = ?"
+        args = (cluster, job_id)
+        if resource is not None:
+            query += " AND resource = ?"
+            args += (resource,)
+        with self._lock:
+            self._connect().execute(query, args)
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
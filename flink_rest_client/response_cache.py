@@ -0,0 +1,169 @@
+import threading
+import time
+
+from flink_rest_client.cache import TTLCache
+from flink_rest_client.endpoints import _endpoint_path_template, endpoint_template
+
+
+class ResponseCache:
+    """
+    Cache of decoded GET responses with a time-to-live per endpoint family.
+
+    Endpoint families are given as templates in the notation of the Flink REST API documentation, e.g.
+    '/jobs/:jobid/plan'. A request url is resolved to its endpoint template first, and only the rule of exactly that
+    template applies, so a rule of '/jobs/:jobid' does not cover '/jobs/overview' or '/jobs/metrics'. Responses of
+    endpoints without a rule are never cached.
+
+    In stale-while-revalidate mode an expired response is still served for a while, and it is refreshed in the
+    background, so readers do not wait for the JobManager.
+
+    Every invalidation starts a new generation. A response loaded in an earlier generation is not stored, so a
+    request in flight during an invalidation cannot put back the response from before it.
+    """
+
+    def __init__(self, rules, maxsize=None, stale_while_revalidate=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        rules: dict
+            Endpoint template -> time-to-live in seconds. A rule with zero ttl disables caching of its endpoints.
+        maxsize: int
+            (Optional) Maximum number of cached responses. The least recently used response is evicted first.
+            Default: 256
+        stale_while_revalidate: float
+            (Optional) Number of seconds an expired response is still served while it is refreshed in the background.
+            Default: expired responses are fetched again synchronously.
+        """
+        self.stale_while_revalidate = stale_while_revalidate
+        # The rules are keyed by the canonical template, e.g. '/jobs/:job_id' is stored as '/jobs/:jobid'.
+        self._rules = {
+            _endpoint_path_template(template): ttl for template, ttl in rules.items()
+        }
+        self._entries = TTLCache(ttl=0, maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def generation(self):
+        """
+        Returns the number of invalidations so far. It is read before loading a response and passed to put.
+        """
+        return self._generation
+
+    def ttl_for(self, url):
+        """
+        Returns the time-to-live of the responses of an url.
+
+        Parameters
+        ----------
+        url: str
+            Request url.
+
+        Returns
+        -------
+        float
+            Time-to-live in seconds, or None if the responses of the url are not cached.
+        """
+        return self._rules.get(endpoint_template(url)) or None
+
+    def get(self, key):
+        """
+        Returns a cached response.
+
+        Parameters
+        ----------
+        key: str
+            Cache key, it starts with the request url.
+
+        Returns
+        -------
+        tuple
+            The cached response and whether it is still fresh, or None if the response is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        fresh_until, value = entry
+        return value, fresh_until > time.monotonic()
+
+    def put(self, key, value, ttl, generation=None):
+        """
+        Stores a response.
+
+        Parameters
+        ----------
+        key: str
+            Cache key, it starts with the request url.
+        value: object
+            Decoded response.
+        ttl: float
+            Time-to-live in seconds.
+        generation: int
+            (Optional) Generation read before the response was loaded. The response is dropped if the cache has been
+            invalidated since then. Default: the response is always stored.
+
+        Returns
+        -------
+        bool
+            True if the response was stored.
+        """
+        stale_for = self.stale_while_revalidate or 0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries.put(key, (time.monotonic() + ttl, value), ttl=ttl + stale_for)
+            return True
+
+    def start_refresh(self, key):
+        """
+        Marks a response as being refreshed.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+
+        Returns
+        -------
+        bool
+            False if the response is already being refreshed.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        """
+        Marks the refresh of a response as finished.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, prefix=None):
+        """
+        Drops the cached responses of the urls starting with prefix, or every response if prefix is not set.
+
+        Parameters
+        ----------
+        prefix: str
+            (Optional) Url prefix, e.g. the url of a job. Default: all responses.
+        """
+        with self._lock:
+            self._generation += 1
+            if prefix is None:
+                self._entries.invalidate()
+            else:
+                self._entries.invalidate_prefix(prefix)
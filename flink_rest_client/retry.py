@@ -0,0 +1,110 @@
+import random
+
+
+class RetryPolicy:
+    """
+    Retry policy of transient request failures: connection errors, timeouts and retryable status codes (e.g. a 503
+    response during leader election).
+
+    Only idempotent methods are retried by default. Non-idempotent calls (e.g. JarsClient.run, JobsClient.stop or
+    JobsClient.rescale) are retried only if their HTTP method is explicitly added to the methods parameter.
+    """
+
+    def __init__(
+        self,
+        max_attempts=None,
+        backoff_factor=None,
+        max_backoff=None,
+        jitter=True,
+        retryable_status_codes=None,
+        methods=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        max_attempts: int
+            (Optional) Maximum number of attempts including the first one. Default: 3
+        backoff_factor: float
+            (Optional) The n-th retry waits backoff_factor * 2 ** (n - 1) seconds. Default: 0.5
+        max_backoff: float
+            (Optional) Upper bound of the wait between two attempts in seconds. Default: 10
+        jitter: bool
+            (Optional) If it is True, the wait is drawn uniformly between zero and the exponential backoff, so
+            concurrent clients do not retry in lockstep. Default: True
+        retryable_status_codes: list
+            (Optional) Response status codes that are retried. Default: 500, 502, 503, 504
+        methods: list
+            (Optional) HTTP methods that may be retried. Default: GET, HEAD, OPTIONS
+        """
+        self.max_attempts = 3 if max_attempts is None else max_attempts
+        self.backoff_factor = 0.5 if backoff_factor is None else backoff_factor
+        self.max_backoff = 10.0 if max_backoff is None else max_backoff
+        self.jitter = jitter
+        self.retryable_status_codes = frozenset(
+            [500, 502, 503, 504]
+            if retryable_status_codes is None
+            else retryable_status_codes
+        )
+        self.methods = frozenset(
+            method.upper()
+            for method in (["GET", "HEAD", "OPTIONS"] if methods is None else methods)
+        )
+
+    def can_retry(self, method, attempt):
+        """
+        Returns whether a failed attempt may be followed by another one.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        attempt: int
+            Number of the failed attempt, starting from 1.
+
+        Returns
+        -------
+        bool
+            True if the request can be retried.
+        """
+        return method.upper() in self.methods and attempt < self.max_attempts
+
+    def is_retryable_status(self, status_code):
+        """
+        Returns whether a response status code indicates a transient failure.
+
+        Parameters
+        ----------
+        status_code: int
+            HTTP status code of the response.
+
+        Returns
+        -------
+        bool
+            True if the status code is retryable.
+        """
+        return status_code in self.retryable_status_codes
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of the failed attempt, starting from 1.
+        retry_after: float
+            (Optional) Wait requested by the server through the Retry-After header.
+
+        Returns
+        -------
+        float
+            Seconds to wait.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
@@ -0,0 +1,1179 @@
+import collections
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from flink_rest_client.endpoints import ENDPOINT_TEMPLATES, _by_specificity
+
+FLINK_VERSION = "1.13.2"
+
+# Scheduled failure of a request whose connection is closed without a response.
+_DROPPED = object()
+
+_BASE_METRIC_NAMES = [
+    "numRecordsIn",
+    "numRecordsOut",
+    "numBytesIn",
+    "numBytesOut",
+    "Status.JVM.CPU.Load",
+    "Status.JVM.Memory.Heap.Used",
+]
+
+
+def _metric_names(kind, cardinality):
+    names = [f"{kind}.{name}" for name in _BASE_METRIC_NAMES[:cardinality]]
+    names += [
+        f"{kind}.custom.metric_{index}" for index in range(cardinality - len(names))
+    ]
+    return names
+
+
+def _metric_value(entity, name):
+    # Deterministic pseudo random values, so repeated queries return the same numbers.
+    return float(hash((entity, name)) % 10000)
+
+
+class FakeRequest:
+    """
+    Request received by the FakeFlinkServer.
+
+    Attributes
+    ----------
+    method: str
+        HTTP method.
+    path: str
+        Path of the url, including the API version.
+    template: str
+        Endpoint template, e.g. '/jobs/:jobid'.
+    path_params: dict
+        Path parameter name (e.g. 'jobid') -> value.
+    params: dict
+        Query parameter name -> value.
+    headers: dict
+        Request headers.
+    body: bytes
+        Request body.
+    """
+
+    def __init__(self, method, path, template, path_params, params, headers, body):
+        self.method = method
+        self.path = path
+        self.template = template
+        self.path_params = path_params
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else {}
+
+
+class FakeFlinkCluster:
+    """
+    Synthetic state of a Flink cluster: running jobs with their vertices, subtasks and checkpoints, TaskManagers,
+    uploaded jars and metric catalogs of configurable size.
+    """
+
+    def __init__(
+        self,
+        jobs=None,
+        vertices=None,
+        parallelism=None,
+        taskmanagers=None,
+        metrics=None,
+        checkpoints=None,
+        log_size=None,
+        trigger_duration=None,
+        seed=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        jobs: int
+            (Optional) Number of running jobs. Default: 4
+        vertices: int
+            (Optional) Number of vertices of every job. Default: 3
+        parallelism: int
+            (Optional) Number of subtasks of every vertex. Default: 4
+        taskmanagers: int
+            (Optional) Number of TaskManagers. Default: 2
+        metrics: int
+            (Optional) Number of metrics of every job, vertex, TaskManager and the JobManager. Default: 20
+        checkpoints: int
+            (Optional) Number of completed checkpoints of every job. Default: 10
+        log_size: int
+            (Optional) Size of the log files in bytes. Default: 65536
+        trigger_duration: float
+            (Optional) Number of seconds an asynchronous operation (savepoint, stop, rescaling) takes. Default: 0
+        seed: int
+            (Optional) Seed of the generated ids. Default: random ids.
+        """
+        self._lock = threading.RLock()
+        self._rng = random.Random(seed)
+        self.parallelism = 4 if parallelism is None else parallelism
+        self.trigger_duration = 0.0 if trigger_duration is None else trigger_duration
+        self.metric_cardinality = 20 if metrics is None else metrics
+        self.vertex_count = 3 if vertices is None else vertices
+        self.checkpoint_count = 10 if checkpoints is None else checkpoints
+        self.started_at = int(time.time() * 1000)
+
+        self.jobs = collections.OrderedDict()
+        for index in range(4 if jobs is None else jobs):
+            self.add_job(f"Synthetic job {index}")
+        self.taskmanagers = collections.OrderedDict()
+        for index in range(2 if taskmanagers is None else taskmanagers):
+            taskmanager_id = f"10.0.0.{index + 1}:6122-{self._hex(6)}"
+            self.taskmanagers[taskmanager_id] = {
+                "id": taskmanager_id,
+                "path": f"akka.tcp://flink@10.0.0.{index + 1}:6122/user/rpc/taskmanager_0",
+                "dataPort": 6121,
+                "timeSinceLastHeartbeat": self.started_at,
+                "slotsNumber": self.parallelism,
+                "freeSlots": 0,
+                "hardware": {
+                    "cpuCores": 4,
+                    "physicalMemory": 8589934592,
+                    "freeMemory": 536870912,
+                    "managedMemory": 536870912,
+                },
+            }
+        self.jars = collections.OrderedDict()
+        self.triggers = {}
+        self.metric_names = {
+            kind: _metric_names(kind, self.metric_cardinality)
+            for kind in ["job", "vertex", "taskmanager", "jobmanager"]
+        }
+        line = "2021-06-01 12:00:00,000 INFO  org.apache.flink.runtime.Synthetic - Synthetic log line\n"
+        log_size = 65536 if log_size is None else log_size
+        self.log = (line * (log_size // len(line) + 1))[:log_size].encode()
+
+    def _hex(self, length=32):
+        return "".join(self._rng.choice("0123456789abcdef") for _ in range(length))
+
+    def add_job(self, name, state=None):
+        """
+        Adds a job to the cluster.
+
+        Parameters
+        ----------
+        name: str
+            Name of the job.
+        state: str
+            (Optional) State of the job. Default: RUNNING
+
+        Returns
+        -------
+        str
+            The id of the new job.
+        """
+        with self._lock:
+            job_id = self._hex()
+            self.jobs[job_id] = {
+                "jid": job_id,
+                "name": name,
+                "state": "RUNNING" if state is None else state,
+                "start-time": int(time.time() * 1000),
+                "end-time": -1,
+                # time of the latest state transition of the job or any of its tasks
+                "last-modification": int(time.time() * 1000),
+                "restarts": 0,
+                "vertices": [
+                    {
+                        "id": self._hex(),
+                        "name": f"Operator {index}",
+                        "parallelism": self.parallelism,
+                        # subtask index -> number of the current execution attempt, if it is not 0
+                        "attempts": {},
+                    }
+                    for index in range(self.vertex_count)
+                ],
+                "checkpoints": list(range(1, self.checkpoint_count + 1)),
+            }
+            return job_id
+
+    def set_job_state(self, job_id, state):
+        """
+        Changes the state of a job, e.g. to simulate a failure.
+
+        Parameters
+        ----------
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        state: str
+            New state of the job.
+        """
+        with self._lock:
+            job = self.jobs[job_id]
+            job["state"] = state
+            now = self._touch(job)
+            if state == "RESTARTING":
+                job["restarts"] += 1
+            if state in ("FINISHED", "CANCELED", "FAILED"):
+                job["end-time"] = now
+
+    def transition_tasks(self, job_id):
+        """
+        Changes the state of the tasks of a job without a restart, e.g. from DEPLOYING to INITIALIZING to RUNNING after
+        the job has started. Only the last modification time of the job changes.
+
+        Parameters
+        ----------
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        """
+        with self._lock:
+            self._touch(self.jobs[job_id])
+
+    def _touch(self, job):
+        # Every transition has a distinct timestamp, even if two of them happen within a millisecond.
+        now = int(time.time() * 1000)
+        job["last-modification"] = max(now, job["last-modification"] + 1)
+        return now
+
+    def restart_subtask(self, job_id, vertex_id, index):
+        """
+        Starts a new execution attempt of a subtask, the previous attempt becomes FAILED. It simulates a failover.
+
+        Parameters
+        ----------
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        vertex_id: str
+            32-character hexadecimal string value that identifies a vertex of the job.
+        index: int
+            Index of the subtask.
+
+        Returns
+        -------
+        int
+            The number of the new execution attempt.
+        """
+        with self._lock:
+            job = self.jobs[job_id]
+            for vertex in job["vertices"]:
+                if vertex["id"] == vertex_id:
+                    self._touch(job)
+                    job["restarts"] += 1
+                    vertex["attempts"][index] = vertex["attempts"].get(index, 0) + 1
+                    return vertex["attempts"][index]
+            raise KeyError(vertex_id)
+
+    def add_trigger(self, job_id, kind, on_complete=None, location=None):
+        with self._lock:
+            trigger_id = self._hex()
+            self.triggers[trigger_id] = {
+                "job_id": job_id,
+                "kind": kind,
+                "completes_at": time.monotonic() + self.trigger_duration,
+                "on_complete": on_complete,
+                "location": location,
+            }
+            return trigger_id
+
+    def trigger_status(self, trigger_id):
+        with self._lock:
+            trigger = self.triggers.get(trigger_id)
+            if trigger is None:
+                return None
+            if time.monotonic() < trigger["completes_at"]:
+                return {"status": {"id": "IN_PROGRESS"}}
+            if trigger["on_complete"] is not None:
+                trigger["on_complete"]()
+                trigger["on_complete"] = None
+            operation = {}
+            if trigger["location"] is not None:
+                operation["location"] = trigger["location"]
+            return {"status": {"id": "COMPLETED"}, "operation": operation}
+
+
+class _FakeFlinkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Small responses must not wait for the delayed ACK of the client.
+    disable_nagle_algorithm = True
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self):
+        body = self._read_body()
+        status, payload, content_type = self.server.fake._dispatch(
+            self.command, self.path, dict(self.headers), body
+        )
+        if status is None:
+            # Dropped connection: the socket is closed without a response.
+            self.close_connection = True
+            return
+        if isinstance(payload, bytes):
+            data = payload
+        else:
+            data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeFlinkServer:
+    """
+    In-process HTTP server implementing the REST endpoints covered by this client on top of a synthetic cluster.
+
+    The server listens on a real socket, so it exercises the whole networking stack of the client. Latency and
+    failures can be injected, and any endpoint can be overridden by a custom handler.
+    """
+
+    def __init__(
+        self,
+        cluster=None,
+        host=None,
+        port=None,
+        latency=None,
+        jitter=None,
+        failure_rate=None,
+        failure_status=None,
+        seed=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        cluster: FakeFlinkCluster
+            (Optional) State of the simulated cluster. Default: a FakeFlinkCluster with default sizes.
+        host: str
+            (Optional) Listen address. Default: 127.0.0.1
+        port: int
+            (Optional) Listen port. Default: a free port chosen by the operating system.
+        latency: float
+            (Optional) Number of seconds every response is delayed. Default: 0
+        jitter: float
+            (Optional) Additional random delay of at most jitter seconds. Default: 0
+        failure_rate: float
+            (Optional) Probability between 0 and 1 of answering a request with failure_status. Default: 0
+        failure_status: int
+            (Optional) Status code of the injected failures. Default: 503
+        seed: int
+            (Optional) Seed of the injected jitter and failures. Default: random.
+        """
+        self.cluster = FakeFlinkCluster(seed=seed) if cluster is None else cluster
+        self.latency = 0.0 if latency is None else latency
+        self.jitter = 0.0 if jitter is None else jitter
+        self.failure_rate = 0.0 if failure_rate is None else failure_rate
+        self.failure_status = 503 if failure_status is None else failure_status
+        self.request_counts = collections.Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._scheduled_failures = collections.deque()
+        self._routes = {}
+        self._register_default_routes()
+        self._templates = [
+            (template, self._compile(template))
+            for template in _by_specificity(ENDPOINT_TEMPLATES)
+        ]
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1" if host is None else host, 0 if port is None else port),
+            _FakeFlinkHandler,
+        )
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = None
+
+    @staticmethod
+    def _compile(template):
+        pattern = "/".join(
+            (
+                f"(?P<{segment[1:]}>[^/]+)"
+                if segment.startswith(":")
+                else re.escape(segment)
+            )
+            for segment in template.strip("/").split("/")
+        )
+        return re.compile(rf"^/v1/{pattern}/?$")
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """
+        Starts serving requests on a background thread.
+
+        Returns
+        -------
+        FakeFlinkServer
+            The server itself.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                # A short poll interval makes stop() return quickly.
+                kwargs={"poll_interval": 0.05},
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server and closes its socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def set_route(self, method, template, handler):
+        """
+        Overrides or adds an endpoint.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method.
+        template: str
+            Endpoint template, e.g. '/jobs/:jobid'. It must be one of the templates of flink_rest_client.endpoints.
+        handler: callable
+            Function called with the FakeRequest, returning a (status code, JSON serializable body) pair.
+        """
+        self._routes[(method.upper(), template)] = handler
+
+    def fail_next(self, count=None, status=None):
+        """
+        Fails the next requests regardless of the failure rate.
+
+        Parameters
+        ----------
+        count: int
+            (Optional) Number of requests to fail. Default: 1
+        status: int
+            (Optional) Status code of the failures. Default: the failure_status of the server.
+        """
+        status = self.failure_status if status is None else status
+        with self._lock:
+            self._scheduled_failures.extend([status] * (1 if count is None else count))
+
+    def drop_next(self, count=None):
+        """
+        Closes the connections of the next requests without a response, as a JobManager that goes down.
+
+        Parameters
+        ----------
+        count: int
+            (Optional) Number of dropped requests. Default: 1
+        """
+        with self._lock:
+            self._scheduled_failures.extend(
+                [_DROPPED] * (1 if count is None else count)
+            )
+
+    def _injected_failure(self):
+        with self._lock:
+            if self._scheduled_failures:
+                return self._scheduled_failures.popleft()
+            if self.failure_rate and self._rng.random() < self.failure_rate:
+                return self.failure_status
+            delay = self.latency + (
+                self._rng.uniform(0, self.jitter) if self.jitter else 0
+            )
+        if delay:
+            time.sleep(delay)
+        return None
+
+    def _dispatch(self, method, raw_path, headers, body):
+        parts = urlsplit(raw_path)
+        path = parts.path
+        for template, pattern in self._templates:
+            match = pattern.match(path)
+            if match is not None:
+                break
+        else:
+            template, match = path, None
+        with self._lock:
+            self.request_counts[f"{method} {template}"] += 1
+
+        failure = self._injected_failure()
+        if failure is _DROPPED:
+            return None, None, None
+        if failure is not None:
+            return failure, {"errors": ["Injected failure."]}, "application/json"
+
+        handler = None if match is None else self._routes.get((method, template))
+        if handler is None:
+            return 404, {"errors": ["Not found."]}, "application/json"
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        path_params = {key: unquote(value) for key, value in match.groupdict().items()}
+        request = FakeRequest(
+            method, path, template, path_params, params, headers, body
+        )
+        try:
+            status, payload = handler(request)
+        except KeyError as exc:
+            return 404, {"errors": [f"Not found: {exc}"]}, "application/json"
+        content_type = (
+            "text/plain" if isinstance(payload, bytes) else "application/json"
+        )
+        return status, payload, content_type
+
+    # Endpoint implementations
+
+    def _register_default_routes(self):
+        routes = {
+            ("GET", "/overview"): self._overview,
+            ("GET", "/config"): self._config,
+            ("DELETE", "/cluster"): lambda request: (200, {}),
+            ("GET", "/datasets"): lambda request: (200, {"dataSets": []}),
+            ("DELETE", "/datasets/:datasetid"): self._delete_dataset,
+            ("GET", "/datasets/delete/:triggerid"): self._trigger_status,
+            ("GET", "/jars"): self._jars,
+            ("POST", "/jars/upload"): self._upload_jar,
+            ("DELETE", "/jars/:jarid"): self._delete_jar,
+            ("GET", "/jars/:jarid/plan"): self._jar_plan,
+            ("POST", "/jars/:jarid/plan"): self._jar_plan,
+            ("POST", "/jars/:jarid/run"): self._run_jar,
+            ("GET", "/jobmanager/config"): self._jobmanager_config,
+            ("GET", "/jobmanager/logs"): self._logs("jobmanager"),
+            ("GET", "/jobmanager/logs/:log_file"): self._log_file,
+            ("GET", "/jobmanager/metrics"): self._entity_metrics("jobmanager"),
+            ("GET", "/jobs"): self._jobs,
+            ("GET", "/jobs/overview"): self._jobs_overview,
+            ("GET", "/jobs/metrics"): self._aggregated_metrics("job"),
+            ("GET", "/jobs/:jobid"): self._job,
+            ("PATCH", "/jobs/:jobid"): self._terminate_job,
+            ("GET", "/jobs/:jobid/accumulators"): self._job_accumulators,
+            ("GET", "/jobs/:jobid/checkpoints"): self._checkpoints,
+            ("GET", "/jobs/:jobid/checkpoints/config"): self._checkpoint_config,
+            ("GET", "/jobs/:jobid/checkpoints/details/:checkpointid"): self._checkpoint,
+            (
+                "GET",
+                "/jobs/:jobid/checkpoints/details/:checkpointid/subtasks/:vertexid",
+            ): self._checkpoint_subtasks,
+            ("GET", "/jobs/:jobid/config"): self._job_config,
+            ("GET", "/jobs/:jobid/exceptions"): self._exceptions,
+            ("GET", "/jobs/:jobid/execution-result"): self._execution_result,
+            ("GET", "/jobs/:jobid/metrics"): self._job_metrics,
+            ("GET", "/jobs/:jobid/plan"): self._plan,
+            ("PATCH", "/jobs/:jobid/rescaling"): self._rescale,
+            ("GET", "/jobs/:jobid/rescaling/:triggerid"): self._trigger_status,
+            ("POST", "/jobs/:jobid/savepoints"): self._savepoint,
+            ("GET", "/jobs/:jobid/savepoints/:triggerid"): self._trigger_status,
+            ("POST", "/jobs/:jobid/stop"): self._stop,
+            ("GET", "/jobs/:jobid/vertices/:vertexid"): self._vertex,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/accumulators",
+            ): self._vertex_accumulators,
+            ("GET", "/jobs/:jobid/vertices/:vertexid/backpressure"): self._backpressure,
+            ("GET", "/jobs/:jobid/vertices/:vertexid/metrics"): self._entity_metrics(
+                "vertex"
+            ),
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/accumulators",
+            ): self._subtask_accumulators,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/metrics",
+            ): self._aggregated_metrics("vertex"),
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex",
+            ): self._subtask,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt",
+            ): self._subtask,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt/accumulators",
+            ): self._attempt_accumulators,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/metrics",
+            ): self._entity_metrics("vertex"),
+            ("GET", "/jobs/:jobid/vertices/:vertexid/subtasktimes"): self._subtasktimes,
+            (
+                "GET",
+                "/jobs/:jobid/vertices/:vertexid/taskmanagers",
+            ): self._vertex_taskmanagers,
+            ("GET", "/jobs/:jobid/vertices/:vertexid/watermarks"): self._watermarks,
+            ("GET", "/taskmanagers"): self._taskmanagers,
+            ("GET", "/taskmanagers/metrics"): self._aggregated_metrics("taskmanager"),
+            ("GET", "/taskmanagers/:taskmanagerid"): self._taskmanager,
+            ("GET", "/taskmanagers/:taskmanagerid/logs"): self._logs("taskmanager"),
+            ("GET", "/taskmanagers/:taskmanagerid/logs/:log_file"): self._log_file,
+            ("GET", "/taskmanagers/:taskmanagerid/metrics"): self._entity_metrics(
+                "taskmanager"
+            ),
+            ("GET", "/taskmanagers/:taskmanagerid/thread-dump"): self._thread_dump,
+        }
+        self._routes.update(routes)
+
+    def _job_of(self, request):
+        return self.cluster.jobs[request.path_params["jobid"]]
+
+    def _vertex_of(self, request):
+        job = self._job_of(request)
+        for vertex in job["vertices"]:
+            if vertex["id"] == request.path_params["vertexid"]:
+                return vertex
+        raise KeyError(request.path_params["vertexid"])
+
+    def _overview(self, request):
+        states = collections.Counter(job["state"] for job in self.cluster.jobs.values())
+        slots = sum(tm["slotsNumber"] for tm in self.cluster.taskmanagers.values())
+        return 200, {
+            "taskmanagers": len(self.cluster.taskmanagers),
+            "slots-total": slots,
+            "slots-available": 0,
+            "jobs-running": states["RUNNING"],
+            "jobs-finished": states["FINISHED"],
+            "jobs-cancelled": states["CANCELED"],
+            "jobs-failed": states["FAILED"],
+            "flink-version": FLINK_VERSION,
+            "flink-commit": "synthetic",
+        }
+
+    def _config(self, request):
+        return 200, {
+            "refresh-interval": 3000,
+            "timezone-name": "Coordinated Universal Time",
+            "timezone-offset": 0,
+            "flink-version": FLINK_VERSION,
+            "flink-revision": "synthetic",
+            "features": {"web-submit": True},
+        }
+
+    def _delete_dataset(self, request):
+        trigger_id = self.cluster.add_trigger(None, "datasets")
+        return 202, {"request-id": trigger_id}
+
+    def _trigger_status(self, request):
+        status = self.cluster.trigger_status(request.path_params["triggerid"])
+        if status is None:
+            return 404, {"errors": ["Unknown trigger."]}
+        return 200, status
+
+    def _jars(self, request):
+        return 200, {"address": self.url, "files": list(self.cluster.jars.values())}
+
+    def _upload_jar(self, request):
+        match = re.search(rb'filename="([^"]+)"', request.body)
+        if match is None:
+            return 400, {"errors": ["No jar in the request."]}
+        jar_id = f"{uuid.uuid4()}_{match.group(1).decode()}"
+        with self.cluster._lock:
+            self.cluster.jars[jar_id] = {
+                "id": jar_id,
+                "name": match.group(1).decode(),
+                "uploaded": int(time.time() * 1000),
+                "entry": [{"name": "org.example.SyntheticJob", "description": None}],
+            }
+        return 200, {
+            "filename": f"/tmp/flink-web-upload/{jar_id}",
+            "status": "success",
+        }
+
+    def _delete_jar(self, request):
+        with self.cluster._lock:
+            del self.cluster.jars[request.path_params["jarid"]]
+        return 200, {}
+
+    def _jar_plan(self, request):
+        jar = self.cluster.jars[request.path_params["jarid"]]
+        return 200, {"plan": {"jid": None, "name": jar["name"], "nodes": []}}
+
+    def _run_jar(self, request):
+        jar = self.cluster.jars[request.path_params["jarid"]]
+        job_id = self.cluster.add_job(jar["name"])
+        return 200, {"jobid": job_id}
+
+    def _jobmanager_config(self, request):
+        return 200, [
+            {"key": "jobmanager.rpc.address", "value": self.host},
+            {"key": "rest.port", "value": str(self.port)},
+            {"key": "parallelism.default", "value": str(self.cluster.parallelism)},
+        ]
+
+    def _logs(self, kind):
+        def handler(request):
+            return 200, {
+                "logs": [{"name": f"{kind}.log", "size": len(self.cluster.log)}]
+            }
+
+        return handler
+
+    def _log_file(self, request):
+        if not request.path_params["log_file"].endswith(".log"):
+            return 404, {"errors": ["Log file does not exist."]}
+        return 200, self.cluster.log
+
+    def _entity_metrics(self, kind):
+        def handler(request):
+            names = self.cluster.metric_names[kind]
+            if "get" not in request.params:
+                return 200, [{"id": name} for name in names]
+            entity = request.path
+            known = set(names)
+            return 200, [
+                {"id": name, "value": str(_metric_value(entity, name))}
+                for name in request.params["get"].split(",")
+                if name in known
+            ]
+
+        return handler
+
+    def _job_metrics(self, request):
+        job = self._job_of(request)
+        status, metrics = self._entity_metrics("job")(request)
+        names = request.params.get("get")
+        if names is None:
+            metrics.append({"id": "numRestarts"})
+        elif "numRestarts" in names.split(","):
+            metrics.append({"id": "numRestarts", "value": str(job["restarts"])})
+        return status, metrics
+
+    def _aggregated_metrics(self, kind):
+        def handler(request):
+            names = self.cluster.metric_names[kind]
+            if "get" not in request.params:
+                return 200, [{"id": name} for name in names]
+            agg_modes = request.params.get("agg", "min,max,avg,sum").split(",")
+            known = set(names)
+            result = []
+            for name in request.params["get"].split(","):
+                if name not in known:
+                    continue
+                value = _metric_value(request.path, name)
+                values = {
+                    "min": value,
+                    "max": value * 2,
+                    "avg": value * 1.5,
+                    "sum": value * 4,
+                }
+                result.append(
+                    {
+                        "id": name,
+                        **{mode: values[mode] for mode in agg_modes if mode in values},
+                    }
+                )
+            return 200, result
+
+        return handler
+
+    def _jobs(self, request):
+        return 200, {
+            "jobs": [
+                {"id": job_id, "status": job["state"]}
+                for job_id, job in self.cluster.jobs.items()
+            ]
+        }
+
+    def _job_summary(self, job):
+        now = int(time.time() * 1000)
+        end_time = job["end-time"]
+        return {
+            "jid": job["jid"],
+            "name": job["name"],
+            "state": job["state"],
+            "start-time": job["start-time"],
+            "end-time": end_time,
+            "duration": (now if end_time < 0 else end_time) - job["start-time"],
+            "last-modification": job["last-modification"],
+            "tasks": {
+                "total": len(job["vertices"]),
+                "running": len(job["vertices"]) if job["state"] == "RUNNING" else 0,
+            },
+        }
+
+    def _jobs_overview(self, request):
+        return 200, {
+            "jobs": [self._job_summary(job) for job in self.cluster.jobs.values()]
+        }
+
+    def _vertex_summary(self, job, vertex):
+        return {
+            "id": vertex["id"],
+            "name": vertex["name"],
+            "parallelism": vertex["parallelism"],
+            "status": job["state"],
+            "start-time": job["start-time"],
+            "end-time": job["end-time"],
+            "metrics": {"read-records": 0, "write-records": 0},
+        }
+
+    def _job(self, request):
+        job = self._job_of(request)
+        details = self._job_summary(job)
+        details.update(
+            {
+                "isStoppable": False,
+                "now": int(time.time() * 1000),
+                "vertices": [
+                    self._vertex_summary(job, vertex) for vertex in job["vertices"]
+                ],
+                "status-counts": {job["state"]: len(job["vertices"])},
+                "plan": self._plan(request)[1]["plan"],
+            }
+        )
+        return 200, details
+
+    def _terminate_job(self, request):
+        self.cluster.set_job_state(request.path_params["jobid"], "CANCELED")
+        return 202, {}
+
+    def _job_accumulators(self, request):
+        self._job_of(request)
+        return 200, {
+            "job-accumulators": [],
+            "user-task-accumulators": [],
+            "serialized-user-task-accumulators": {},
+        }
+
+    def _checkpoint_summary(self, job, checkpoint_id):
+        return {
+            "id": checkpoint_id,
+            "status": "COMPLETED",
+            "is_savepoint": False,
+            "trigger_timestamp": job["start-time"] + checkpoint_id * 60000,
+            "latest_ack_timestamp": job["start-time"] + checkpoint_id * 60000 + 250,
+            "state_size": 1048576 * checkpoint_id,
+            "end_to_end_duration": 250,
+            "alignment_buffered": 0,
+            "num_subtasks": len(job["vertices"]) * self.cluster.parallelism,
+            "num_acknowledged_subtasks": len(job["vertices"])
+            * self.cluster.parallelism,
+        }
+
+    def _checkpoints(self, request):
+        job = self._job_of(request)
+        history = [
+            self._checkpoint_summary(job, checkpoint_id)
+            for checkpoint_id in reversed(job["checkpoints"])
+        ]
+        return 200, {
+            "counts": {
+                "restored": 0,
+                "total": len(history),
+                "in_progress": 0,
+                "completed": len(history),
+                "failed": 0,
+            },
+            "summary": {},
+            "latest": {"completed": history[0] if history else None},
+            "history": history,
+        }
+
+    def _checkpoint_config(self, request):
+        self._job_of(request)
+        return 200, {
+            "mode": "exactly_once",
+            "interval": 60000,
+            "timeout": 600000,
+            "min_pause": 0,
+            "max_concurrent": 1,
+            "externalization": {"enabled": False, "delete_on_cancellation": True},
+        }
+
+    def _checkpoint(self, request):
+        job = self._job_of(request)
+        checkpoint_id = int(request.path_params["checkpointid"])
+        if checkpoint_id not in job["checkpoints"]:
+            return 404, {
+                "errors": ["Could not find checkpointing statistics for checkpoint."]
+            }
+        details = self._checkpoint_summary(job, checkpoint_id)
+        details["tasks"] = {
+            vertex["id"]: {
+                "id": checkpoint_id,
+                "status": "COMPLETED",
+                "num_subtasks": vertex["parallelism"],
+                "num_acknowledged_subtasks": vertex["parallelism"],
+            }
+            for vertex in job["vertices"]
+        }
+        return 200, details
+
+    def _checkpoint_subtasks(self, request):
+        vertex = self._vertex_of(request)
+        return 200, {
+            "id": int(request.path_params["checkpointid"]),
+            "status": "COMPLETED",
+            "summary": {},
+            "subtasks": [
+                {"index": index, "status": "completed", "state_size": 1024}
+                for index in range(vertex["parallelism"])
+            ],
+        }
+
+    def _job_config(self, request):
+        job = self._job_of(request)
+        return 200, {
+            "jid": job["jid"],
+            "name": job["name"],
+            "execution-config": {
+                "execution-mode": "PIPELINED",
+                "restart-strategy": "Cluster level default restart strategy",
+                "job-parallelism": self.cluster.parallelism,
+                "object-reuse-mode": False,
+                "user-config": {},
+            },
+        }
+
+    def _exceptions(self, request):
+        self._job_of(request)
+        return 200, {
+            "root-exception": None,
+            "timestamp": None,
+            "all-exceptions": [],
+            "truncated": False,
+        }
+
+    def _execution_result(self, request):
+        job = self._job_of(request)
+        if job["state"] not in ("FINISHED", "CANCELED", "FAILED"):
+            return 200, {"status": {"id": "IN_PROGRESS"}}
+        return 200, {
+            "status": {"id": "COMPLETED"},
+            "job-execution-result": {
+                "id": job["jid"],
+                "application-status": (
+                    "SUCCEEDED" if job["state"] == "FINISHED" else job["state"]
+                ),
+                "accumulator-results": {},
+                "net-runtime": job["end-time"] - job["start-time"],
+            },
+        }
+
+    def _plan(self, request):
+        job = self._job_of(request)
+        nodes = []
+        for index, vertex in enumerate(job["vertices"]):
+            node = {
+                "id": vertex["id"],
+                "parallelism": vertex["parallelism"],
+                "operator": "",
+                "operator_strategy": "",
+                "description": vertex["name"],
+            }
+            if index > 0:
+                node["inputs"] = [
+                    {
+                        "num": 0,
+                        "id": job["vertices"][index - 1]["id"],
+                        "ship_strategy": "HASH",
+                        "exchange": "pipelined_bounded",
+                    }
+                ]
+            nodes.append(node)
+        return 200, {"plan": {"jid": job["jid"], "name": job["name"], "nodes": nodes}}
+
+    def _rescale(self, request):
+        job_id = request.path_params["jobid"]
+        self._job_of(request)
+        return 200, {"triggerid": self.cluster.add_trigger(job_id, "rescaling")}
+
+    def _savepoint(self, request):
+        job_id = request.path_params["jobid"]
+        self._job_of(request)
+        options = request.json()
+        directory = options.get("target-directory") or "file:/tmp/savepoints"
+
+        def on_complete():
+            self.cluster.set_job_state(job_id, "CANCELED")
+
+        trigger_id = self.cluster.add_trigger(
+            job_id,
+            "savepoints",
+            on_complete=on_complete if options.get("cancel-job") else None,
+            location=f"{directory}/savepoint-{job_id[:6]}-{self.cluster._hex(12)}",
+        )
+        return 202, {"request-id": trigger_id}
+
+    def _stop(self, request):
+        job_id = request.path_params["jobid"]
+        self._job_of(request)
+        directory = request.json().get("targetDirectory") or "file:/tmp/savepoints"
+        trigger_id = self.cluster.add_trigger(
+            job_id,
+            "savepoints",
+            on_complete=lambda: self.cluster.set_job_state(job_id, "FINISHED"),
+            location=f"{directory}/savepoint-{job_id[:6]}-{self.cluster._hex(12)}",
+        )
+        return 202, {"request-id": trigger_id}
+
+    def _subtask_summary(self, job, vertex, index, attempt=None):
+        taskmanagers = list(self.cluster.taskmanagers) or ["localhost:6122"]
+        current = vertex["attempts"].get(index, 0)
+        attempt = current if attempt is None else attempt
+        return {
+            "subtask": index,
+            "status": job["state"] if attempt == current else "FAILED",
+            "attempt": attempt,
+            "host": taskmanagers[index % len(taskmanagers)].split(":")[0],
+            "start-time": job["start-time"],
+            "end-time": job["end-time"],
+            "duration": 0,
+            "metrics": {"read-records": 0, "write-records": 0},
+        }
+
+    def _vertex(self, request):
+        job, vertex = self._job_of(request), self._vertex_of(request)
+        return 200, {
+            "id": vertex["id"],
+            "name": vertex["name"],
+            "parallelism": vertex["parallelism"],
+            "now": int(time.time() * 1000),
+            "subtasks": [
+                self._subtask_summary(job, vertex, index)
+                for index in range(vertex["parallelism"])
+            ],
+        }
+
+    def _vertex_accumulators(self, request):
+        vertex = self._vertex_of(request)
+        return 200, {"id": vertex["id"], "user-accumulators": []}
+
+    def _backpressure(self, request):
+        vertex = self._vertex_of(request)
+        return 200, {
+            "status": "ok",
+            "backpressure-level": "ok",
+            "end-timestamp": int(time.time() * 1000),
+            "subtasks": [
+                {"subtask": index, "backpressure-level": "ok", "ratio": 0.0}
+                for index in range(vertex["parallelism"])
+            ],
+        }
+
+    def _subtask_accumulators(self, request):
+        job, vertex = self._job_of(request), self._vertex_of(request)
+        return 200, {
+            "id": vertex["id"],
+            "parallelism": vertex["parallelism"],
+            "subtasks": [
+                {
+                    "subtask": index,
+                    "attempt": vertex["attempts"].get(index, 0),
+                    "host": self._subtask_summary(job, vertex, index)["host"],
+                    "user-accumulators": [],
+                }
+                for index in range(vertex["parallelism"])
+            ],
+        }
+
+    def _subtask(self, request):
+        job, vertex = self._job_of(request), self._vertex_of(request)
+        index = int(request.path_params["subtaskindex"])
+        if index >= vertex["parallelism"]:
+            return 404, {"errors": ["Invalid subtask index."]}
+        attempt = request.path_params.get("attempt")
+        if attempt is not None:
+            attempt = int(attempt)
+            if attempt > vertex["attempts"].get(index, 0):
+                return 404, {"errors": ["Invalid attempt number."]}
+        return 200, self._subtask_summary(job, vertex, index, attempt)
+
+    def _attempt_accumulators(self, request):
+        vertex = self._vertex_of(request)
+        return 200, {
+            "subtask": int(request.path_params["subtaskindex"]),
+            "attempt": int(request.path_params["attempt"]),
+            "id": vertex["id"],
+            "user-accumulators": [],
+        }
+
+    def _subtasktimes(self, request):
+        job, vertex = self._job_of(request), self._vertex_of(request)
+        return 200, {
+            "id": vertex["id"],
+            "name": vertex["name"],
+            "now": int(time.time() * 1000),
+            "subtasks": [
+                {
+                    "subtask": index,
+                    "host": self._subtask_summary(job, vertex, index)["host"],
+                    "duration": 0,
+                    "timestamps": {"RUNNING": job["start-time"]},
+                }
+                for index in range(vertex["parallelism"])
+            ],
+        }
+
+    def _vertex_taskmanagers(self, request):
+        vertex = self._vertex_of(request)
+        return 200, {
+            "id": vertex["id"],
+            "name": vertex["name"],
+            "now": int(time.time() * 1000),
+            "taskmanagers": [
+                {
+                    "host": taskmanager_id,
+                    "status": "RUNNING",
+                    "taskmanager-id": taskmanager_id,
+                }
+                for taskmanager_id in self.cluster.taskmanagers
+            ],
+        }
+
+    def _watermarks(self, request):
+        vertex = self._vertex_of(request)
+        return 200, [
+            {"id": f"{index}.currentInputWatermark", "value": str(-(2**63))}
+            for index in range(vertex["parallelism"])
+        ]
+
+    def _taskmanagers(self, request):
+        return 200, {"taskmanagers": list(self.cluster.taskmanagers.values())}
+
+    def _taskmanager(self, request):
+        taskmanager = self.cluster.taskmanagers[request.path_params["taskmanagerid"]]
+        return 200, {**taskmanager, "metrics": {}}
+
+    def _thread_dump(self, request):
+        self.cluster.taskmanagers[request.path_params["taskmanagerid"]]
+        return 200, {
+            "threadInfos": [
+                {
+                    "threadName": f"Thread-{index}",
+                    "stringifiedThreadInfo": f'"Thread-{index}" Id={index} RUNNABLE\n',
+                }
+                for index in range(8)
+            ]
+        }
@@ -0,0 +1,252 @@
+import collections
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import random
+import threading
+import time
+
+_current_span = contextvars.ContextVar("flink_rest_client_span", default=None)
+
+# Offset of the performance counter from the epoch, taken once, so that the start and the end of every span are read
+# from the same monotonic clock and the spans nest exactly.
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+
+def _now_ns():
+    return _EPOCH_OFFSET_NS + time.perf_counter_ns()
+
+
+class Span:
+    """
+    Timed operation of a trace: a client method or a single HTTP request.
+
+    Attributes
+    ----------
+    name: str
+        Name of the operation, e.g. 'JarsClient.upload_and_run' or 'GET /jobs/:jobid'.
+    kind: str
+        'internal' for client methods and 'client' for HTTP requests.
+    trace_id: str
+        32-character hexadecimal id shared by every span of a trace.
+    span_id: str
+        16-character hexadecimal id of the span.
+    parent_id: str
+        Id of the enclosing span, or None for a root span.
+    start_time: int
+        Start of the span in nanoseconds since the epoch.
+    end_time: int
+        End of the span in nanoseconds since the epoch, or None while the span is running.
+    thread_id: int
+        Identifier of the thread that executed the span.
+    attributes: dict
+        Key-value pairs describing the operation.
+    error: Exception
+        The exception raised by the operation, or None.
+    """
+
+    def __init__(self, name, kind, parent=None, attributes=None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = (
+            f"{random.getrandbits(128):032x}" if parent is None else parent.trace_id
+        )
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = None if parent is None else parent.span_id
+        self.thread_id = threading.get_ident()
+        self.attributes = {} if attributes is None else dict(attributes)
+        self.error = None
+        self.start_time = _now_ns()
+        self.end_time = None
+
+    @property
+    def duration(self):
+        """
+        Returns the duration of the finished span in seconds.
+        """
+        return (
+            None if self.end_time is None else (self.end_time - self.start_time) / 1e9
+        )
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def _end(self):
+        self.end_time = _now_ns()
+
+    def to_chrome_event(self, pid=None):
+        """
+        Returns the span as a complete event of the Chrome trace event format.
+
+        Parameters
+        ----------
+        pid: int
+            (Optional) Process id of the event. Default: the id of the current process.
+
+        Returns
+        -------
+        dict
+            Trace event, which can be loaded by chrome://tracing or Perfetto.
+        """
+        args = dict(self.attributes)
+        args.update(span_id=self.span_id, parent_id=self.parent_id)
+        if self.error is not None:
+            args["error"] = repr(self.error)
+        return {
+            "name": self.name,
+            "cat": self.kind,
+            "ph": "X",
+            "ts": self.start_time / 1000,
+            "dur": (self.end_time - self.start_time) / 1000,
+            "pid": os.getpid() if pid is None else pid,
+            "tid": self.thread_id,
+            "args": args,
+        }
+
+    def to_otel(self):
+        """
+        Returns the span in the JSON layout of the OpenTelemetry SDK spans.
+
+        Returns
+        -------
+        dict
+            Span with name, context, kind, parent_id, start_time, end_time, status and attributes keys.
+        """
+        return {
+            "name": self.name,
+            "context": {"trace_id": self.trace_id, "span_id": self.span_id},
+            "kind": (
+                "SPAN_KIND_CLIENT" if self.kind == "client" else "SPAN_KIND_INTERNAL"
+            ),
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": (
+                {"status_code": "OK"}
+                if self.error is None
+                else {"status_code": "ERROR", "description": repr(self.error)}
+            ),
+            "attributes": dict(self.attributes),
+        }
+
+
+class Tracer:
+    """
+    Collector of the spans of the client methods and of their HTTP requests.
+
+    Composite methods (e.g. JarsClient.upload_and_run) are recorded as parent spans of the requests they execute,
+    including the requests executed concurrently on worker threads.
+    """
+
+    def __init__(self, on_span_end=None, max_spans=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        on_span_end: callable
+            (Optional) Function called with every finished Span, e.g. to forward span.to_otel() to an OpenTelemetry
+            exporter. Default: no callback.
+        max_spans: int
+            (Optional) Maximum number of kept spans, the oldest ones are dropped first. Default: 10000
+        """
+        self.on_span_end = on_span_end
+        self._spans = collections.deque(
+            maxlen=10000 if max_spans is None else max_spans
+        )
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, kind=None, attributes=None):
+        """
+        Records a span around a block. Spans started inside the block, also on threads started with a copy of the
+        context, become its children.
+
+        Parameters
+        ----------
+        name: str
+            Name of the operation.
+        kind: str
+            (Optional) 'internal' or 'client'. Default: 'internal'
+        attributes: dict
+            (Optional) Key-value pairs describing the operation.
+
+        Returns
+        -------
+        Span
+            The running span.
+        """
+        span = Span(
+            name,
+            "internal" if kind is None else kind,
+            parent=_current_span.get(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = exc
+            raise
+        finally:
+            _current_span.reset(token)
+            span._end()
+            with self._lock:
+                self._spans.append(span)
+            if self.on_span_end is not None:
+                self.on_span_end(span)
+
+    def spans(self):
+        """
+        Returns the finished spans.
+
+        Returns
+        -------
+        list
+            List of Span objects in the order they finished.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """
+        Drops the finished spans.
+        """
+        with self._lock:
+            self._spans.clear()
+
+    def export_chrome_trace(self, path):
+        """
+        Writes the finished spans to a Chrome trace event JSON file, which can be opened by chrome://tracing or
+        https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        path: str
+            Path of the target file.
+        """
+        pid = os.getpid()
+        with open(path, "w") as target:
+            json.dump(
+                {
+                    "traceEvents": [span.to_chrome_event(pid) for span in self.spans()],
+                    "displayTimeUnit": "ms",
+                },
+                target,
+            )
+
+
+def _traced(func):
+    # Records a client method as a span if the session of the client has a tracer.
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        session = getattr(self, "_session", None)
+        tracer = None if session is None else session.tracer
+        if tracer is None:
+            return func(self, *args, **kwargs)
+        with tracer.span(func.__qualname__):
+            return func(self, *args, **kwargs)
+
+    return wrapper
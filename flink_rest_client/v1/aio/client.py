@@ -0,0 +1,125 @@
+from flink_rest_client.aio import AsyncRestSession, _execute_async_rest_request
+from flink_rest_client.v1.aio.jars import AsyncJarsClient
+from flink_rest_client.v1.aio.jobmanager import AsyncJobmanagerClient
+from flink_rest_client.v1.aio.jobs import AsyncJobsClient
+from flink_rest_client.v1.aio.taskmanagers import AsyncTaskManagersClient
+
+
+class AsyncDatasetTrigger:
+    def __init__(self, prefix, trigger_id, session):
+        self._prefix = prefix
+        self._session = session
+        self.trigger_id = trigger_id
+
+    async def status(self):
+        return await _execute_async_rest_request(
+            url=f"{self._prefix}/{self.trigger_id}", session=self._session
+        )
+
+
+class AsyncFlinkRestClientV1:
+    """
+    Async counterpart of FlinkRestClientV1. Every query method is a coroutine; the parameters and return values are
+    documented on the synchronous client.
+    """
+
+    def __init__(self, host, port, session=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        host: str
+            Hostname of Flink Jobmanager
+        port: int
+            Port number.
+        session: AsyncRestSession
+            (Optional) HTTP session shared by every sub-client. Default: a new AsyncRestSession.
+        """
+        self.host = host
+        self.port = port
+        self.session = AsyncRestSession() if session is None else session
+
+    async def close(self):
+        """
+        Closes the pooled connections of the client.
+        """
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def api_url(self):
+        return f"http://{self.host}:{str(self.port)}/v1"
+
+    @property
+    def jobmanager(self):
+        return AsyncJobmanagerClient(prefix=self.api_url, session=self.session)
+
+    @property
+    def taskmanagers(self):
+        return AsyncTaskManagersClient(prefix=self.api_url, session=self.session)
+
+    @property
+    def jars(self):
+        return AsyncJarsClient(prefix=self.api_url, session=self.session)
+
+    @property
+    def jobs(self):
+        return AsyncJobsClient(prefix=self.api_url, session=self.session)
+
+    async def overview(self):
+        """
+        Endpoint: [GET] /overview
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.api_url}/overview", session=self.session
+        )
+
+    async def config(self):
+        """
+        Endpoint: [GET] /config
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.api_url}/config", session=self.session
+        )
+
+    async def delete_cluster(self):
+        """
+        Endpoint: [DELETE] /cluster
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.api_url}/cluster", http_method="DELETE", session=self.session
+        )
+
+    async def datasets(self):
+        """
+        Endpoint: [GET] /datasets
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.api_url}/datasets", session=self.session
+            )
+        )["dataSets"]
+
+    async def delete_dataset(self, dataset_id):
+        """
+        Endpoint: [DELETE] /datasets/:datasetid
+        """
+        trigger_id = (
+            await _execute_async_rest_request(
+                url=f"{self.api_url}/datasets/{dataset_id}",
+                http_method="DELETE",
+                accepted_status_code=202,
+                session=self.session,
+            )
+        )["request-id"]
+        return AsyncDatasetTrigger(
+            prefix=f"{self.api_url}/datasets/delete",
+            trigger_id=trigger_id,
+            session=self.session,
+        )
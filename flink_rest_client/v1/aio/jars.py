@@ -0,0 +1,137 @@
+import ntpath
+import os
+
+from flink_rest_client.aio import aiohttp, _execute_async_rest_request
+from flink_rest_client.common import RestException
+
+
+class AsyncJarsClient:
+    """
+    Async counterpart of JarsClient. The parameters and return values are documented on the synchronous client.
+    """
+
+    def __init__(self, prefix, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self.prefix = f"{prefix}/jars"
+        self._session = session
+
+    async def all(self):
+        """
+        Endpoint: [GET] /jars
+        """
+        return await _execute_async_rest_request(url=self.prefix, session=self._session)
+
+    async def upload(self, path_to_jar):
+        """
+        Endpoint: [POST] /jars/upload
+        """
+        filename = os.path.basename(path_to_jar)
+        with open(path_to_jar, "rb") as jar_file:
+            data = aiohttp.FormData()
+            data.add_field(
+                "file",
+                jar_file,
+                filename=filename,
+                content_type="application/x-java-archive",
+            )
+            return await _execute_async_rest_request(
+                url=f"{self.prefix}/upload",
+                http_method="POST",
+                data=data,
+                session=self._session,
+            )
+
+    async def get_plan(self, jar_id):
+        """
+        Endpoint: [POST] /jars/:jarid/plan
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{jar_id}/plan",
+                http_method="POST",
+                session=self._session,
+            )
+        )["plan"]
+
+    async def run(
+        self,
+        jar_id,
+        arguments=None,
+        entry_class=None,
+        parallelism=None,
+        savepoint_path=None,
+        allow_non_restored_state=None,
+    ):
+        """
+        Endpoint: [POST] /jars/:jarid/run
+        """
+        data = {}
+        if arguments is not None:
+            data["programArgs"] = " ".join([f"--{k} {v}" for k, v in arguments.items()])
+        if entry_class is not None:
+            data["entry-class"] = entry_class
+        if parallelism is not None:
+            if parallelism < 0:
+                raise RestException(
+                    "get_plan method's parallelism parameter must be a positive integer."
+                )
+            data["parallelism"] = parallelism
+        if savepoint_path is not None:
+            data["savepointPath"] = savepoint_path
+        if allow_non_restored_state is not None:
+            data["allowNonRestoredState"] = allow_non_restored_state
+
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{jar_id}/run",
+                http_method="POST",
+                json=data,
+                session=self._session,
+            )
+        )["jobid"]
+
+    async def upload_and_run(
+        self,
+        path_to_jar,
+        arguments=None,
+        entry_class=None,
+        parallelism=None,
+        savepoint_path=None,
+        allow_non_restored_state=None,
+    ):
+        """
+        Helper method to upload and start a jar in one method call.
+        """
+        result = await self.upload(path_to_jar=path_to_jar)
+        if not result["status"] == "success":
+            raise RestException("Could not upload the input jar file.", result)
+
+        return await self.run(
+            ntpath.basename(result["filename"]),
+            arguments=arguments,
+            entry_class=entry_class,
+            parallelism=parallelism,
+            savepoint_path=savepoint_path,
+            allow_non_restored_state=allow_non_restored_state,
+        )
+
+    async def delete(self, jar_id):
+        """
+        Endpoint: [DELETE] /jars/:jarid
+        """
+        res = await _execute_async_rest_request(
+            url=f"{self.prefix}/{jar_id}", http_method="DELETE", session=self._session
+        )
+        if len(res.keys()) < 1:
+            return True
+        else:
+            return False
@@ -0,0 +1,73 @@
+from flink_rest_client.aio import (
+    _execute_async_rest_request,
+    _execute_async_text_request,
+)
+
+
+class AsyncJobmanagerClient:
+    """
+    Async counterpart of JobmanagerClient. The parameters and return values are documented on the synchronous client.
+    """
+
+    def __init__(self, prefix, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self.prefix = f"{prefix}/jobmanager"
+        self._session = session
+
+    async def config(self):
+        """
+        Endpoint: [GET] /jobmanager/config
+        """
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/config", session=self._session
+        )
+        return dict([(elem["key"], elem["value"]) for elem in query_result])
+
+    async def logs(self):
+        """
+        Endpoint: [GET] /jobmanager/logs
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/logs", session=self._session
+            )
+        )["logs"]
+
+    async def get_log(self, log_file):
+        """
+        Endpoint: [GET] /jobmanager/logs/:log_file
+        """
+        return await _execute_async_text_request(
+            url=f"{self.prefix}/logs/{log_file}", session=self._session
+        )
+
+    async def metric_names(self):
+        """
+        Return the supported metric names.
+        """
+        return [
+            elem["id"]
+            for elem in await _execute_async_rest_request(
+                url=f"{self.prefix}/metrics", session=self._session
+            )
+        ]
+
+    async def metrics(self):
+        """
+        Endpoint: [GET] /jobmanager/metrics
+        """
+        metric_names = await self.metric_names()
+        params = {"get": ",".join(metric_names)}
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/metrics", params=params, session=self._session
+        )
+        return dict([(elem["id"], elem["value"]) for elem in query_result])
@@ -0,0 +1,546 @@
+import asyncio
+
+from flink_rest_client.aio import _execute_async_rest_request
+from flink_rest_client.common import RestException
+
+
+class AsyncJobTrigger:
+    def __init__(self, prefix, type_name, job_id, trigger_id, session):
+        self._prefix = prefix
+        self._type_name = type_name
+        self._session = session
+        self.job_id = job_id
+        self.trigger_id = trigger_id
+
+    async def status(self):
+        return await _execute_async_rest_request(
+            url=f"{self._prefix}/{self.job_id}/{self._type_name}/{self.trigger_id}",
+            session=self._session,
+        )
+
+
+class AsyncJobVertexSubtaskClient:
+    """
+    Async counterpart of JobVertexSubtaskClient. The parameters and return values are documented on the synchronous
+    client.
+    """
+
+    def __init__(self, prefix, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self._prefix = prefix
+        self._session = session
+
+    @property
+    def prefix_url(self):
+        return f"{self._prefix}/subtasks"
+
+    async def subtask_ids(self):
+        """
+        Returns the subtask identifiers.
+        """
+        return [elem["subtask"] for elem in (await self.accumulators())["subtasks"]]
+
+    async def accumulators(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/accumulators
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/accumulators", session=self._session
+        )
+
+    async def metric_names(self):
+        """
+        Returns the supported metric names.
+        """
+        return [
+            elem["id"]
+            for elem in await _execute_async_rest_request(
+                url=f"{self.prefix_url}/metrics", session=self._session
+            )
+        ]
+
+    async def metrics(self, metric_names=None, agg_modes=None, subtask_ids=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+
+        supported_agg_modes = ["min", "max", "sum", "avg"]
+        if agg_modes is None:
+            agg_modes = supported_agg_modes
+        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+            raise RestException(
+                f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+            )
+
+        if subtask_ids is None:
+            subtask_ids = await self.subtask_ids()
+
+        params = {
+            "get": ",".join(metric_names),
+            "agg": ",".join(agg_modes),
+            "subtasks": ",".join([str(elem) for elem in subtask_ids]),
+        }
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix_url}/metrics", params=params, session=self._session
+        )
+
+        result = {}
+        for elem in query_result:
+            metric_name = elem.pop("id")
+            result[metric_name] = elem
+
+        return result
+
+    async def get(self, subtask_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/{subtask_id}", session=self._session
+        )
+
+    async def get_attempt(self, subtask_id, attempt_id=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt
+        """
+        if attempt_id is None:
+            return await self.get(subtask_id)
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}",
+            session=self._session,
+        )
+
+    async def get_attempt_accumulators(self, subtask_id, attempt_id=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt/accumulators
+        """
+        if attempt_id is None:
+            attempt_id = (await self.get(subtask_id))["attempt"]
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}/accumulators",
+            session=self._session,
+        )
+
+
+class AsyncJobVertexClient:
+    """
+    Async counterpart of JobVertexClient. The parameters and return values are documented on the synchronous client.
+    """
+
+    def __init__(self, prefix, job_id, vertex_id, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self._prefix = prefix
+        self._session = session
+        self.job_id = job_id
+        self.vertex_id = vertex_id
+
+    @property
+    def prefix_url(self):
+        return f"{self._prefix}/{self.job_id}/vertices/{self.vertex_id}"
+
+    @property
+    def subtasks(self):
+        return AsyncJobVertexSubtaskClient(self.prefix_url, session=self._session)
+
+    async def details(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid
+        """
+        return await _execute_async_rest_request(
+            url=self.prefix_url, session=self._session
+        )
+
+    async def backpressure(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/backpressure
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/backpressure", session=self._session
+        )
+
+    async def metric_names(self):
+        """
+        Returns the supported metric names.
+        """
+        return [
+            elem["id"]
+            for elem in await _execute_async_rest_request(
+                url=f"{self.prefix_url}/metrics", session=self._session
+            )
+        ]
+
+    async def metrics(self, metric_names=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+
+        params = {"get": ",".join(metric_names)}
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix_url}/metrics", params=params, session=self._session
+        )
+        result = {}
+        for elem in query_result:
+            metric_name = elem.pop("id")
+            result[metric_name] = elem["value"]
+        return result
+
+    async def subtasktimes(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasktimes
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/subtasktimes", session=self._session
+        )
+
+    async def taskmanagers(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/taskmanagers
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/taskmanagers", session=self._session
+        )
+
+    async def watermarks(self):
+        """
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/watermarks
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix_url}/watermarks", session=self._session
+        )
+
+
+class AsyncJobsClient:
+    """
+    Async counterpart of JobsClient. The parameters and return values are documented on the synchronous client.
+    """
+
+    def __init__(self, prefix, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self.prefix = f"{prefix}/jobs"
+        self._session = session
+
+    async def all(self):
+        """
+        Endpoint: [GET] /jobs
+        """
+        return (
+            await _execute_async_rest_request(url=self.prefix, session=self._session)
+        )["jobs"]
+
+    async def job_ids(self):
+        """
+        Returns the list of job_ids.
+        """
+        return [elem["id"] for elem in await self.all()]
+
+    async def overview(self):
+        """
+        Endpoint: [GET] /jobs/overview
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/overview", session=self._session
+            )
+        )["jobs"]
+
+    async def metric_names(self):
+        """
+        Returns the supported metric names.
+        """
+        return [
+            elem["id"]
+            for elem in await _execute_async_rest_request(
+                url=f"{self.prefix}/metrics", session=self._session
+            )
+        ]
+
+    async def metrics(self, metric_names=None, agg_modes=None, job_ids=None):
+        """
+        Endpoint: [GET] /jobs/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+
+        supported_agg_modes = ["min", "max", "sum", "avg"]
+        if agg_modes is None:
+            agg_modes = supported_agg_modes
+        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+            raise RestException(
+                f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+            )
+
+        if job_ids is None:
+            job_ids = await self.job_ids()
+
+        params = {
+            "get": ",".join(metric_names),
+            "agg": ",".join(agg_modes),
+            "jobs": ",".join(job_ids),
+        }
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/metrics", params=params, session=self._session
+        )
+
+        result = {}
+        for elem in query_result:
+            metric_name = elem.pop("id")
+            result[metric_name] = elem
+
+        return result
+
+    async def get(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}", session=self._session
+        )
+
+    async def get_config(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/config
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/config", session=self._session
+        )
+
+    async def get_exceptions(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/exceptions
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/exceptions", session=self._session
+        )
+
+    async def get_execution_result(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/execution-result
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/execution-result", session=self._session
+        )
+
+    async def get_metrics(self, job_id, metric_names=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+        params = {"get": ",".join(metric_names)}
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/metrics", params=params, session=self._session
+        )
+        return dict([(elem["id"], elem["value"]) for elem in query_result])
+
+    async def get_plan(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/plan
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{job_id}/plan", session=self._session
+            )
+        )["plan"]
+
+    async def get_vertex_ids(self, job_id):
+        """
+        Returns the ids of vertices of the selected job.
+        """
+        return [elem["id"] for elem in (await self.get(job_id))["vertices"]]
+
+    async def get_accumulators(self, job_id, include_serialized_value=None):
+        """
+        Endpoint: [GET] /jobs/:jobid/accumulators
+        """
+        params = {}
+        if include_serialized_value is not None:
+            params["includeSerializedValue"] = (
+                "true" if include_serialized_value else "false"
+            )
+
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/accumulators",
+            params=params,
+            session=self._session,
+        )
+
+    async def get_checkpointing_configuration(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/checkpoints/config
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/checkpoints/config", session=self._session
+        )
+
+    async def get_checkpoints(self, job_id):
+        """
+        Endpoint: [GET] /jobs/:jobid/checkpoints
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/checkpoints", session=self._session
+        )
+
+    async def get_checkpoint_ids(self, job_id):
+        """
+        Returns checkpoint ids of the job_id.
+        """
+        return [
+            elem["id"]
+            for elem in (await self.get_checkpoints(job_id=job_id))["history"]
+        ]
+
+    async def get_checkpoint_details(
+        self, job_id, checkpoint_id, show_subtasks=False, max_workers=None
+    ):
+        """
+        Endpoint: [GET] /jobs/:jobid/checkpoints/details/:checkpointid
+
+        If show_subtasks is true:
+        Endpoint: [GET] /jobs/:jobid/checkpoints/details/:checkpointid/subtasks/:vertexid
+
+        At most max_workers (default: 8) per-vertex requests are in flight at once.
+        """
+        checkpoint_details = await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}",
+            session=self._session,
+        )
+        if not show_subtasks:
+            return checkpoint_details
+
+        semaphore = asyncio.Semaphore(8 if max_workers is None else max_workers)
+
+        async def get_subtasks(vertex_id):
+            async with semaphore:
+                return await _execute_async_rest_request(
+                    url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}/subtasks/{vertex_id}",
+                    session=self._session,
+                )
+
+        vertex_ids = list(checkpoint_details["tasks"].keys())
+        subtasks = await asyncio.gather(
+            *[get_subtasks(vertex_id) for vertex_id in vertex_ids],
+            return_exceptions=True,
+        )
+        checkpoint_details["subtasks"] = {
+            vertex_id: result
+            for vertex_id, result in zip(vertex_ids, subtasks)
+            if not isinstance(result, Exception)
+        }
+        checkpoint_details["subtask_errors"] = {
+            vertex_id: result
+            for vertex_id, result in zip(vertex_ids, subtasks)
+            if isinstance(result, Exception)
+        }
+        return checkpoint_details
+
+    async def rescale(self, job_id, parallelism):
+        """
+        Endpoint: [PATCH] /jobs/:jobid/rescaling
+        """
+        params = {"parallelism": parallelism}
+        trigger_id = (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{job_id}/rescaling",
+                http_method="PATCH",
+                params=params,
+                session=self._session,
+            )
+        )["triggerid"]
+        return AsyncJobTrigger(
+            self.prefix, "rescaling", job_id, trigger_id, session=self._session
+        )
+
+    async def create_savepoint(self, job_id, target_directory, cancel_job=False):
+        """
+        Endpoint: [POST] /jobs/:jobid/savepoints
+        """
+        trigger_id = (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{job_id}/savepoints",
+                http_method="POST",
+                accepted_status_code=202,
+                json={"cancel-job": cancel_job, "target-directory": target_directory},
+                session=self._session,
+            )
+        )["request-id"]
+        return AsyncJobTrigger(
+            self.prefix, "savepoints", job_id, trigger_id, session=self._session
+        )
+
+    async def terminate(self, job_id):
+        """
+        Endpoint: [PATCH] /jobs/:jobid
+        """
+        res = await _execute_async_rest_request(
+            url=f"{self.prefix}/{job_id}",
+            http_method="PATCH",
+            accepted_status_code=202,
+            session=self._session,
+        )
+        if len(res) < 1:
+            return True
+        else:
+            return False
+
+    async def stop(self, job_id, target_directory, drain=False):
+        """
+        Endpoint: [POST] /jobs/:jobid/stop
+        """
+        data = {
+            "drain": False if drain is None else drain,
+            "targetDirectory": target_directory,
+        }
+
+        trigger_id = (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{job_id}/stop",
+                http_method="POST",
+                accepted_status_code=202,
+                json=data,
+                session=self._session,
+            )
+        )["request-id"]
+        return AsyncJobTrigger(
+            self.prefix, "savepoints", job_id, trigger_id, session=self._session
+        )
+
+    def get_vertex(self, job_id, vertex_id):
+        """
+        Returns an AsyncJobVertexClient.
+        """
+        return AsyncJobVertexClient(
+            self.prefix, job_id, vertex_id, session=self._session
+        )
@@ -0,0 +1,133 @@
+from flink_rest_client.aio import _execute_async_rest_request
+from flink_rest_client.common import RestException
+
+
+class AsyncTaskManagersClient:
+    """
+    Async counterpart of TaskManagersClient. The parameters and return values are documented on the synchronous
+    client.
+    """
+
+    def __init__(self, prefix, session):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        prefix: str
+            REST API url prefix. It must contain the host, port pair.
+        session: AsyncRestSession
+            Shared non-blocking HTTP session.
+        """
+        self.prefix = f"{prefix}/taskmanagers"
+        self._session = session
+
+    async def all(self):
+        """
+        Endpoint: [GET] /taskmanagers
+        """
+        return (
+            await _execute_async_rest_request(url=self.prefix, session=self._session)
+        )["taskmanagers"]
+
+    async def taskmanager_ids(self):
+        """
+        Returns the list of taskmanager_ids.
+        """
+        return [elem["id"] for elem in await self.all()]
+
+    async def metric_names(self):
+        """
+        Return the supported metric names.
+        """
+        return [
+            elem["id"]
+            for elem in await _execute_async_rest_request(
+                url=f"{self.prefix}/metrics", session=self._session
+            )
+        ]
+
+    async def metrics(self, metric_names=None, agg_modes=None, taskmanager_ids=None):
+        """
+        Endpoint: [GET] /taskmanagers/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+
+        supported_agg_modes = ["min", "max", "sum", "avg"]
+        if agg_modes is None:
+            agg_modes = supported_agg_modes
+        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+            raise RestException(
+                f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+            )
+
+        if taskmanager_ids is None:
+            taskmanager_ids = await self.taskmanager_ids()
+
+        params = {
+            "get": ",".join(metric_names),
+            "agg": ",".join(agg_modes),
+            "taskmanagers": ",".join(taskmanager_ids),
+        }
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/metrics", params=params, session=self._session
+        )
+
+        result = {}
+        for elem in query_result:
+            metric_name = elem.pop("id")
+            result[metric_name] = elem
+
+        return result
+
+    async def get(self, taskmanager_id):
+        """
+        Endpoint: [GET] /taskmanagers/:taskmanagerid
+        """
+        return await _execute_async_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}", session=self._session
+        )
+
+    async def get_logs(self, taskmanager_id):
+        """
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/logs
+        """
+        return (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{taskmanager_id}/logs", session=self._session
+            )
+        )["logs"]
+
+    async def get_metrics(self, taskmanager_id, metric_names=None):
+        """
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/metrics
+        """
+        if metric_names is None:
+            metric_names = await self.metric_names()
+        params = {"get": ",".join(metric_names)}
+
+        query_result = await _execute_async_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}/metrics",
+            params=params,
+            session=self._session,
+        )
+        return dict([(elem["id"], elem["value"]) for elem in query_result])
+
+    async def get_thread_dump(self, taskmanager_id):
+        """
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/thread-dump
+        """
+        query_result = (
+            await _execute_async_rest_request(
+                url=f"{self.prefix}/{taskmanager_id}/thread-dump",
+                session=self._session,
+            )
+        )["threadInfos"]
+        return dict(
+            [
+                (elem["threadName"], elem["stringifiedThreadInfo"])
+                for elem in query_result
+            ]
+        )
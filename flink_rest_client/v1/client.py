@@ -1,44 +1,91 @@
-from flink_rest_client.common import _execute_rest_request
+import time
+
+from flink_rest_client.common import (
+    Deadline,
+    _execute_rest_request,
+    _fan_out,
+    RestSession,
+)
 from flink_rest_client.v1.jars import JarsClient
 from flink_rest_client.v1.jobmanager import JobmanagerClient
 from flink_rest_client.v1.jobs import JobsClient
 from flink_rest_client.v1.taskmanagers import TaskManagersClient
-
-
-class DatasetTrigger:
-    def __init__(self, prefix, trigger_id):
-        self._prefix = prefix
-        self.trigger_id = trigger_id
-
-    @property
-    def status(self):
-        return _execute_rest_request(url=f"{self._prefix}/{self.trigger_id}")
+from flink_rest_client.v1.triggers import DatasetTrigger
 
 
 class FlinkRestClientV1:
-    def __init__(self, host, port):
+    def __init__(
+        self,
+        host,
+        port,
+        session=None,
+        jar_index=None,
+        resource_cache=None,
+        scheme=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        host: str
+            Hostname of Flink Jobmanager
+        port: int
+            Port number.
+        session: RestSession
+            (Optional) HTTP session shared by every sub-client. Default: a new RestSession with default pool settings.
+        jar_index: JarIndex
+            (Optional) Index of the already uploaded jars, used to skip re-uploading unchanged jars. Default: no
+            deduplication.
+        resource_cache: ResourceCache
+            (Optional) Persistent cache of the immutable job resources. Default: no caching.
+        scheme: str
+            (Optional) URL scheme of the REST API, 'http' or 'https'. Default: http
+        """
         self.host = host
         self.port = port
+        self.scheme = "http" if scheme is None else scheme
+        self.session = RestSession() if session is None else session
+        self.jar_index = jar_index
+        self.resource_cache = resource_cache
+
+    def close(self):
+        """
+        Closes the pooled connections of the client.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @property
     def api_url(self):
-        return f"http://{self.host}:{str(self.port)}/v1"
+        return f"{self.scheme}://{self.host}:{str(self.port)}/v1"
 
     @property
     def jobmanager(self):
-        return JobmanagerClient(prefix=self.api_url)
+        return JobmanagerClient(prefix=self.api_url, session=self.session)
 
     @property
     def taskmanagers(self):
-        return TaskManagersClient(prefix=self.api_url)
+        return TaskManagersClient(prefix=self.api_url, session=self.session)
 
     @property
     def jars(self):
-        return JarsClient(prefix=self.api_url)
+        return JarsClient(
+            prefix=self.api_url, session=self.session, jar_index=self.jar_index
+        )
 
     @property
     def jobs(self):
-        return JobsClient(prefix=self.api_url)
+        return JobsClient(
+            prefix=self.api_url,
+            session=self.session,
+            resource_cache=self.resource_cache,
+        )
 
     def overview(self):
         """
@@ -51,7 +98,133 @@ class FlinkRestClientV1:
         dict
             Key-value pairs of flink cluster infos.
         """
-        return _execute_rest_request(url=f"{self.api_url}/overview")
+        return _execute_rest_request(
+            url=f"{self.api_url}/overview", session=self.session
+        )
+
+    def snapshot(
+        self,
+        include_metrics=False,
+        metric_names=None,
+        include_checkpoints=False,
+        job_filter=None,
+        max_workers=None,
+        timeout=None,
+    ):
+        """
+        Collects the state of the whole cluster in one concurrent pass, so the parts of the result are taken at nearly
+        the same time.
+
+        The cluster overview, the job overview and the task managers are fetched concurrently first, then the details
+        (and optionally the metrics and checkpoint statistics) of every job. All requests share one deadline.
+
+        Endpoint: [GET] /overview
+        Endpoint: [GET] /jobs/overview
+        Endpoint: [GET] /taskmanagers
+        Endpoint: [GET] /jobs/:jobid
+        Endpoint: [GET] /jobs/:jobid/metrics
+        Endpoint: [GET] /jobs/:jobid/checkpoints
+
+        Parameters
+        ----------
+        include_metrics: bool
+            (Optional) If it is True, the metrics of every job are collected. Default: False
+        metric_names: list
+            (Optional) Names of the collected job metrics. Default: <all metrics>
+        include_checkpoints: bool
+            (Optional) If it is True, the checkpoint statistics (counts, summary and latest, without the history) of
+            every job are collected. Default: False
+        job_filter: callable
+            (Optional) Function selecting the jobs whose details are collected by their entry of jobs.overview(),
+            e.g. lambda job: job["state"] == "RUNNING". Default: every job.
+        max_workers: int
+            (Optional) Maximum number of concurrent requests. Default: 16
+        timeout: float
+            (Optional) Time budget in seconds of the whole snapshot. Parts that do not arrive in time are reported in
+            'errors'. Default: no deadline.
+
+        Returns
+        -------
+        dict
+            'overview', 'jobs_overview', 'taskmanagers', 'jobs' (job_id -> details), 'job_metrics' and
+            'checkpoints' (job_id -> value, if requested), 'timestamps' (part -> epoch seconds of its arrival, e.g.
+            'overview' or 'jobs/<job_id>'), 'errors' (part -> RestException of the missing parts), 'started',
+            'finished' and 'skew' (seconds between the first and the last arrived part).
+        """
+        max_workers = 16 if max_workers is None else max_workers
+        jobs = self.jobs
+        timestamps = {}
+
+        def timestamped(name, load):
+            value = load()
+            timestamps[name] = time.time()
+            return value
+
+        started = time.time()
+        with Deadline(timeout):
+            cluster_parts = {
+                "overview": self.overview,
+                "jobs_overview": jobs.overview,
+                "taskmanagers": self.taskmanagers.all,
+            }
+            results, errors = _fan_out(
+                lambda name: timestamped(name, cluster_parts[name]),
+                cluster_parts,
+                max_workers=max_workers,
+            )
+
+            job_ids = [
+                job["jid"]
+                for job in results.get("jobs_overview", [])
+                if job_filter is None or job_filter(job)
+            ]
+            job_parts = {"jobs": jobs.get}
+            if include_metrics:
+                job_parts["job_metrics"] = lambda job_id: jobs.get_metrics(
+                    job_id, metric_names
+                )
+            if include_checkpoints:
+                job_parts["checkpoints"] = lambda job_id: {
+                    key: value
+                    for key, value in jobs.get_checkpoints(job_id).items()
+                    if key != "history"
+                }
+            job_results, job_errors = _fan_out(
+                lambda part: timestamped(
+                    f"{part[0]}/{part[1]}", lambda: job_parts[part[0]](part[1])
+                ),
+                [(kind, job_id) for job_id in job_ids for kind in job_parts],
+                max_workers=max_workers,
+            )
+
+        snapshot = {
+            name: results.get(name)
+            for name in ["overview", "jobs_overview", "taskmanagers"]
+        }
+        for kind in job_parts:
+            snapshot[kind] = {
+                job_id: job_results[(kind, job_id)]
+                for job_id in job_ids
+                if (kind, job_id) in job_results
+            }
+        errors.update(
+            (f"{kind}/{job_id}", exc) for (kind, job_id), exc in job_errors.items()
+        )
+        # Calls abandoned at the deadline may still finish, only the collected parts are reported.
+        timestamps = {
+            name: arrived
+            for name, arrived in list(timestamps.items())
+            if name in results or tuple(name.split("/", 1)) in job_results
+        }
+        arrivals = list(timestamps.values())
+        snapshot.update(
+            timestamps=timestamps,
+            errors=errors,
+            started=started,
+            finished=time.time(),
+            skew=max(arrivals) - min(arrivals) if arrivals else 0.0,
+        )
+        return snapshot
 
     def config(self):
         """
@@ -64,7 +237,9 @@ class FlinkRestClientV1:
         dict
             Query result as a dict.
         """
-        return _execute_rest_request(url=f"{self.api_url}/config", http_method="GET")
+        return _execute_rest_request(
+            url=f"{self.api_url}/config", http_method="GET", session=self.session
+        )
 
     def delete_cluster(self):
         """
@@ -78,7 +253,7 @@ class FlinkRestClientV1:
             Result of delete operation.
         """
         return _execute_rest_request(
-            url=f"{self.api_url}/cluster", http_method="DELETE"
+            url=f"{self.api_url}/cluster", http_method="DELETE", session=self.session
         )
 
     def datasets(self):
@@ -92,9 +267,9 @@ class FlinkRestClientV1:
         list
             Query result as a list of datasets.
         """
-        return _execute_rest_request(url=f"{self.api_url}/datasets", http_method="GET")[
-            "dataSets"
-        ]
+        return _execute_rest_request(
+            url=f"{self.api_url}/datasets", http_method="GET", session=self.session
+        )["dataSets"]
 
     def delete_dataset(self, dataset_id):
         """
@@ -117,7 +292,10 @@ class FlinkRestClientV1:
             url=f"{self.api_url}/datasets/{dataset_id}",
             http_method="DELETE",
             accepted_status_code=202,
+            session=self.session,
         )["request-id"]
         return DatasetTrigger(
-            prefix=f"{self.api_url}/datasets/delete", trigger_id=trigger_id
+            prefix=f"{self.api_url}/datasets/delete",
+            trigger_id=trigger_id,
+            session=self.session,
         )
@@ -0,0 +1,382 @@
+from flink_rest_client.common import Deadline, _fan_out, RestException
+
+# Levels of the job topology below the jobs, from the top to the bottom. The accumulators belong to the attempts.
+LEVELS = ("vertices", "subtasks", "attempts", "accumulators")
+
+
+class AttemptNode:
+    """
+    Execution attempt of a subtask.
+
+    Attributes
+    ----------
+    attempt: int
+        Number of the attempt, 0 for the first execution.
+    status: str
+        Execution state, e.g. 'RUNNING' or 'FAILED'.
+    host: str
+        Host of the TaskManager that executes the attempt.
+    start_time: int
+        Start of the attempt in epoch milliseconds.
+    end_time: int
+        End of the attempt in epoch milliseconds, -1 if it is still running.
+    duration: int
+        Duration of the attempt in milliseconds.
+    accumulators: list
+        User-defined accumulators of the attempt, or None if they were not crawled.
+    """
+
+    __slots__ = (
+        "attempt",
+        "status",
+        "host",
+        "start_time",
+        "end_time",
+        "duration",
+        "accumulators",
+    )
+
+    def __init__(self, details):
+        self.attempt = details["attempt"]
+        self.status = details.get("status")
+        self.host = details.get("host")
+        self.start_time = details.get("start-time")
+        self.end_time = details.get("end-time")
+        self.duration = details.get("duration")
+        self.accumulators = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SubtaskNode:
+    """
+    Subtask of a vertex.
+
+    Attributes
+    ----------
+    index: int
+        Index of the subtask.
+    attempts: list
+        AttemptNode objects in the order of their number, the last one is the current attempt. The previous
+        attempts are present only if the 'attempts' level was crawled.
+    """
+
+    __slots__ = ("index", "attempts")
+
+    def __init__(self, index, attempts):
+        self.index = index
+        self.attempts = attempts
+
+    @property
+    def current(self):
+        return self.attempts[-1]
+
+    @property
+    def status(self):
+        return self.current.status
+
+    @property
+    def host(self):
+        return self.current.host
+
+    def as_dict(self):
+        return {
+            "index": self.index,
+            "attempts": [attempt.as_dict() for attempt in self.attempts],
+        }
+
+
+class VertexNode:
+    """
+    Vertex (task) of a job.
+
+    Attributes
+    ----------
+    vertex_id: str
+        32-character hexadecimal string value that identifies the vertex.
+    name: str
+        Name of the vertex.
+    parallelism: int
+        Number of subtasks.
+    status: str
+        Aggregated execution state of the subtasks.
+    subtasks: list
+        SubtaskNode objects in the order of their index, or None if the 'subtasks' level was not crawled.
+    """
+
+    __slots__ = ("vertex_id", "name", "parallelism", "status", "subtasks")
+
+    def __init__(self, summary):
+        self.vertex_id = summary["id"]
+        self.name = summary.get("name")
+        self.parallelism = summary.get("parallelism")
+        self.status = summary.get("status")
+        self.subtasks = None
+
+    def as_dict(self):
+        return {
+            "vertex_id": self.vertex_id,
+            "name": self.name,
+            "parallelism": self.parallelism,
+            "status": self.status,
+            "subtasks": (
+                None
+                if self.subtasks is None
+                else [subtask.as_dict() for subtask in self.subtasks]
+            ),
+        }
+
+
+class JobNode:
+    """
+    Root of the topology of a job.
+
+    Attributes
+    ----------
+    job_id: str
+        32-character hexadecimal string value that identifies the job.
+    name: str
+        Name of the job.
+    state: str
+        State of the job.
+    start_time: int
+        Start of the job in epoch milliseconds.
+    end_time: int
+        End of the job in epoch milliseconds, -1 if it is still running.
+    vertices: list
+        VertexNode objects in the order of the job details, or None if the 'vertices' level was not crawled.
+    """
+
+    __slots__ = ("job_id", "name", "state", "start_time", "end_time", "vertices")
+
+    def __init__(self, details, with_vertices):
+        self.job_id = details["jid"]
+        self.name = details.get("name")
+        self.state = details.get("state")
+        self.start_time = details.get("start-time")
+        self.end_time = details.get("end-time")
+        self.vertices = (
+            [VertexNode(summary) for summary in details.get("vertices", [])]
+            if with_vertices
+            else None
+        )
+
+    def as_dict(self):
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "state": self.state,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "vertices": (
+                None
+                if self.vertices is None
+                else [vertex.as_dict() for vertex in self.vertices]
+            ),
+        }
+
+
+class JobTopology:
+    """
+    Result of a crawl.
+
+    Attributes
+    ----------
+    jobs: dict
+        job_id -> JobNode of the crawled jobs.
+    errors: dict
+        Path of the missing parts -> exception, e.g. 'jobs/<job_id>/vertices/<vertex_id>'. The children of a
+        missing part are not crawled.
+    """
+
+    def __init__(self, jobs, errors):
+        self.jobs = jobs
+        self.errors = errors
+
+    def iter_subtasks(self):
+        """
+        Returns a generator of (JobNode, VertexNode, SubtaskNode) triples of the crawled subtasks.
+        """
+        for job in self.jobs.values():
+            for vertex in job.vertices or []:
+                for subtask in vertex.subtasks or []:
+                    yield job, vertex, subtask
+
+    def as_dict(self):
+        return {
+            "jobs": {job_id: job.as_dict() for job_id, job in self.jobs.items()},
+            "errors": {path: repr(exc) for path, exc in self.errors.items()},
+        }
+
+
+def _vertex_path(job_id, vertex_id):
+    return f"jobs/{job_id}/vertices/{vertex_id}"
+
+
+def crawl_topology(jobs, job_ids=None, levels=None, max_workers=None, timeout=None):
+    """
+    Walks the job -> vertex -> subtask -> attempt hierarchy of many jobs concurrently, one level at a time, and
+    returns a compact in-memory tree of it, e.g. for the forensics of a failover.
+
+    Every part is requested only once. The vertices come with the job details and the current attempts of all
+    subtasks of a vertex come with the vertex details, so neither the subtasks nor their attempt numbers are looked
+    up one by one. The accumulators of the current attempts are requested per vertex, and only the previous attempts
+    of the restarted subtasks are requested individually.
+
+    Endpoint: [GET] /jobs/:jobid
+    Endpoint: [GET] /jobs/:jobid/vertices/:vertexid
+    Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/accumulators
+    Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt
+    Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt/accumulators
+
+    Parameters
+    ----------
+    jobs: JobsClient
+        Client of the crawled cluster.
+    job_ids: list
+        (Optional) Ids of the crawled jobs. Default: every job.
+    levels: list
+        (Optional) Crawled levels: 'vertices', 'subtasks', 'attempts' (the previous attempts of the subtasks) and
+        'accumulators'. The levels the selected ones depend on are crawled as well. Default: every level.
+    max_workers: int
+        (Optional) Maximum number of concurrent requests. Default: 16
+    timeout: float
+        (Optional) Time budget in seconds of the whole crawl. Parts that do not arrive in time are reported in
+        'errors'. Default: no deadline.
+
+    Returns
+    -------
+    JobTopology
+        The crawled jobs and the errors.
+    """
+    levels = set(LEVELS if levels is None else levels)
+    if len(levels.difference(LEVELS)) > 0:
+        raise RestException(
+            f"The provided levels list contains invalid value. Supported levels: {','.join(LEVELS)}; given list: "
+            f"{','.join(sorted(levels))}"
+        )
+    if "attempts" in levels or "accumulators" in levels:
+        levels.add("subtasks")
+    if "subtasks" in levels:
+        levels.add("vertices")
+    max_workers = 16 if max_workers is None else max_workers
+    errors = {}
+
+    with Deadline(timeout):
+        if job_ids is None:
+            job_ids = jobs.job_ids()
+        job_ids = list(dict.fromkeys(job_ids))
+
+        details, job_errors = _fan_out(jobs.get, job_ids, max_workers=max_workers)
+        errors.update((f"jobs/{job_id}", exc) for job_id, exc in job_errors.items())
+        topology = {
+            job_id: JobNode(details[job_id], "vertices" in levels)
+            for job_id in job_ids
+            if job_id in details
+        }
+        if "subtasks" not in levels:
+            return JobTopology(topology, errors)
+
+        vertex_parts = {
+            "details": lambda vertex: vertex.details(),
+        }
+        if "accumulators" in levels:
+            vertex_parts["accumulators"] = lambda vertex: vertex.subtasks.accumulators()
+        items = [
+            (kind, job.job_id, vertex.vertex_id)
+            for job in topology.values()
+            for vertex in job.vertices
+            for kind in vertex_parts
+        ]
+        results, vertex_errors = _fan_out(
+            lambda item: vertex_parts[item[0]](jobs.get_vertex(item[1], item[2])),
+            items,
+            max_workers=max_workers,
+        )
+        for (kind, job_id, vertex_id), exc in vertex_errors.items():
+            path = _vertex_path(job_id, vertex_id)
+            errors[path if kind == "details" else f"{path}/subtasks/accumulators"] = exc
+
+        restarted = []
+        for job in topology.values():
+            for vertex in job.vertices:
+                vertex_details = results.get(("details", job.job_id, vertex.vertex_id))
+                if vertex_details is None:
+                    continue
+                vertex.subtasks = [
+                    SubtaskNode(summary["subtask"], [AttemptNode(summary)])
+                    for summary in vertex_details["subtasks"]
+                ]
+                accumulators = results.get(
+                    ("accumulators", job.job_id, vertex.vertex_id)
+                )
+                if accumulators is not None:
+                    by_index = {
+                        elem["subtask"]: elem for elem in accumulators["subtasks"]
+                    }
+                    for subtask in vertex.subtasks:
+                        elem = by_index.get(subtask.index)
+                        # The subtask may have been restarted between the two requests.
+                        if (
+                            elem is not None
+                            and elem["attempt"] == subtask.current.attempt
+                        ):
+                            subtask.current.accumulators = elem["user-accumulators"]
+                if "attempts" in levels:
+                    restarted.extend(
+                        (job.job_id, vertex, subtask)
+                        for subtask in vertex.subtasks
+                        if subtask.current.attempt > 0
+                    )
+        if len(restarted) == 0:
+            return JobTopology(topology, errors)
+
+        attempt_parts = {
+            "details": lambda subtasks, index, attempt: subtasks.get_attempt(
+                index, attempt
+            ),
+        }
+        if "accumulators" in levels:
+            attempt_parts["accumulators"] = (
+                lambda subtasks, index, attempt: subtasks.get_attempt_accumulators(
+                    index, attempt
+                )
+            )
+        items = [
+            (kind, job_id, vertex.vertex_id, subtask.index, attempt)
+            for job_id, vertex, subtask in restarted
+            for attempt in range(subtask.current.attempt)
+            for kind in attempt_parts
+        ]
+        results, attempt_errors = _fan_out(
+            lambda item: attempt_parts[item[0]](
+                jobs.get_vertex(item[1], item[2]).subtasks, item[3], item[4]
+            ),
+            items,
+            max_workers=max_workers,
+        )
+        for (kind, job_id, vertex_id, index, attempt), exc in attempt_errors.items():
+            path = (
+                f"{_vertex_path(job_id, vertex_id)}/subtasks/{index}/attempts/{attempt}"
+            )
+            errors[path if kind == "details" else f"{path}/accumulators"] = exc
+
+        for job_id, vertex, subtask in restarted:
+            previous = []
+            for attempt in range(subtask.current.attempt):
+                attempt_details = results.get(
+                    ("details", job_id, vertex.vertex_id, subtask.index, attempt)
+                )
+                if attempt_details is None:
+                    continue
+                node = AttemptNode(attempt_details)
+                accumulators = results.get(
+                    ("accumulators", job_id, vertex.vertex_id, subtask.index, attempt)
+                )
+                if accumulators is not None:
+                    node.accumulators = accumulators["user-accumulators"]
+                previous.append(node)
+            subtask.attempts[:0] = previous
+
+    return JobTopology(topology, errors)
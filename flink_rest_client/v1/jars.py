@@ -1,11 +1,13 @@
 import ntpath
-import os
 
-from flink_rest_client.common import _execute_rest_request, RestException
+from flink_rest_client.common import _execute_rest_request, Deadline, RestException
+from flink_rest_client.jar_index import _file_digest
+from flink_rest_client.multipart import MultipartFileEncoder
+from flink_rest_client.tracing import _traced
 
 
 class JarsClient:
-    def __init__(self, prefix):
+    def __init__(self, prefix, session=None, jar_index=None):
         """
         Constructor.
 
@@ -13,8 +15,22 @@ class JarsClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
+        jar_index: JarIndex
+            (Optional) Index of the already uploaded jars. If it is set, jars whose content is still available on the
+            cluster are not uploaded again. Default: every jar is uploaded.
         """
         self.prefix = f"{prefix}/jars"
+        self._session = session
+        self._jar_index = jar_index
+
+    def _invalidate_cache(self, jar_id=None):
+        # The cached jar list is outdated after a jar has been uploaded or deleted.
+        if self._session is not None:
+            self._session.invalidate_cache(f"{self.prefix}?")
+            if jar_id is not None:
+                self._session.invalidate_cache(f"{self.prefix}/{jar_id}")
 
     def all(self):
         """
@@ -27,9 +43,10 @@ class JarsClient:
         dict
             List all the jars were previously uploaded.
         """
-        return _execute_rest_request(url=self.prefix)
+        return _execute_rest_request(url=self.prefix, session=self._session)
 
-    def upload(self, path_to_jar):
+    @_traced
+    def upload(self, path_to_jar, chunk_size=None, progress_callback=None):
         """
         Uploads a jar to the cluster from the input path. The jar's name will be the original filename from the input
         path.
@@ -41,18 +58,52 @@ class JarsClient:
         path_to_jar: str
             Path to the jar file.
 
+        chunk_size: int
+            (Optional) The jar is streamed to the cluster in chunks of chunk_size bytes. Default: 1048576
+
+        progress_callback: callable
+            (Optional) Function called after every sent chunk with the number of bytes sent so far, the total number of
+            bytes and the average throughput in bytes per second.
+
         Returns
         -------
         dict
-            Result of jar upload.
+            Result of jar upload. If the jar is deduplicated through the jar index, the result of the earlier upload.
         """
-        filename = os.path.basename(path_to_jar)
-        files = {
-            "file": (filename, (open(path_to_jar, "rb")), "application/x-java-archive")
-        }
-        return _execute_rest_request(
-            url=f"{self.prefix}/upload", http_method="POST", files=files
+        if self._jar_index is None:
+            return self._upload(path_to_jar, chunk_size, progress_callback)
+
+        digest = _file_digest(path_to_jar)
+        result = self._jar_index.lookup(self.prefix, digest)
+        if result is not None:
+            jar_id = ntpath.basename(result["filename"])
+            if jar_id in [elem["id"] for elem in self.all()["files"]]:
+                return result
+            # The jar has been deleted from the cluster since its upload.
+            self._jar_index.discard(self.prefix, digest)
+
+        result = self._upload(path_to_jar, chunk_size, progress_callback)
+        if result["status"] == "success":
+            self._jar_index.store(self.prefix, digest, result)
+        return result
+
+    def _upload(self, path_to_jar, chunk_size, progress_callback):
+        encoder = MultipartFileEncoder(
+            "file",
+            path_to_jar,
+            content_type="application/x-java-archive",
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+        )
+        result = _execute_rest_request(
+            url=f"{self.prefix}/upload",
+            http_method="POST",
+            data=encoder,
+            headers=encoder.headers,
+            session=self._session,
         )
+        self._invalidate_cache()
+        return result
 
     def get_plan(self, jar_id):
         """
@@ -77,7 +128,9 @@ class JarsClient:
             If the jar_id does not exist.
         """
         return _execute_rest_request(
-            url=f"{self.prefix}/{jar_id}/plan", http_method="POST"
+            url=f"{self.prefix}/{jar_id}/plan",
+            http_method="POST",
+            session=self._session,
         )["plan"]
 
     def run(
@@ -144,9 +197,13 @@ class JarsClient:
             data["allowNonRestoredState"] = allow_non_restored_state
 
         return _execute_rest_request(
-            url=f"{self.prefix}/{jar_id}/run", http_method="POST", json=data
+            url=f"{self.prefix}/{jar_id}/run",
+            http_method="POST",
+            json=data,
+            session=self._session,
         )["jobid"]
 
+    @_traced
     def upload_and_run(
         self,
         path_to_jar,
@@ -155,6 +212,9 @@ class JarsClient:
         parallelism=None,
         savepoint_path=None,
         allow_non_restored_state=None,
+        chunk_size=None,
+        progress_callback=None,
+        timeout=None,
     ):
         """
         Helper method to upload and start a jar in one method call.
@@ -181,6 +241,16 @@ class JarsClient:
              (Optional) Boolean value that specifies whether the job submission should be rejected if the savepoint
              contains state that cannot be mapped back to the job.
 
+        chunk_size: int
+            (Optional) The jar is streamed to the cluster in chunks of chunk_size bytes. Default: 1048576
+
+        progress_callback: callable
+            (Optional) Function called after every sent chunk with the number of bytes sent so far, the total number of
+            bytes and the average throughput in bytes per second.
+
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         str
@@ -191,18 +261,23 @@ class JarsClient:
         RestException
             If an error occurred during the upload of jar file.
         """
-        result = self.upload(path_to_jar=path_to_jar)
-        if not result["status"] == "success":
-            raise RestException("Could not upload the input jar file.", result)
-
-        return self.run(
-            ntpath.basename(result["filename"]),
-            arguments=arguments,
-            entry_class=entry_class,
-            parallelism=parallelism,
-            savepoint_path=savepoint_path,
-            allow_non_restored_state=allow_non_restored_state,
-        )
+        with Deadline(timeout):
+            result = self.upload(
+                path_to_jar=path_to_jar,
+                chunk_size=chunk_size,
+                progress_callback=progress_callback,
+            )
+            if not result["status"] == "success":
+                raise RestException("Could not upload the input jar file.", result)
+
+            return self.run(
+                ntpath.basename(result["filename"]),
+                arguments=arguments,
+                entry_class=entry_class,
+                parallelism=parallelism,
+                savepoint_path=savepoint_path,
+                allow_non_restored_state=allow_non_restored_state,
+            )
 
     def delete(self, jar_id):
         """
@@ -226,7 +301,10 @@ class JarsClient:
         RestException
             If the jar_id does not exist.
         """
-        res = _execute_rest_request(url=f"{self.prefix}/{jar_id}", http_method="DELETE")
+        res = _execute_rest_request(
+            url=f"{self.prefix}/{jar_id}", http_method="DELETE", session=self._session
+        )
+        self._invalidate_cache(jar_id)
         if len(res.keys()) < 1:
             return True
         else:
@@ -1,10 +1,16 @@
-import requests
-
-from flink_rest_client.common import _execute_rest_request, RestException
+from flink_rest_client.common import (
+    _cached_metadata,
+    Deadline,
+    _download_rest_request,
+    _execute_rest_request,
+    _query_metrics,
+    _stream_rest_request,
+)
+from flink_rest_client.tracing import _traced
 
 
 class JobmanagerClient:
-    def __init__(self, prefix):
+    def __init__(self, prefix, session=None):
         """
         Constructor.
 
@@ -12,8 +18,11 @@ class JobmanagerClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
         """
         self.prefix = f"{prefix}/jobmanager"
+        self._session = session
 
     def config(self):
         """
@@ -26,7 +35,9 @@ class JobmanagerClient:
         dict
             Cluster configuration dictionary.
         """
-        query_result = _execute_rest_request(url=f"{self.prefix}/config")
+        query_result = _execute_rest_request(
+            url=f"{self.prefix}/config", session=self._session
+        )
         return dict([(elem["key"], elem["value"]) for elem in query_result])
 
     def logs(self):
@@ -40,7 +51,9 @@ class JobmanagerClient:
         dict
             List of log files
         """
-        return _execute_rest_request(url=f"{self.prefix}/logs")["logs"]
+        return _execute_rest_request(url=f"{self.prefix}/logs", session=self._session)[
+            "logs"
+        ]
 
     def get_log(self, log_file):
         """
@@ -57,17 +70,58 @@ class JobmanagerClient:
         str
             The content of the log file as a string
         """
-        response = requests.request(method="GET", url=f"{self.prefix}/logs/{log_file}")
-        if response.status_code == 200:
-            return response.content.decode()
-        else:
-            if "errors" in response.json().keys():
-                error_str = "\n".join(response.json()["errors"])
-            else:
-                error_str = ""
-            raise RestException(
-                f"REST response error ({response.status_code}): {error_str}"
-            )
+        return "".join(self.stream_log(log_file))
+
+    def stream_log(self, log_file, chunk_size=None):
+        """
+        Streams the content of the log_file, so arbitrarily large logs can be processed with constant memory.
+
+        Endpoint: [GET] /jobmanager/logs/:log_file
+
+        Parameters
+        ----------
+        log_file: str
+            Name of the log file.
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            Decoded chunks of complete log lines.
+        """
+        return _stream_rest_request(
+            url=f"{self.prefix}/logs/{log_file}",
+            chunk_size=chunk_size,
+            session=self._session,
+        )
+
+    def download_log(self, log_file, path, buffer_size=None):
+        """
+        Writes the content of the log_file to a local file without holding it in memory.
+
+        Endpoint: [GET] /jobmanager/logs/:log_file
+
+        Parameters
+        ----------
+        log_file: str
+            Name of the log file.
+        path: str
+            Path of the target file.
+        buffer_size: int
+            (Optional) Number of bytes buffered at once. Default: 65536
+
+        Returns
+        -------
+        int
+            Number of written bytes.
+        """
+        return _download_rest_request(
+            url=f"{self.prefix}/logs/{log_file}",
+            path=path,
+            buffer_size=buffer_size,
+            session=self._session,
+        )
 
     def metric_names(self):
         """
@@ -78,24 +132,38 @@ class JobmanagerClient:
         list
             List of metric names.
         """
-        return [
-            elem["id"] for elem in _execute_rest_request(url=f"{self.prefix}/metrics")
-        ]
+        url = f"{self.prefix}/metrics"
+        return _cached_metadata(
+            self._session,
+            url,
+            lambda: [
+                elem["id"]
+                for elem in _execute_rest_request(url=url, session=self._session)
+            ],
+        )
 
-    def metrics(self):
+    @_traced
+    def metrics(self, timeout=None):
         """
         Provides access to job manager metrics.
 
          Endpoint: [GET] /jobmanager/metrics
 
+         Parameters
+         ----------
+         timeout: float
+             (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
          Returns
          -------
          dict
              Jobmanager metrics
         """
-        metric_names = self.metric_names()
-        params = {"get": ",".join(metric_names)}
-        query_result = _execute_rest_request(
-            url=f"{self.prefix}/metrics", params=params
-        )
-        return dict([(elem["id"], elem["value"]) for elem in query_result])
+        with Deadline(timeout):
+            metric_names = self.metric_names()
+            query_result = _query_metrics(
+                url=f"{self.prefix}/metrics",
+                metric_names=metric_names,
+                session=self._session,
+            )
+            return dict([(elem["id"], elem["value"]) for elem in query_result])
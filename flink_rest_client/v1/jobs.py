@@ -1,22 +1,31 @@
-from flink_rest_client.common import _execute_rest_request, RestException
-
-
-class JobTrigger:
-    def __init__(self, prefix, type_name, job_id, trigger_id):
-        self._prefix = prefix
-        self._type_name = type_name
-        self.job_id = job_id
-        self.trigger_id = trigger_id
-
-    @property
-    def status(self):
-        return _execute_rest_request(
-            url=f"{self._prefix}/{self.job_id}/{self._type_name}/{self.trigger_id}"
-        )
+import collections
+import time
+
+from flink_rest_client.common import (
+    _cached_metadata,
+    Deadline,
+    _execute_rest_request,
+    _fan_out,
+    _query_metrics,
+    _stream_json_array,
+    RestException,
+    RestTimeoutException,
+)
+from flink_rest_client.tracing import _traced
+from flink_rest_client.v1.crawler import crawl_topology
+from flink_rest_client.v1.triggers import (
+    JobTrigger,
+    TriggerResult,
+    _budget,
+    _PollScheduler,
+)
+
+# States of a job that never change anymore.
+TERMINAL_JOB_STATES = frozenset(["FINISHED", "CANCELED", "FAILED"])
 
 
 class JobVertexSubtaskClient:
-    def __init__(self, prefix):
+    def __init__(self, prefix, session=None):
         """
         Constructor.
 
@@ -24,8 +33,11 @@ class JobVertexSubtaskClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
         """
         self._prefix = prefix
+        self._session = session
 
     @property
     def prefix_url(self):
@@ -40,7 +52,11 @@ class JobVertexSubtaskClient:
         list
             Positive integer list of subtask ids.
         """
-        return [elem["subtask"] for elem in self.accumulators()["subtasks"]]
+        return _cached_metadata(
+            self._session,
+            self.prefix_url,
+            lambda: [elem["subtask"] for elem in self.accumulators()["subtasks"]],
+        )
 
     def accumulators(self):
         """
@@ -53,7 +69,9 @@ class JobVertexSubtaskClient:
         dict
             User-defined accumulators
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/accumulators")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/accumulators", session=self._session
+        )
 
     def metric_names(self):
         """
@@ -64,12 +82,20 @@ class JobVertexSubtaskClient:
         list
             List of metric names.
         """
-        return [
-            elem["id"]
-            for elem in _execute_rest_request(url=f"{self.prefix_url}/metrics")
-        ]
+        url = f"{self.prefix_url}/metrics"
+        return _cached_metadata(
+            self._session,
+            url,
+            lambda: [
+                elem["id"]
+                for elem in _execute_rest_request(url=url, session=self._session)
+            ],
+        )
 
-    def metrics(self, metric_names=None, agg_modes=None, subtask_ids=None):
+    @_traced
+    def metrics(
+        self, metric_names=None, agg_modes=None, subtask_ids=None, timeout=None
+    ):
         """
         Provides access to aggregated subtask metrics.
         By default it returns with all existing metric names.
@@ -89,42 +115,48 @@ class JobVertexSubtaskClient:
             List of positive integers to select specific subtasks. The list of valid subtask ids is available through
             the subtask_ids() method. Default: <all subtasks>.
 
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Key-value pairs of metrics.
         """
 
-        if metric_names is None:
-            metric_names = self.metric_names()
-
-        supported_agg_modes = ["min", "max", "sum", "avg"]
-        if agg_modes is None:
-            agg_modes = supported_agg_modes
-        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
-            raise RestException(
-                f"The provided aggregation modes list contains invalid value. Supported aggregation "
-                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
+
+            supported_agg_modes = ["min", "max", "sum", "avg"]
+            if agg_modes is None:
+                agg_modes = supported_agg_modes
+            if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+                raise RestException(
+                    f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                    f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+                )
+
+            if subtask_ids is None:
+                subtask_ids = self.subtask_ids()
+
+            params = {
+                "agg": ",".join(agg_modes),
+                "subtasks": ",".join([str(elem) for elem in subtask_ids]),
+            }
+            query_result = _query_metrics(
+                url=f"{self.prefix_url}/metrics",
+                metric_names=metric_names,
+                params=params,
+                session=self._session,
             )
 
-        if subtask_ids is None:
-            subtask_ids = self.subtask_ids()
-
-        params = {
-            "get": ",".join(metric_names),
-            "agg": ",".join(agg_modes),
-            "subtasks": ",".join([str(elem) for elem in subtask_ids]),
-        }
-        query_result = _execute_rest_request(
-            url=f"{self.prefix_url}/metrics", params=params
-        )
-
-        result = {}
-        for elem in query_result:
-            metric_name = elem.pop("id")
-            result[metric_name] = elem
+            result = {}
+            for elem in query_result:
+                metric_name = elem.pop("id")
+                result[metric_name] = elem
 
-        return result
+            return result
 
     def get(self, subtask_id):
         """
@@ -142,7 +174,9 @@ class JobVertexSubtaskClient:
         dict
 
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/{subtask_id}")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/{subtask_id}", session=self._session
+        )
 
     def get_attempt(self, subtask_id, attempt_id=None):
         """
@@ -168,7 +202,8 @@ class JobVertexSubtaskClient:
         if attempt_id is None:
             return self.get(subtask_id)
         return _execute_rest_request(
-            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}"
+            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}",
+            session=self._session,
         )
 
     def get_attempt_accumulators(self, subtask_id, attempt_id=None):
@@ -194,12 +229,13 @@ class JobVertexSubtaskClient:
         if attempt_id is None:
             attempt_id = self.get(subtask_id)["attempt"]
         return _execute_rest_request(
-            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}/accumulators"
+            url=f"{self.prefix_url}/{subtask_id}/attempts/{attempt_id}/accumulators",
+            session=self._session,
         )
 
 
 class JobVertexClient:
-    def __init__(self, prefix, job_id, vertex_id):
+    def __init__(self, prefix, job_id, vertex_id, session=None):
         """
         Constructor.
 
@@ -207,8 +243,11 @@ class JobVertexClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
         """
         self._prefix = prefix
+        self._session = session
         self.job_id = job_id
         self.vertex_id = vertex_id
 
@@ -218,7 +257,7 @@ class JobVertexClient:
 
     @property
     def subtasks(self):
-        return JobVertexSubtaskClient(self.prefix_url)
+        return JobVertexSubtaskClient(self.prefix_url, session=self._session)
 
     def details(self):
         """
@@ -231,7 +270,7 @@ class JobVertexClient:
         dict
             details for a task.
         """
-        return _execute_rest_request(url=self.prefix_url)
+        return _execute_rest_request(url=self.prefix_url, session=self._session)
 
     def backpressure(self):
         """
@@ -248,7 +287,9 @@ class JobVertexClient:
         dict
             Backpressure information
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/backpressure")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/backpressure", session=self._session
+        )
 
     def metric_names(self):
         """
@@ -259,34 +300,47 @@ class JobVertexClient:
         list
             List of metric names.
         """
-        return [
-            elem["id"]
-            for elem in _execute_rest_request(url=f"{self.prefix_url}/metrics")
-        ]
+        url = f"{self.prefix_url}/metrics"
+        return _cached_metadata(
+            self._session,
+            url,
+            lambda: [
+                elem["id"]
+                for elem in _execute_rest_request(url=url, session=self._session)
+            ],
+        )
 
-    def metrics(self, metric_names=None):
+    @_traced
+    def metrics(self, metric_names=None, timeout=None):
         """
         Provides access to task metrics.
 
         Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/metrics
 
+        Parameters
+        ----------
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Task metrics.
         """
-        if metric_names is None:
-            metric_names = self.metric_names()
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
 
-        params = {"get": ",".join(metric_names)}
-        query_result = _execute_rest_request(
-            url=f"{self.prefix_url}/metrics", params=params
-        )
-        result = {}
-        for elem in query_result:
-            metric_name = elem.pop("id")
-            result[metric_name] = elem["value"]
-        return result
+            query_result = _query_metrics(
+                url=f"{self.prefix_url}/metrics",
+                metric_names=metric_names,
+                session=self._session,
+            )
+            result = {}
+            for elem in query_result:
+                metric_name = elem.pop("id")
+                result[metric_name] = elem["value"]
+            return result
 
     def subtasktimes(self):
         """
@@ -299,7 +353,9 @@ class JobVertexClient:
         dict
             Time-related information for all subtasks
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/subtasktimes")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/subtasktimes", session=self._session
+        )
 
     def taskmanagers(self):
         """
@@ -312,7 +368,9 @@ class JobVertexClient:
         dict
             Task information aggregated by task manager.
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/taskmanagers")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/taskmanagers", session=self._session
+        )
 
     def watermarks(self):
         """
@@ -325,11 +383,13 @@ class JobVertexClient:
         list
             Watermarks for all subtasks of a task.
         """
-        return _execute_rest_request(url=f"{self.prefix_url}/watermarks")
+        return _execute_rest_request(
+            url=f"{self.prefix_url}/watermarks", session=self._session
+        )
 
 
 class JobsClient:
-    def __init__(self, prefix):
+    def __init__(self, prefix, session=None, resource_cache=None):
         """
         Constructor.
 
@@ -337,8 +397,43 @@ class JobsClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
+        resource_cache: ResourceCache
+            (Optional) Persistent cache of the immutable resources: plans, completed checkpoint details, and the
+            execution results and exceptions of terminated jobs. Default: no caching.
         """
         self.prefix = f"{prefix}/jobs"
+        self._session = session
+        self._resource_cache = resource_cache
+
+    def _immutable_resource(self, job_id, resource, loader, is_final):
+        # A resource is stored only once it cannot change anymore, e.g. when the job has terminated.
+        if self._resource_cache is None:
+            return loader()
+        value = self._resource_cache.get(self.prefix, job_id, resource)
+        if value is None:
+            value = loader()
+            if is_final(value):
+                self._resource_cache.put(self.prefix, job_id, resource, value)
+        return value
+
+    def _is_terminated(self, job_id):
+        if self._resource_cache.get(self.prefix, job_id, "execution-result"):
+            return True
+        return self.get(job_id)["state"] in TERMINAL_JOB_STATES
+
+    def _invalidate_cache(self, job_id):
+        # The cached details of the job and the job lists are outdated after the job has been changed.
+        if self._resource_cache is not None:
+            self._resource_cache.discard(self.prefix, job_id, "plan")
+        if self._session is not None:
+            self._session.invalidate_cache(f"{self.prefix}/{job_id}")
+            self._session.invalidate_cache(f"{self.prefix}/overview")
+            self._session.invalidate_cache(f"{self.prefix}?")
+            # job_ids() is cached under the exact url of the job list.
+            if self._session.metadata_cache is not None:
+                self._session.metadata_cache.invalidate(self.prefix)
 
     def all(self):
         """
@@ -351,7 +446,28 @@ class JobsClient:
         list
             List of jobs and their current state.
         """
-        return _execute_rest_request(url=self.prefix)["jobs"]
+        return _execute_rest_request(url=self.prefix, session=self._session)["jobs"]
+
+    def iter_all(self, chunk_size=None):
+        """
+        Iterates over all jobs and their current state. The response is parsed incrementally, so the memory usage does
+        not grow with the number of jobs.
+
+        Endpoint: [GET] /jobs
+
+        Parameters
+        ----------
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            Jobs and their current state, one at a time.
+        """
+        return _stream_json_array(
+            url=self.prefix, key="jobs", chunk_size=chunk_size, session=self._session
+        )
 
     def job_ids(self):
         """
@@ -362,7 +478,9 @@ class JobsClient:
         list
             List of job ids.
         """
-        return [elem["id"] for elem in self.all()]
+        return _cached_metadata(
+            self._session, self.prefix, lambda: [elem["id"] for elem in self.all()]
+        )
 
     def overview(self):
         """
@@ -375,7 +493,33 @@ class JobsClient:
         list
             List of existing jobs.
         """
-        return _execute_rest_request(url=f"{self.prefix}/overview")["jobs"]
+        return _execute_rest_request(
+            url=f"{self.prefix}/overview", session=self._session
+        )["jobs"]
+
+    def iter_overview(self, chunk_size=None):
+        """
+        Iterates over the overview of all jobs, including the archived ones. The response is parsed incrementally, so
+        the memory usage does not grow with the history of the cluster.
+
+        Endpoint: [GET] /jobs/overview
+
+        Parameters
+        ----------
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            Job overviews, one at a time.
+        """
+        return _stream_json_array(
+            url=f"{self.prefix}/overview",
+            key="jobs",
+            chunk_size=chunk_size,
+            session=self._session,
+        )
 
     def metric_names(self):
         """
@@ -386,11 +530,18 @@ class JobsClient:
         list
             List of metric names.
         """
-        return [
-            elem["id"] for elem in _execute_rest_request(url=f"{self.prefix}/metrics")
-        ]
+        url = f"{self.prefix}/metrics"
+        return _cached_metadata(
+            self._session,
+            url,
+            lambda: [
+                elem["id"]
+                for elem in _execute_rest_request(url=url, session=self._session)
+            ],
+        )
 
-    def metrics(self, metric_names=None, agg_modes=None, job_ids=None):
+    @_traced
+    def metrics(self, metric_names=None, agg_modes=None, job_ids=None, timeout=None):
         """
         Returns an overview over all jobs.
 
@@ -410,41 +561,47 @@ class JobsClient:
             are available through the job_ids() method. Default: <all taskmanagers>.
 
 
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Aggregated job metrics.
         """
-        if metric_names is None:
-            metric_names = self.metric_names()
-
-        supported_agg_modes = ["min", "max", "sum", "avg"]
-        if agg_modes is None:
-            agg_modes = supported_agg_modes
-        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
-            raise RestException(
-                f"The provided aggregation modes list contains invalid value. Supported aggregation "
-                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
+
+            supported_agg_modes = ["min", "max", "sum", "avg"]
+            if agg_modes is None:
+                agg_modes = supported_agg_modes
+            if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+                raise RestException(
+                    f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                    f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+                )
+
+            if job_ids is None:
+                job_ids = self.job_ids()
+
+            params = {
+                "agg": ",".join(agg_modes),
+                "jobs": ",".join(job_ids),
+            }
+            query_result = _query_metrics(
+                url=f"{self.prefix}/metrics",
+                metric_names=metric_names,
+                params=params,
+                session=self._session,
             )
 
-        if job_ids is None:
-            job_ids = self.job_ids()
-
-        params = {
-            "get": ",".join(metric_names),
-            "agg": ",".join(agg_modes),
-            "jobs": ",".join(job_ids),
-        }
-        query_result = _execute_rest_request(
-            url=f"{self.prefix}/metrics", params=params
-        )
-
-        result = {}
-        for elem in query_result:
-            metric_name = elem.pop("id")
-            result[metric_name] = elem
+            result = {}
+            for elem in query_result:
+                metric_name = elem.pop("id")
+                result[metric_name] = elem
 
-        return result
+            return result
 
     def get(self, job_id):
         """
@@ -462,7 +619,9 @@ class JobsClient:
         dict
             Details of the selected job.
         """
-        return _execute_rest_request(url=f"{self.prefix}/{job_id}")
+        return _execute_rest_request(
+            url=f"{self.prefix}/{job_id}", session=self._session
+        )
 
     def get_config(self, job_id):
         """
@@ -480,7 +639,9 @@ class JobsClient:
         dict
             Job configuration
         """
-        return _execute_rest_request(url=f"{self.prefix}/{job_id}/config")
+        return _execute_rest_request(
+            url=f"{self.prefix}/{job_id}/config", session=self._session
+        )
 
     def get_exceptions(self, job_id):
         """
@@ -498,7 +659,17 @@ class JobsClient:
         dict
             The most recent exceptions.
         """
-        return _execute_rest_request(url=f"{self.prefix}/{job_id}/exceptions")
+        url = f"{self.prefix}/{job_id}/exceptions"
+        if self._resource_cache is None:
+            return _execute_rest_request(url=url, session=self._session)
+        exceptions = self._resource_cache.get(self.prefix, job_id, "exceptions")
+        if exceptions is None:
+            # The job is checked first, so exceptions fetched before it terminated are never stored.
+            terminated = self._is_terminated(job_id)
+            exceptions = _execute_rest_request(url=url, session=self._session)
+            if terminated:
+                self._resource_cache.put(self.prefix, job_id, "exceptions", exceptions)
+        return exceptions
 
     def get_execution_result(self, job_id):
         """
@@ -517,9 +688,17 @@ class JobsClient:
         dict
             The execution result of the selected job.
         """
-        return _execute_rest_request(url=f"{self.prefix}/{job_id}/execution-result")
+        return self._immutable_resource(
+            job_id,
+            "execution-result",
+            lambda: _execute_rest_request(
+                url=f"{self.prefix}/{job_id}/execution-result", session=self._session
+            ),
+            lambda result: result["status"]["id"] == "COMPLETED",
+        )
 
-    def get_metrics(self, job_id, metric_names=None):
+    @_traced
+    def get_metrics(self, job_id, metric_names=None, timeout=None):
         """
         Provides access to job metrics.
 
@@ -533,18 +712,23 @@ class JobsClient:
         metric_names: list
             (optional) List of selected specific metric names. Default: <all metrics>
 
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Job metrics.
         """
-        if metric_names is None:
-            metric_names = self.metric_names()
-        params = {"get": ",".join(metric_names)}
-        query_result = _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/metrics", params=params
-        )
-        return dict([(elem["id"], elem["value"]) for elem in query_result])
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
+            query_result = _query_metrics(
+                url=f"{self.prefix}/{job_id}/metrics",
+                metric_names=metric_names,
+                session=self._session,
+            )
+            return dict([(elem["id"], elem["value"]) for elem in query_result])
 
     def get_plan(self, job_id):
         """
@@ -562,7 +746,14 @@ class JobsClient:
         dict
             Dataflow plan
         """
-        return _execute_rest_request(url=f"{self.prefix}/{job_id}/plan")["plan"]
+        return self._immutable_resource(
+            job_id,
+            "plan",
+            lambda: _execute_rest_request(
+                url=f"{self.prefix}/{job_id}/plan", session=self._session
+            ),
+            lambda _: True,
+        )["plan"]
 
     def get_vertex_ids(self, job_id):
         """
@@ -608,7 +799,10 @@ class JobsClient:
             )
 
         return _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/accumulators", http_method="GET", params=params
+            url=f"{self.prefix}/{job_id}/accumulators",
+            http_method="GET",
+            params=params,
+            session=self._session,
         )
 
     def get_checkpointing_configuration(self, job_id):
@@ -628,7 +822,9 @@ class JobsClient:
             Checkpointing configuration of the selected job.
         """
         return _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/checkpoints/config", http_method="GET"
+            url=f"{self.prefix}/{job_id}/checkpoints/config",
+            http_method="GET",
+            session=self._session,
         )
 
     def get_checkpoints(self, job_id):
@@ -648,7 +844,35 @@ class JobsClient:
             Checkpointing statistics for the selected job: counts, summary, latest and history.
         """
         return _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/checkpoints", http_method="GET"
+            url=f"{self.prefix}/{job_id}/checkpoints",
+            http_method="GET",
+            session=self._session,
+        )
+
+    def iter_checkpoints(self, job_id, chunk_size=None):
+        """
+        Iterates over the checkpoint history of a job. The response is parsed incrementally, so the memory usage does
+        not grow with the length of the history.
+
+        Endpoint: [GET] /jobs/:jobid/checkpoints
+
+        Parameters
+        ----------
+        job_id: str
+            32-character hexadecimal string value that identifies a job.
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            Statistics of the checkpoints in the history, one at a time.
+        """
+        return _stream_json_array(
+            url=f"{self.prefix}/{job_id}/checkpoints",
+            key="history",
+            chunk_size=chunk_size,
+            session=self._session,
         )
 
     def get_checkpoint_ids(self, job_id):
@@ -667,7 +891,10 @@ class JobsClient:
         """
         return [elem["id"] for elem in self.get_checkpoints(job_id=job_id)["history"]]
 
-    def get_checkpoint_details(self, job_id, checkpoint_id, show_subtasks=False):
+    @_traced
+    def get_checkpoint_details(
+        self, job_id, checkpoint_id, show_subtasks=False, max_workers=None, timeout=None
+    ):
         """
         Returns details for a checkpoint.
 
@@ -685,27 +912,61 @@ class JobsClient:
             Long value that identifies a checkpoint.
 
         show_subtasks: bool
-            If it is True, the details of the subtask are also returned.
+            If it is True, the details of the subtask are also returned. The per-vertex requests are executed
+            concurrently.
+
+        max_workers: int
+            (Optional) Maximum number of concurrent per-vertex requests. Default: 8
+
+        timeout: float
+            (Optional) Time budget in seconds of the whole call. Vertices whose details do not arrive in time are
+            reported in 'subtask_errors'. Default: no deadline.
 
         Returns
         -------
         dict
+            Checkpoint details. If show_subtasks is True, the 'subtasks' key contains the vertex_id -> subtask details
+            of the successful requests, and the 'subtask_errors' key contains vertex_id -> RestException pairs of the
+            failed (or timed out) ones.
+        """
+        with Deadline(timeout):
+            checkpoint_details = self._immutable_resource(
+                job_id,
+                f"checkpoints/details/{checkpoint_id}",
+                lambda: _execute_rest_request(
+                    url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}",
+                    http_method="GET",
+                    session=self._session,
+                ),
+                lambda details: details["status"] == "COMPLETED",
+            )
+            if not show_subtasks:
+                return checkpoint_details
+            return self._add_checkpoint_subtasks(
+                job_id, checkpoint_id, checkpoint_details, max_workers
+            )
 
-        """
-        checkpoint_details = _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}",
-            http_method="GET",
-        )
-        if not show_subtasks:
-            return checkpoint_details
-
-        subtasks = {}
-        for vertex_id in checkpoint_details["tasks"].keys():
-            subtasks[vertex_id] = _execute_rest_request(
-                url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}/subtasks/{vertex_id}",
-                http_method="GET",
+    def _add_checkpoint_subtasks(
+        self, job_id, checkpoint_id, checkpoint_details, max_workers
+    ):
+
+        def get_subtasks(vertex_id):
+            return self._immutable_resource(
+                job_id,
+                f"checkpoints/details/{checkpoint_id}/subtasks/{vertex_id}",
+                lambda: _execute_rest_request(
+                    url=f"{self.prefix}/{job_id}/checkpoints/details/{checkpoint_id}/subtasks/{vertex_id}",
+                    http_method="GET",
+                    session=self._session,
+                ),
+                lambda _: checkpoint_details["status"] == "COMPLETED",
             )
+
+        subtasks, errors = _fan_out(
+            get_subtasks, checkpoint_details["tasks"].keys(), max_workers=max_workers
+        )
         checkpoint_details["subtasks"] = subtasks
+        checkpoint_details["subtask_errors"] = errors
         return checkpoint_details
 
     def rescale(self, job_id, parallelism):
@@ -733,9 +994,15 @@ class JobsClient:
         """
         params = {"parallelism": parallelism}
         trigger_id = _execute_rest_request(
-            url=f"{self.prefix}/{job_id}/rescaling", http_method="PATCH", params=params
+            url=f"{self.prefix}/{job_id}/rescaling",
+            http_method="PATCH",
+            params=params,
+            session=self._session,
         )["triggerid"]
-        return JobTrigger(self.prefix, "rescaling", job_id, trigger_id)
+        self._invalidate_cache(job_id)
+        return JobTrigger(
+            self.prefix, "rescaling", job_id, trigger_id, session=self._session
+        )
 
     def create_savepoint(self, job_id, target_directory, cancel_job=False):
         """
@@ -768,8 +1035,13 @@ class JobsClient:
             http_method="POST",
             accepted_status_code=202,
             json={"cancel-job": cancel_job, "target-directory": target_directory},
+            session=self._session,
         )["request-id"]
-        return JobTrigger(self.prefix, "savepoints", job_id, trigger_id)
+        if cancel_job:
+            self._invalidate_cache(job_id)
+        return JobTrigger(
+            self.prefix, "savepoints", job_id, trigger_id, session=self._session
+        )
 
     def terminate(self, job_id):
         """
@@ -788,8 +1060,12 @@ class JobsClient:
             True if the job has been canceled, otherwise False.
         """
         res = _execute_rest_request(
-            url=f"{self.prefix}/{job_id}", http_method="PATCH", accepted_status_code=202
+            url=f"{self.prefix}/{job_id}",
+            http_method="PATCH",
+            accepted_status_code=202,
+            session=self._session,
         )
+        self._invalidate_cache(job_id)
         if len(res) < 1:
             return True
         else:
@@ -833,8 +1109,183 @@ class JobsClient:
             http_method="POST",
             accepted_status_code=202,
             json=data,
+            session=self._session,
         )["request-id"]
-        return JobTrigger(self.prefix, "savepoints", job_id, trigger_id)
+        self._invalidate_cache(job_id)
+        return JobTrigger(
+            self.prefix, "savepoints", job_id, trigger_id, session=self._session
+        )
+
+    @_traced
+    def bulk_savepoint(
+        self,
+        target_directory,
+        job_ids=None,
+        predicate=None,
+        cancel_job=False,
+        max_parallelism=None,
+        timeout=None,
+        max_requests_per_second=None,
+    ):
+        """
+        Creates savepoints of many jobs, e.g. before a cluster upgrade. At most max_parallelism savepoints are in
+        progress at once, and the next job is triggered as soon as a savepoint completes.
+
+        Endpoint: [POST] /jobs/:jobid/savepoints
+        Endpoint: [GET] /jobs/:jobid/savepoints/:triggerid
+
+        Parameters
+        ----------
+        target_directory: str
+            Savepoint target directory.
+        job_ids: list
+            (Optional) Ids of the selected jobs. Default: every running job.
+        predicate: callable
+            (Optional) Function selecting jobs by their entry of overview(), e.g.
+            lambda job: job["name"].startswith("etl-"). Default: the running jobs are selected.
+        cancel_job: bool
+            (Optional) If it is True, the jobs are cancelled after the savepoint creation. Default: False
+        max_parallelism: int
+            (Optional) Maximum number of savepoints in progress at once. Default: 8
+        timeout: float
+            (Optional) Time budget in seconds of the whole operation. Default: no deadline.
+        max_requests_per_second: float
+            (Optional) Maximum number of requests per second sent to the JobManager. Default: 20
+
+        Returns
+        -------
+        dict
+            job_id -> TriggerResult pairs in the order the jobs were selected. TriggerResult.as_dict() returns a
+            row of the result table, with savepoint location, failure cause, queueing time and duration.
+        """
+        return self._bulk_operation(
+            lambda job_id: self.create_savepoint(job_id, target_directory, cancel_job),
+            job_ids,
+            predicate,
+            max_parallelism,
+            timeout,
+            max_requests_per_second,
+        )
+
+    @_traced
+    def bulk_stop(
+        self,
+        target_directory,
+        job_ids=None,
+        predicate=None,
+        drain=False,
+        max_parallelism=None,
+        timeout=None,
+        max_requests_per_second=None,
+    ):
+        """
+        Stops many jobs with a savepoint, e.g. before a cluster upgrade. At most max_parallelism jobs are being
+        stopped at once, and the next job is stopped as soon as a savepoint completes.
+
+        Endpoint: [POST] /jobs/:jobid/stop
+        Endpoint: [GET] /jobs/:jobid/savepoints/:triggerid
+
+        Parameters
+        ----------
+        target_directory: str
+            Savepoint target directory.
+        job_ids: list
+            (Optional) Ids of the selected jobs. Default: every running job.
+        predicate: callable
+            (Optional) Function selecting jobs by their entry of overview(). Default: the running jobs are selected.
+        drain: bool
+            (Optional) If it is True, MAX_WATERMARK is emitted before the last checkpoint. Default: False
+        max_parallelism: int
+            (Optional) Maximum number of jobs being stopped at once. Default: 8
+        timeout: float
+            (Optional) Time budget in seconds of the whole operation. Default: no deadline.
+        max_requests_per_second: float
+            (Optional) Maximum number of requests per second sent to the JobManager. Default: 20
+
+        Returns
+        -------
+        dict
+            job_id -> TriggerResult pairs in the order the jobs were selected.
+        """
+        return self._bulk_operation(
+            lambda job_id: self.stop(job_id, target_directory, drain),
+            job_ids,
+            predicate,
+            max_parallelism,
+            timeout,
+            max_requests_per_second,
+        )
+
+    def _select_jobs(self, job_ids, predicate):
+        def is_running(job):
+            return job["state"] == "RUNNING"
+
+        if job_ids is not None and predicate is None:
+            # A job listed twice must not get two savepoints.
+            return list(dict.fromkeys(job_ids))
+        if predicate is None:
+            predicate = is_running
+        return [
+            job["jid"]
+            for job in self.overview()
+            if (job_ids is None or job["jid"] in job_ids) and predicate(job)
+        ]
+
+    def _bulk_operation(
+        self,
+        start_operation,
+        job_ids,
+        predicate,
+        max_parallelism,
+        timeout,
+        max_requests_per_second,
+    ):
+        max_parallelism = 8 if max_parallelism is None else max_parallelism
+        started_at = time.monotonic()
+        scheduler = _PollScheduler(max_requests_per_second)
+        with Deadline(timeout) as deadline:
+            waiting = collections.deque(self._select_jobs(job_ids, predicate))
+            results = dict.fromkeys(waiting)
+            queued = {}
+            while waiting or scheduler:
+                while waiting and len(scheduler) < max_parallelism:
+                    if not scheduler.acquire(deadline):
+                        break
+                    job_id = waiting.popleft()
+                    queued[job_id] = time.monotonic() - started_at
+                    try:
+                        scheduler.add(job_id, start_operation(job_id))
+                    except Exception as exc:
+                        # Any failure is reported per job, the operations already in flight are still tracked.
+                        results[job_id] = TriggerResult(
+                            None, error=exc, queued=queued[job_id], job_id=job_id
+                        )
+                if not scheduler:
+                    if waiting:
+                        # The deadline has passed before the next job could be triggered.
+                        break
+                    continue
+                polled = scheduler.poll_next(deadline)
+                if polled is None:
+                    break
+                job_id, result = polled
+                if result is not None:
+                    result.queued = queued[job_id]
+                    results[job_id] = result
+
+        budget = _budget(deadline, started_at)
+        for job_id, result in scheduler.expire(budget):
+            result.queued = queued[job_id]
+            results[job_id] = result
+        for job_id in waiting:
+            results[job_id] = TriggerResult(
+                None,
+                error=RestTimeoutException(
+                    f"Job {job_id} was not triggered within {budget} seconds."
+                ),
+                job_id=job_id,
+            )
+        return results
 
     def get_vertex(self, job_id, vertex_id):
         """
@@ -852,4 +1303,34 @@ class JobsClient:
         JobVertexClient
             JobVertexClient instance that can execute vertex related queries.
         """
-        return JobVertexClient(self.prefix, job_id, vertex_id)
+        return JobVertexClient(self.prefix, job_id, vertex_id, session=self._session)
+
+    @_traced
+    def topology(self, job_ids=None, levels=None, max_workers=None, timeout=None):
+        """
+        Crawls the vertices, subtasks and execution attempts of many jobs concurrently, and returns them as a compact
+        in-memory tree. See flink_rest_client.v1.crawler.crawl_topology.
+
+        Endpoint: [GET] /jobs/:jobid
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/accumulators
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt
+        Endpoint: [GET] /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt/accumulators
+
+        Parameters
+        ----------
+        job_ids: list
+            (Optional) Ids of the crawled jobs. Default: every job.
+        levels: list
+            (Optional) Crawled levels: 'vertices', 'subtasks', 'attempts' and 'accumulators'. Default: every level.
+        max_workers: int
+            (Optional) Maximum number of concurrent requests. Default: 16
+        timeout: float
+            (Optional) Time budget in seconds of the whole crawl. Default: no deadline.
+
+        Returns
+        -------
+        JobTopology
+            job_id -> JobNode of the crawled jobs, and the errors of the missing parts.
+        """
+        return crawl_topology(self, job_ids, levels, max_workers, timeout)
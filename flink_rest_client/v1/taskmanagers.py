@@ -1,8 +1,18 @@
-from flink_rest_client.common import _execute_rest_request, RestException
+from flink_rest_client.common import (
+    _cached_metadata,
+    Deadline,
+    _download_rest_request,
+    _execute_rest_request,
+    _query_metrics,
+    _stream_json_array,
+    _stream_rest_request,
+    RestException,
+)
+from flink_rest_client.tracing import _traced
 
 
 class TaskManagersClient:
-    def __init__(self, prefix):
+    def __init__(self, prefix, session=None):
         """
         Constructor.
 
@@ -10,8 +20,11 @@ class TaskManagersClient:
         ----------
         prefix: str
             REST API url prefix. It must contain the host, port pair.
+        session: RestSession
+            (Optional) Shared HTTP session. Default: every request opens a new connection.
         """
         self.prefix = f"{prefix}/taskmanagers"
+        self._session = session
 
     def all(self):
         """
@@ -24,7 +37,9 @@ class TaskManagersClient:
         list
             List of taskmanagers. Each taskmanager is represented by a dictionary.
         """
-        return _execute_rest_request(url=self.prefix)["taskmanagers"]
+        return _execute_rest_request(url=self.prefix, session=self._session)[
+            "taskmanagers"
+        ]
 
     def taskmanager_ids(self):
         """
@@ -35,7 +50,9 @@ class TaskManagersClient:
         list
             List of taskmanager ids.
         """
-        return [elem["id"] for elem in self.all()]
+        return _cached_metadata(
+            self._session, self.prefix, lambda: [elem["id"] for elem in self.all()]
+        )
 
     def metric_names(self):
         """
@@ -46,11 +63,20 @@ class TaskManagersClient:
         list
             List of metric names.
         """
-        return [
-            elem["id"] for elem in _execute_rest_request(url=f"{self.prefix}/metrics")
-        ]
+        url = f"{self.prefix}/metrics"
+        return _cached_metadata(
+            self._session,
+            url,
+            lambda: [
+                elem["id"]
+                for elem in _execute_rest_request(url=url, session=self._session)
+            ],
+        )
 
-    def metrics(self, metric_names=None, agg_modes=None, taskmanager_ids=None):
+    @_traced
+    def metrics(
+        self, metric_names=None, agg_modes=None, taskmanager_ids=None, timeout=None
+    ):
         """
         Provides access to aggregated task manager metrics.
         By default it returns with all existing metric names.
@@ -70,42 +96,48 @@ class TaskManagersClient:
             List of 32-character hexadecimal strings to select specific task managers. The list of valid taskmanager ids
             are available through the taskmanager_ids() method. Default: <all taskmanagers>.
 
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Key-value pairs of metrics.
         """
 
-        if metric_names is None:
-            metric_names = self.metric_names()
-
-        supported_agg_modes = ["min", "max", "sum", "avg"]
-        if agg_modes is None:
-            agg_modes = supported_agg_modes
-        if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
-            raise RestException(
-                f"The provided aggregation modes list contains invalid value. Supported aggregation "
-                f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
+
+            supported_agg_modes = ["min", "max", "sum", "avg"]
+            if agg_modes is None:
+                agg_modes = supported_agg_modes
+            if len(set(agg_modes).difference(set(supported_agg_modes))) > 0:
+                raise RestException(
+                    f"The provided aggregation modes list contains invalid value. Supported aggregation "
+                    f"modes: {','.join(supported_agg_modes)}; given list: {','.join(agg_modes)}"
+                )
+
+            if taskmanager_ids is None:
+                taskmanager_ids = self.taskmanager_ids()
+
+            params = {
+                "agg": ",".join(agg_modes),
+                "taskmanagers": ",".join(taskmanager_ids),
+            }
+            query_result = _query_metrics(
+                url=f"{self.prefix}/metrics",
+                metric_names=metric_names,
+                params=params,
+                session=self._session,
             )
 
-        if taskmanager_ids is None:
-            taskmanager_ids = self.taskmanager_ids()
-
-        params = {
-            "get": ",".join(metric_names),
-            "agg": ",".join(agg_modes),
-            "taskmanagers": ",".join(taskmanager_ids),
-        }
-        query_result = _execute_rest_request(
-            url=f"{self.prefix}/metrics", params=params
-        )
+            result = {}
+            for elem in query_result:
+                metric_name = elem.pop("id")
+                result[metric_name] = elem
 
-        result = {}
-        for elem in query_result:
-            metric_name = elem.pop("id")
-            result[metric_name] = elem
-
-        return result
+            return result
 
     def get(self, taskmanager_id):
         """
@@ -123,7 +155,9 @@ class TaskManagersClient:
         dict
             Query result as a dict.
         """
-        return _execute_rest_request(url=f"{self.prefix}/{taskmanager_id}")
+        return _execute_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}", session=self._session
+        )
 
     def get_logs(self, taskmanager_id):
         """
@@ -141,9 +175,88 @@ class TaskManagersClient:
         list
             List of log files in which each element contains a name and size fields.
         """
-        return _execute_rest_request(url=f"{self.prefix}/{taskmanager_id}/logs")["logs"]
+        return _execute_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}/logs", session=self._session
+        )["logs"]
+
+    def get_log(self, taskmanager_id, log_file):
+        """
+        Returns the content of a log file on a TaskManager.
+
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/logs/:log_file
+
+        Parameters
+        ----------
+        taskmanager_id: str
+            32-character hexadecimal string that identifies a task manager.
+        log_file: str
+            Name of the log file. The available log files are listed by the get_logs() method.
+
+        Returns
+        -------
+        str
+            The content of the log file as a string
+        """
+        return "".join(self.stream_log(taskmanager_id, log_file))
 
-    def get_metrics(self, taskmanager_id, metric_names=None):
+    def stream_log(self, taskmanager_id, log_file, chunk_size=None):
+        """
+        Streams the content of a log file on a TaskManager, so arbitrarily large logs can be processed with constant
+        memory.
+
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/logs/:log_file
+
+        Parameters
+        ----------
+        taskmanager_id: str
+            32-character hexadecimal string that identifies a task manager.
+        log_file: str
+            Name of the log file.
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            Decoded chunks of complete log lines.
+        """
+        return _stream_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}/logs/{log_file}",
+            chunk_size=chunk_size,
+            session=self._session,
+        )
+
+    def download_log(self, taskmanager_id, log_file, path, buffer_size=None):
+        """
+        Writes the content of a log file on a TaskManager to a local file without holding it in memory.
+
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/logs/:log_file
+
+        Parameters
+        ----------
+        taskmanager_id: str
+            32-character hexadecimal string that identifies a task manager.
+        log_file: str
+            Name of the log file.
+        path: str
+            Path of the target file.
+        buffer_size: int
+            (Optional) Number of bytes buffered at once. Default: 65536
+
+        Returns
+        -------
+        int
+            Number of written bytes.
+        """
+        return _download_rest_request(
+            url=f"{self.prefix}/{taskmanager_id}/logs/{log_file}",
+            path=path,
+            buffer_size=buffer_size,
+            session=self._session,
+        )
+
+    @_traced
+    def get_metrics(self, taskmanager_id, metric_names=None, timeout=None):
         """
         Provides access to task manager metrics.
 
@@ -157,20 +270,24 @@ class TaskManagersClient:
         metric_names: list
             (optional) List of selected specific metric names. Default: <all metrics>
 
+        timeout: float
+            (Optional) Time budget in seconds of the whole call, shared by all of its requests. Default: no deadline.
+
         Returns
         -------
         dict
             Metric name -> Metric value key-value pairs. The values are provided as strings.
         """
 
-        if metric_names is None:
-            metric_names = self.metric_names()
-        params = {"get": ",".join(metric_names)}
-
-        query_result = _execute_rest_request(
-            url=f"{self.prefix}/{taskmanager_id}/metrics", params=params
-        )
-        return dict([(elem["id"], elem["value"]) for elem in query_result])
+        with Deadline(timeout):
+            if metric_names is None:
+                metric_names = self.metric_names()
+            query_result = _query_metrics(
+                url=f"{self.prefix}/{taskmanager_id}/metrics",
+                metric_names=metric_names,
+                session=self._session,
+            )
+            return dict([(elem["id"], elem["value"]) for elem in query_result])
 
     def get_thread_dump(self, taskmanager_id):
         """
@@ -189,7 +306,7 @@ class TaskManagersClient:
             ThreadName -> StringifiedThreadInfo key-value pairs.
         """
         query_result = _execute_rest_request(
-            url=f"{self.prefix}/{taskmanager_id}/thread-dump"
+            url=f"{self.prefix}/{taskmanager_id}/thread-dump", session=self._session
         )["threadInfos"]
         return dict(
             [
@@ -197,3 +314,30 @@ class TaskManagersClient:
                 for elem in query_result
             ]
         )
+
+    def iter_thread_dump(self, taskmanager_id, chunk_size=None):
+        """
+        Iterates over the thread dump of the requested TaskManager. The response is parsed incrementally, so the
+        memory usage does not grow with the number of threads.
+
+        Endpoint: [GET] /taskmanagers/:taskmanagerid/thread-dump
+
+        Parameters
+        ----------
+        taskmanager_id: str
+            32-character hexadecimal string that identifies a task manager.
+        chunk_size: int
+            (Optional) Number of bytes read from the connection at once. Default: 65536
+
+        Returns
+        -------
+        generator
+            (ThreadName, StringifiedThreadInfo) pairs, one at a time.
+        """
+        for elem in _stream_json_array(
+            url=f"{self.prefix}/{taskmanager_id}/thread-dump",
+            key="threadInfos",
+            chunk_size=chunk_size,
+            session=self._session,
+        ):
+            yield elem["threadName"], elem["stringifiedThreadInfo"]
@@ -0,0 +1,357 @@
+import heapq
+import time
+
+from flink_rest_client.common import (
+    Deadline,
+    _execute_rest_request,
+    RestTimeoutException,
+)
+
+# Polls of a running operation become less frequent by this factor, up to the maximum interval.
+_BACKOFF_FACTOR = 1.5
+
+
+class TriggerResult:
+    """
+    Outcome of an asynchronous operation, e.g. a savepoint, a stop with savepoint, a rescaling or a data set deletion.
+
+    Attributes
+    ----------
+    trigger: JobTrigger or DatasetTrigger
+        The trigger of the operation, or None if the operation could not be triggered.
+    status: str
+        'COMPLETED' if the operation has finished (successfully or not), or None if its status is unknown.
+    operation: dict
+        The 'operation' part of the final status, e.g. {'location': <savepoint path>} or {'failure-cause': {...}}.
+    duration: float
+        Seconds between the start of waiting and the final poll.
+    polls: int
+        Number of status requests.
+    error: Exception
+        The exception raised by triggering or polling (e.g. RestTimeoutException if the operation did not complete in
+        time), or None.
+    queued: float
+        Seconds the operation waited for a free slot before it was triggered by a bulk operation, or None.
+    job_id: str
+        Id of the job of the operation, also if it could not be triggered, or None for a data set operation.
+    """
+
+    def __init__(
+        self,
+        trigger,
+        status=None,
+        operation=None,
+        duration=None,
+        polls=0,
+        error=None,
+        queued=None,
+        job_id=None,
+    ):
+        self.trigger = trigger
+        self.status = status
+        self.operation = {} if operation is None else operation
+        self.duration = duration
+        self.polls = polls
+        self.error = error
+        self.queued = queued
+        self.job_id = getattr(trigger, "job_id", None) if job_id is None else job_id
+
+    @property
+    def location(self):
+        """
+        Returns the path of the created savepoint, or None if the operation does not create one.
+        """
+        return self.operation.get("location")
+
+    @property
+    def failure_cause(self):
+        """
+        Returns the failure cause reported by the cluster (with 'class' and 'stack-trace' keys), or None.
+        """
+        return self.operation.get("failure-cause")
+
+    @property
+    def succeeded(self):
+        return (
+            self.error is None
+            and self.status == "COMPLETED"
+            and self.failure_cause is None
+        )
+
+    def as_dict(self):
+        failure_cause = self.failure_cause
+        return {
+            "job_id": self.job_id,
+            "trigger_id": None if self.trigger is None else self.trigger.trigger_id,
+            "status": self.status,
+            "succeeded": self.succeeded,
+            "location": self.location,
+            "failure_cause": (
+                None if failure_cause is None else failure_cause.get("class")
+            ),
+            "queued": self.queued,
+            "duration": self.duration,
+            "polls": self.polls,
+            "error": None if self.error is None else repr(self.error),
+        }
+
+
+def _budget(deadline, started_at):
+    # The effective time budget, which an enclosing deadline may have shortened.
+    if deadline.expires_at is None:
+        return None
+    return round(deadline.expires_at - started_at, 3)
+
+
+class _Trigger:
+    # Common polling logic of the asynchronous operations.
+
+    def __init__(self, status_url, trigger_id, session=None):
+        self._status_url = status_url
+        self._session = session
+        self.trigger_id = trigger_id
+
+    @property
+    def status(self):
+        return _execute_rest_request(url=self._status_url, session=self._session)
+
+    def wait(self, timeout=None, initial_interval=None, max_interval=None):
+        """
+        Polls the status of the operation until it is completed. The polls become less frequent as the operation
+        takes longer.
+
+        Parameters
+        ----------
+        timeout: float
+            (Optional) Maximum number of seconds to wait. An operation completed after the last poll before the
+            deadline is reported as timed out. Default: no limit.
+        initial_interval: float
+            (Optional) Number of seconds between the first two polls. Default: 0.1
+        max_interval: float
+            (Optional) Maximum number of seconds between two polls. Default: 5
+
+        Returns
+        -------
+        TriggerResult
+            The outcome of the operation. A failed operation is reported by its failure_cause.
+        """
+        interval = 0.1 if initial_interval is None else initial_interval
+        max_interval = 5 if max_interval is None else max_interval
+        started_at = time.monotonic()
+        polls = 0
+        with Deadline(timeout) as deadline:
+            while True:
+                try:
+                    status = self.status
+                except RestTimeoutException as exc:
+                    if not deadline.expired:
+                        raise
+                    raise RestTimeoutException(
+                        f"Operation {self.trigger_id} was not completed within "
+                        f"{_budget(deadline, started_at)} seconds."
+                    ) from exc
+                polls += 1
+                if status["status"]["id"] == "COMPLETED":
+                    return TriggerResult(
+                        self,
+                        status=status["status"]["id"],
+                        operation=status.get("operation"),
+                        duration=time.monotonic() - started_at,
+                        polls=polls,
+                    )
+                remaining = deadline.remaining()
+                # The sleep ends at the deadline at the latest. No poll is sent after it: the next status request
+                # fails with a RestTimeoutException right away, which is reported as the timeout of the operation.
+                time.sleep(
+                    interval if remaining is None else max(min(interval, remaining), 0)
+                )
+                interval = min(interval * _BACKOFF_FACTOR, max_interval)
+
+
+class JobTrigger(_Trigger):
+    def __init__(self, prefix, type_name, job_id, trigger_id, session=None):
+        super().__init__(
+            f"{prefix}/{job_id}/{type_name}/{trigger_id}", trigger_id, session=session
+        )
+        self.job_id = job_id
+
+
+class DatasetTrigger(_Trigger):
+    def __init__(self, prefix, trigger_id, session=None):
+        super().__init__(f"{prefix}/{trigger_id}", trigger_id, session=session)
+
+
+class _PollScheduler:
+    """
+    Polls the status of running operations, the one that is due first at a time. All polls share one request
+    budget, and the polls of an operation become less frequent as it takes longer.
+    """
+
+    def __init__(
+        self, max_requests_per_second=None, initial_interval=None, max_interval=None
+    ):
+        max_requests_per_second = (
+            20 if max_requests_per_second is None else max_requests_per_second
+        )
+        self.min_gap = 1 / max_requests_per_second
+        self.initial_interval = 0.1 if initial_interval is None else initial_interval
+        self.max_interval = 5 if max_interval is None else max_interval
+        self._next_request_at = time.monotonic()
+        # (time of the next poll, sequence number, interval after the next poll)
+        self._queue = []
+        self._entries = {}
+        self._sequence = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def acquire(self, deadline=None):
+        """
+        Waits for the request budget, returns False if the deadline passes first.
+        """
+        return self._wait_until(self._next_request_at, deadline)
+
+    def _wait_until(self, at, deadline):
+        delay = max(at, self._next_request_at) - time.monotonic()
+        remaining = None if deadline is None else deadline.remaining()
+        if remaining is not None and delay >= remaining:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        self._next_request_at = time.monotonic() + self.min_gap
+        return True
+
+    def add(self, key, trigger, started_at=None):
+        """
+        Schedules the polling of an operation, its first poll is due immediately.
+        """
+        started_at = time.monotonic() if started_at is None else started_at
+        self._sequence += 1
+        self._entries[self._sequence] = [key, trigger, started_at, 0]
+        heapq.heappush(
+            self._queue, (time.monotonic(), self._sequence, self.initial_interval)
+        )
+
+    def poll_next(self, deadline=None):
+        """
+        Polls the operation that is due first.
+
+        Returns
+        -------
+        tuple
+            (key, TriggerResult) if the operation has completed or its status could not be queried, (key, None) if it
+            is still running, or None if the deadline passes before the poll is due.
+        """
+        due, sequence, interval = self._queue[0]
+        if not self._wait_until(due, deadline):
+            return None
+        heapq.heappop(self._queue)
+        entry = self._entries[sequence]
+        key, trigger, started_at, _ = entry
+        entry[3] += 1
+        try:
+            status = trigger.status
+            completed = status["status"]["id"] == "COMPLETED"
+        except Exception as exc:
+            # Any failure ends the polling of this operation only.
+            del self._entries[sequence]
+            return key, TriggerResult(
+                trigger,
+                duration=time.monotonic() - started_at,
+                polls=entry[3],
+                error=exc,
+            )
+        if completed:
+            del self._entries[sequence]
+            return key, TriggerResult(
+                trigger,
+                status=status["status"]["id"],
+                operation=status.get("operation"),
+                duration=time.monotonic() - started_at,
+                polls=entry[3],
+            )
+        heapq.heappush(
+            self._queue,
+            (
+                time.monotonic() + interval,
+                sequence,
+                min(interval * _BACKOFF_FACTOR, self.max_interval),
+            ),
+        )
+        return key, None
+
+    def expire(self, timeout):
+        """
+        Stops polling, and returns a (key, TriggerResult) pair with a RestTimeoutException for every running
+        operation.
+        """
+        now = time.monotonic()
+        expired = [
+            (
+                key,
+                TriggerResult(
+                    trigger,
+                    duration=now - started_at,
+                    polls=polls,
+                    error=RestTimeoutException(
+                        f"Operation {trigger.trigger_id} was not completed within {timeout} seconds."
+                    ),
+                ),
+            )
+            for key, trigger, started_at, polls in self._entries.values()
+        ]
+        self._queue.clear()
+        self._entries.clear()
+        return expired
+
+
+def wait_all(
+    triggers,
+    timeout=None,
+    max_requests_per_second=None,
+    initial_interval=None,
+    max_interval=None,
+):
+    """
+    Polls many asynchronous operations until all of them are completed, e.g. the savepoints of every job before a
+    deploy. A single scheduler polls the operations that are due first, and the polls of all operations share one
+    request budget, so the number of status requests per second sent to the JobManager is bounded regardless of the
+    number of operations.
+
+    Parameters
+    ----------
+    triggers: list
+        JobTrigger or DatasetTrigger objects.
+    timeout: float
+        (Optional) Maximum number of seconds to wait for all operations. Default: no limit.
+    max_requests_per_second: float
+        (Optional) Maximum number of status requests per second. Default: 20
+    initial_interval: float
+        (Optional) Number of seconds between the first two polls of an operation. Default: 0.1
+    max_interval: float
+        (Optional) Maximum number of seconds between two polls of an operation. Default: 5
+
+    Returns
+    -------
+    list
+        TriggerResult of every trigger, in the order of the triggers. The operations whose status could not be
+        queried, or which did not complete in time, have their error set.
+    """
+    triggers = list(triggers)
+    scheduler = _PollScheduler(max_requests_per_second, initial_interval, max_interval)
+    started_at = time.monotonic()
+    for index, trigger in enumerate(triggers):
+        scheduler.add(index, trigger, started_at)
+    results = [None] * len(triggers)
+
+    with Deadline(timeout) as deadline:
+        while scheduler:
+            polled = scheduler.poll_next(deadline)
+            if polled is None:
+                break
+            index, result = polled
+            if result is not None:
+                results[index] = result
+    for index, result in scheduler.expire(_budget(deadline, started_at)):
+        results[index] = result
+    return results
@@ -0,0 +1,303 @@
+import threading
+import time
+
+import requests
+
+from flink_rest_client.common import RestException
+
+
+class JobEvent:
+    """
+    Change of a job observed by a JobWatcher.
+
+    Attributes
+    ----------
+    job_id: str
+        32-character hexadecimal string value that identifies the job.
+    name: str
+        Name of the job.
+    state: str
+        State of the job when it was observed.
+    previous_state: str
+        State of the job at the previous poll, or None if the job was not known then.
+    timestamp: int
+        Time of the last state transition of the job in epoch milliseconds, as reported by the cluster.
+    """
+
+    __slots__ = ("job_id", "name", "state", "previous_state", "timestamp")
+
+    def __init__(self, job, previous_state):
+        self.job_id = job["jid"]
+        self.name = job.get("name")
+        self.state = job["state"]
+        self.previous_state = previous_state
+        self.timestamp = job.get("last-modification")
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(job_id={self.job_id!r}, state={self.state!r}, "
+            f"previous_state={self.previous_state!r})"
+        )
+
+    def as_dict(self):
+        result = {"event": type(self).__name__}
+        result.update((name, getattr(self, name)) for name in JobEvent.__slots__)
+        return result
+
+
+class JobStarted(JobEvent):
+    """
+    A job appeared in the overview.
+    """
+
+    __slots__ = ()
+
+
+class JobStateChanged(JobEvent):
+    """
+    The state of a job differs from its state at the previous poll.
+    """
+
+    __slots__ = ()
+
+
+class JobRestarted(JobEvent):
+    """
+    A job is restarting. If the watcher tracks restarts, it is also reported for a restart that happened entirely
+    between two polls, confirmed by the numRestarts metric of the job.
+    """
+
+    __slots__ = ()
+
+
+class JobFinished(JobEvent):
+    """
+    A job has terminated without failure: it became FINISHED or CANCELED.
+    """
+
+    __slots__ = ()
+
+
+class JobFailed(JobEvent):
+    """
+    A job has terminated with failure: it became FAILED.
+    """
+
+    __slots__ = ()
+
+
+class JobWatcher:
+    def __init__(
+        self, jobs, interval=None, include_existing=False, track_restarts=False
+    ):
+        """
+        Constructor.
+
+        Watches the jobs of a cluster by polling the job overview and comparing every result with the previous one.
+        Only the state, start time, end time and last modification time of every job are kept between two polls.
+
+        Endpoint: [GET] /jobs/overview
+        Endpoint: [GET] /jobs/:jobid/metrics
+
+        Parameters
+        ----------
+        jobs: JobsClient
+            Client of the watched cluster.
+        interval: float
+            (Optional) Number of seconds between the starts of two polls. Default: 5
+        include_existing: bool
+            (Optional) If it is True, the first poll reports a JobStarted event for every existing job. Default: False
+        track_restarts: bool
+            (Optional) If it is True, the restarts of the running jobs that are not observed in the RESTARTING state
+            are detected as well. The last modification time of a job changes with every task state transition, so
+            the numRestarts metric of the job is queried to confirm a restart whenever it changes. Default: False
+        """
+        self._jobs = jobs
+        self.interval = 5 if interval is None else interval
+        self.include_existing = include_existing
+        self.track_restarts = track_restarts
+        self._callbacks = []
+        # job_id -> (state, start-time, end-time, last-modification) at the previous poll
+        self._states = None
+        # job_id -> numRestarts metric of the running jobs, None if it is not known
+        self._restarts = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add_callback(self, callback, event_types=None):
+        """
+        Registers a function called with every matching event, in the order of the events.
+
+        Parameters
+        ----------
+        callback: callable
+            Function called with a JobEvent.
+        event_types: list
+            (Optional) JobEvent subclasses the callback is called with, e.g. [JobFailed, JobRestarted].
+            Default: every event.
+        """
+        self._callbacks.append(
+            (callback, None if event_types is None else tuple(event_types))
+        )
+
+    def poll(self):
+        """
+        Polls the job overview once, and calls the callbacks with the changes since the previous poll.
+
+        Returns
+        -------
+        list
+            JobEvent objects of the changes since the previous poll.
+        """
+        events = self._diff(self._jobs.overview())
+        for event in events:
+            for callback, event_types in self._callbacks:
+                if event_types is None or isinstance(event, event_types):
+                    callback(event)
+        return events
+
+    def _diff(self, overview):
+        report_new = self._states is not None or self.include_existing
+        previous_states = self._states or {}
+        states = {}
+        events = []
+        for job in overview:
+            job_id = job["jid"]
+            state = job["state"]
+            current = (
+                state,
+                job.get("start-time"),
+                job.get("end-time"),
+                job.get("last-modification"),
+            )
+            states[job_id] = current
+            previous = previous_states.get(job_id)
+            if previous == current:
+                continue
+            # A running job whose tasks changed state may have restarted between the two polls.
+            if (
+                self.track_restarts
+                and self._update_restarts(job_id, state)
+                and previous is not None
+                and previous[0] == state
+            ):
+                events.append(JobRestarted(job, state))
+
+            if previous is None:
+                if not report_new:
+                    continue
+                previous_state = None
+                events.append(JobStarted(job, previous_state))
+            else:
+                previous_state = previous[0]
+                if state == previous_state:
+                    continue
+                events.append(JobStateChanged(job, previous_state))
+                if state == "RESTARTING":
+                    events.append(JobRestarted(job, previous_state))
+                    continue
+
+            if state == "FAILED":
+                events.append(JobFailed(job, previous_state))
+            elif state in ("FINISHED", "CANCELED"):
+                events.append(JobFinished(job, previous_state))
+        # The jobs removed from the overview, e.g. the expired archived jobs, are forgotten.
+        self._states = states
+        if self.track_restarts:
+            self._restarts = {
+                job_id: count
+                for job_id, count in self._restarts.items()
+                if job_id in states
+            }
+        return events
+
+    def _update_restarts(self, job_id, state):
+        # Returns True if the numRestarts metric of a running job has grown since it was queried last time.
+        if state != "RUNNING":
+            # The counter is queried again once the job is running.
+            self._restarts[job_id] = None
+            return False
+        known = self._restarts.get(job_id)
+        try:
+            count = int(
+                float(self._jobs.get_metrics(job_id, ["numRestarts"])["numRestarts"])
+            )
+        except (
+            RestException,
+            requests.exceptions.RequestException,
+            KeyError,
+            ValueError,
+        ):
+            count = None
+        self._restarts[job_id] = count
+        return known is not None and count is not None and count > known
+
+    def events(self, timeout=None):
+        """
+        Polls the job overview at every interval, and yields the changes. The callbacks are called as well.
+
+        Parameters
+        ----------
+        timeout: float
+            (Optional) Number of seconds after which no more polls are started. Default: the generator never ends.
+
+        Returns
+        -------
+        generator
+            JobEvent objects in the order of their observation.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        next_poll_at = time.monotonic()
+        while True:
+            for event in self.poll():
+                yield event
+            next_poll_at = max(next_poll_at + self.interval, time.monotonic())
+            if deadline is not None and next_poll_at > deadline:
+                return
+            time.sleep(max(next_poll_at - time.monotonic(), 0))
+
+    def start(self, error_callback=None):
+        """
+        Starts polling in a background thread, the events are delivered to the callbacks.
+
+        Parameters
+        ----------
+        error_callback: callable
+            (Optional) Function called with the exception of a failed poll, e.g. a RestException or a ConnectionError
+            while the JobManager is down, or with the exception raised by a callback. The polling goes on after a
+            failure. Default: the failures are ignored.
+        """
+        if self._thread is not None:
+            raise RestException("The watcher is already running.")
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(error_callback,), name="JobWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, error_callback):
+        next_poll_at = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as exc:
+                if error_callback is not None:
+                    error_callback(exc)
+            next_poll_at = max(next_poll_at + self.interval, time.monotonic())
+            self._stopped.wait(next_poll_at - time.monotonic())
+
+    def stop(self):
+        """
+        Stops the background thread, and waits for the running poll to finish.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
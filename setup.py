@@ -18,6 +18,10 @@ setup(
     license='MIT',
     packages=find_packages(),
     install_requires=['requests', 'importlib_resources'],
+    extras_require={
+        'async': ['aiohttp'],
+        'fast-json': ['orjson'],
+    },
     entry_points={
           'console_scripts': [],
     }
@@ -0,0 +1,49 @@
+import time
+
+from flink_rest_client.cache import TTLCache
+
+
+class TestTTLCache:
+
+    def test_get_or_load(self):
+        cache = TTLCache(ttl=60)
+        calls = []
+        loader = lambda: calls.append(1) or ['metric']
+
+        assert cache.get_or_load('key', loader) == ['metric']
+        assert cache.get_or_load('key', loader) == ['metric']
+        assert len(calls) == 1
+
+    def test_expiration(self):
+        cache = TTLCache(ttl=0.01)
+        cache.put('key', 'value')
+        time.sleep(0.02)
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_invalidate(self):
+        cache = TTLCache(ttl=60)
+        cache.put('http://host:8081/v1/jobs', 1)
+        cache.put('http://host:8081/v1/jobs/metrics', 2)
+        cache.put('http://host:8081/v1/taskmanagers', 3)
+
+        cache.invalidate('http://host:8081/v1/jobs/metrics')
+        assert cache.get('http://host:8081/v1/jobs/metrics') is None
+
+        cache.invalidate_prefix('http://host:8081/v1/jobs')
+        assert cache.get('http://host:8081/v1/jobs') is None
+        assert cache.get('http://host:8081/v1/taskmanagers') == 3
+
+        cache.invalidate()
+        assert len(cache) == 0
@@ -20,3 +20,25 @@ class TestClient:
         assert isinstance(client, FlinkRestClientV1)
         assert client.host == "test-host"
         assert client.port == 8082
+
+    def test_session_options(self):
+        client = FlinkRestClient.get("test-host", pool_connections=2, pool_maxsize=4, idle_timeout=30)
+        assert client.session.pool_connections == 2
+        assert client.session.pool_maxsize == 4
+        assert client.session.idle_timeout == 30
+
+    def test_endpoint_list(self):
+        client = FlinkRestClient.get(["jm-0", "jm-1:8082"])
+        assert client.host == "jm-0"
+        assert client.port == 8081
+        assert [endpoint["base_url"] for endpoint in client.session.endpoints.status()] == [
+            "http://jm-0:8081", "http://jm-1:8082"]
+
+    def test_https_endpoint_list(self, requests_mock):
+        client = FlinkRestClient.get(["https://jm-0", "https://jm-1"])
+        assert client.api_url == "https://jm-0:8081/v1"
+        assert client.session.endpoints.owns(client.api_url)
+
+        requests_mock.get("https://jm-0:8081/v1/overview", status_code=503, json={"errors": ["unavailable"]})
+        requests_mock.get("https://jm-1:8081/v1/overview", json={"taskmanagers": 1})
+        assert client.overview() == {"taskmanagers": 1}
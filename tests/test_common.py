@@ -0,0 +1,395 @@
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from flink_rest_client.common import (
+    Deadline,
+    RestException,
+    RestSession,
+    RestTimeoutException,
+    _chunk_metric_names,
+    _execute_rest_request,
+    _fan_out,
+    _query_metrics,
+)
+from flink_rest_client.response_cache import ResponseCache
+from flink_rest_client.retry import RetryPolicy
+
+
+class TestRestSession:
+
+    def test_default_pool(self):
+        session = RestSession()
+        assert session.pool_connections == 10
+        assert session.pool_maxsize == 10
+        assert session.idle_timeout is None
+
+    def test_request(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'taskmanagers': 1})
+        with RestSession() as session:
+            response = _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        assert response['taskmanagers'] == 1
+
+    def test_error(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'errors': ['Not found.']}, status_code=404)
+        with pytest.raises(RestException):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=RestSession())
+
+    def test_idle_timeout(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={})
+        session = RestSession(idle_timeout=0)
+        closed = []
+        for adapter in session._session.adapters.values():
+            adapter.close = lambda: closed.append(True)
+
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        assert len(closed) == 0
+        session._last_used -= 1
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        assert len(closed) > 0
+
+
+class TestFanOut:
+
+    def test_results_and_errors(self):
+        def func(item):
+            if item == 'bad':
+                raise RestException('bad item')
+            return item.upper()
+
+        results, errors = _fan_out(func, ['a', 'bad', 'b'], max_workers=2)
+        assert results == {'a': 'A', 'b': 'B'}
+        assert isinstance(errors['bad'], RestException)
+
+    def test_timeout(self):
+        release = threading.Event()
+        results, errors = _fan_out(lambda item: release.wait(5), ['slow'], timeout=0.05)
+        release.set()
+        assert results == {}
+        assert 'slow' in errors
+
+
+class TestQueryMetrics:
+
+    def test_chunk_metric_names(self):
+        chunks = _chunk_metric_names(['a' * 10, 'b' * 10, 'c' * 10], max_length=26)
+        assert chunks == [['a' * 10, 'b' * 10], ['c' * 10]]
+
+    def test_single_request(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/taskmanagers/metrics', json=[{'id': 'a', 'min': 1.0}])
+        response = _query_metrics('http://host:8081/v1/taskmanagers/metrics', ['a'], params={'agg': 'min'},
+                                  session=RestSession())
+
+        assert response == [{'id': 'a', 'min': 1.0}]
+        assert requests_mock.call_count == 1
+        assert requests_mock.last_request.qs == {'get': ['a'], 'agg': ['min']}
+
+    def test_chunked_requests(self, requests_mock):
+        metric_names = [f'Status.JVM.Metric{index}' for index in range(100)]
+
+        def callback(request, context):
+            metric_query = parse_qs(urlparse(request.url).query)['get'][0]
+            return [{'id': metric_name, 'value': '0'} for metric_name in metric_query.split(',')]
+
+        requests_mock.get('http://host:8081/v1/jobmanager/metrics', json=callback)
+        response = _query_metrics('http://host:8081/v1/jobmanager/metrics', metric_names,
+                                  session=RestSession(max_metric_query_length=500))
+
+        assert requests_mock.call_count > 1
+        assert [elem['id'] for elem in response] == metric_names
+
+
+class TestDeadline:
+
+    def test_session_timeouts(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={})
+        session = RestSession(connect_timeout=2, read_timeout=10)
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        assert requests_mock.last_request.timeout == (2, 10)
+
+    def test_deadline_caps_timeouts(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={})
+        session = RestSession(connect_timeout=2, read_timeout=10)
+        with Deadline(5):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        connect, read = requests_mock.last_request.timeout
+        assert connect == 2
+        assert 0 < read <= 5
+
+    def test_expired_deadline(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={})
+        with pytest.raises(RestTimeoutException):
+            with Deadline(0):
+                _execute_rest_request(url='http://host:8081/v1/overview', session=RestSession())
+        assert requests_mock.call_count == 0
+
+    def test_nested_deadline(self):
+        with Deadline(1) as outer:
+            with Deadline(60) as inner:
+                assert inner.expires_at == outer.expires_at
+            with Deadline(None) as inner:
+                assert inner.expires_at == outer.expires_at
+
+    def test_request_timeout(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', exc=requests.exceptions.ReadTimeout)
+        with pytest.raises(RestTimeoutException):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=RestSession(read_timeout=1))
+
+    def test_fan_out_inherits_deadline(self):
+        release = threading.Event()
+        with Deadline(0.05):
+            results, errors = _fan_out(lambda item: release.wait(5), ['slow'])
+        release.set()
+        assert isinstance(errors['slow'], RestTimeoutException)
+
+
+class TestRetry:
+
+    def test_retry_status(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', [
+            {'json': {'errors': ['Service temporarily unavailable due to an ongoing leader election.']},
+             'status_code': 503},
+            {'json': {'taskmanagers': 1}, 'status_code': 200},
+        ])
+        session = RestSession(retry_policy=RetryPolicy(backoff_factor=0))
+        response = _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        assert response['taskmanagers'] == 1
+        assert requests_mock.call_count == 2
+        assert session.counters == {'requests': 1, 'retries': 1}
+
+    def test_retry_connection_error(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', [
+            {'exc': requests.exceptions.ConnectionError},
+            {'json': {'taskmanagers': 1}, 'status_code': 200},
+        ])
+        session = RestSession(retry_policy=RetryPolicy(backoff_factor=0))
+
+        assert _execute_rest_request(url='http://host:8081/v1/overview', session=session)['taskmanagers'] == 1
+
+    def test_retries_exhausted(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'errors': []}, status_code=500)
+        session = RestSession(retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0))
+        with pytest.raises(RestException):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        assert requests_mock.call_count == 3
+        assert session.counters['retries_exhausted'] == 1
+
+    def test_no_retry_of_non_idempotent_method(self, requests_mock):
+        requests_mock.post('http://host:8081/v1/jars/test_jar_id/run', json={'errors': []}, status_code=503)
+        session = RestSession(retry_policy=RetryPolicy(backoff_factor=0))
+        with pytest.raises(RestException):
+            _execute_rest_request(url='http://host:8081/v1/jars/test_jar_id/run', http_method='POST',
+                                  session=session)
+
+        assert requests_mock.call_count == 1
+
+
+class TestCoalescing:
+
+    def _run_concurrently(self, session, url, callers, timeout=None):
+        results, errors = [None] * callers, [None] * callers
+
+        def call(index):
+            try:
+                with Deadline(timeout):
+                    results[index] = _execute_rest_request(url=url, session=session)
+            except Exception as exc:
+                errors[index] = exc
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def _wait_for_followers(self, session, followers, timeout=5):
+        waited_until = time.monotonic() + timeout
+        while not any(flight.followers == followers for flight in list(session._single_flight._flights.values())):
+            assert time.monotonic() < waited_until, f'{followers} followers did not join within {timeout} seconds'
+            time.sleep(0.001)
+
+    def test_identical_gets_share_one_call(self, requests_mock):
+        release = threading.Event()
+
+        def overview(request, context):
+            release.wait(5)
+            return {'jobs': []}
+
+        requests_mock.get('http://host:8081/v1/jobs/overview', json=overview)
+        session = RestSession(coalesce_requests=True)
+        threads, results, errors = self._run_concurrently(session, 'http://host:8081/v1/jobs/overview', 4)
+        self._wait_for_followers(session, 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert requests_mock.call_count == 1
+        assert results == [{'jobs': []}] * 4
+        assert len({id(result) for result in results}) == 4
+        assert session.counters['coalesce_hits'] == 3
+        assert session.counters['coalesce_merges'] == 1
+
+    def test_followers_without_time_budget(self, requests_mock):
+        release = threading.Event()
+
+        def overview(request, context):
+            release.wait(5)
+            return {'jobs': []}
+
+        requests_mock.get('http://host:8081/v1/jobs/overview', json=overview)
+        session = RestSession(coalesce_requests=True)
+        threads, results, errors = self._run_concurrently(session, 'http://host:8081/v1/jobs/overview', 3)
+        self._wait_for_followers(session, 2)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert errors == [None] * 3
+        assert results == [{'jobs': []}] * 3
+        assert requests_mock.call_count == 1
+
+    def test_error_is_shared(self, requests_mock):
+        release = threading.Event()
+
+        def overview(request, context):
+            release.wait(5)
+            context.status_code = 500
+            return {'errors': ['boom']}
+
+        requests_mock.get('http://host:8081/v1/jobs/overview', json=overview)
+        session = RestSession(coalesce_requests=True)
+        threads, results, errors = self._run_concurrently(session, 'http://host:8081/v1/jobs/overview', 2)
+        self._wait_for_followers(session, 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert requests_mock.call_count == 1
+        assert all(isinstance(error, RestException) for error in errors)
+
+    def test_sequential_gets_are_not_coalesced(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/jobs/overview', json={'jobs': []})
+        session = RestSession(coalesce_requests=True)
+        for _ in range(2):
+            _execute_rest_request(url='http://host:8081/v1/jobs/overview', session=session)
+
+        assert requests_mock.call_count == 2
+        assert 'coalesce_hits' not in session.counters
+
+
+class TestResponseCaching:
+
+    def test_cached_response(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession(response_cache=ResponseCache({'/overview': 60}))
+        first = _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        first['taskmanagers'] = 2
+        second = _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        assert second == {'taskmanagers': 1}
+        assert requests_mock.call_count == 1
+        assert session.counters['cache_hits'] == 1
+        assert session.counters['cache_misses'] == 1
+
+    def test_params_are_part_of_the_key(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/jobs/test_job_id/accumulators', json={})
+        session = RestSession(response_cache=ResponseCache({'/jobs/:jobid/accumulators': 60}))
+        for include in ['true', 'false', 'true']:
+            _execute_rest_request(url='http://host:8081/v1/jobs/test_job_id/accumulators',
+                                  params={'includeSerializedValue': include}, session=session)
+
+        assert requests_mock.call_count == 2
+
+    def test_stale_while_revalidate(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', [
+            {'json': {'taskmanagers': 1}},
+            {'json': {'taskmanagers': 2}},
+        ])
+        session = RestSession(response_cache=ResponseCache({'/overview': 0.01}, stale_while_revalidate=60))
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        time.sleep(0.02)
+
+        assert _execute_rest_request(url='http://host:8081/v1/overview', session=session) == {'taskmanagers': 1}
+        deadline = time.monotonic() + 5
+        while session.response_cache.get('http://host:8081/v1/overview?[]|[]|200')[0] != {'taskmanagers': 2}:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert session.counters['cache_stale_hits'] == 1
+
+    def test_invalidation_during_refresh(self, requests_mock):
+        loading, release = threading.Event(), threading.Event()
+
+        def overview(request, context):
+            if requests_mock.call_count > 1:
+                loading.set()
+                release.wait(timeout=5)
+            return {'taskmanagers': requests_mock.call_count}
+
+        requests_mock.get('http://host:8081/v1/overview', json=overview)
+        session = RestSession(response_cache=ResponseCache({'/overview': 0.01}, stale_while_revalidate=60))
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        time.sleep(0.02)
+        assert _execute_rest_request(url='http://host:8081/v1/overview', session=session) == {'taskmanagers': 1}
+        assert loading.wait(timeout=5)
+
+        # The refresh started before the invalidation must not put its response back.
+        session.invalidate_cache('http://host:8081/v1/overview')
+        release.set()
+        deadline = time.monotonic() + 5
+        while session.response_cache._refreshing:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert len(session.response_cache) == 0
+
+    def test_invalidate_cache(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession(response_cache=ResponseCache({'/overview': 60}))
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        session.invalidate_cache('http://host:8081/v1/overview')
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        assert requests_mock.call_count == 2
+
+
+class TestJsonDecoding:
+
+    def test_body_is_decoded_once(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', status_code=404, json={'errors': ['Not found.']})
+        calls = []
+
+        def decoder(body):
+            calls.append(body)
+            return json.loads(body)
+
+        session = RestSession(json_decoder=decoder)
+        with pytest.raises(RestException, match='Not found.'):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+        assert len(calls) == 1
+
+        requests_mock.get('http://host:8081/v1/overview', json={'taskmanagers': 1})
+        assert _execute_rest_request(url='http://host:8081/v1/overview', session=session) == {'taskmanagers': 1}
+        assert len(calls) == 2
+
+    def test_error_without_json_body(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', status_code=500, text='Internal server error')
+        with pytest.raises(RestException, match=r'\(500\)'):
+            _execute_rest_request(url='http://host:8081/v1/overview', session=RestSession())
+
+    def test_decode_stats(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession()
+        assert session.decode_stats == {'decodes': 0, 'bytes': 0, 'seconds': 0.0}
+        _execute_rest_request(url='http://host:8081/v1/overview', session=session)
+
+        stats = session.decode_stats
+        assert stats['decodes'] == 1
+        assert stats['bytes'] == len(json.dumps({'taskmanagers': 1}))
+        assert stats['seconds'] > 0
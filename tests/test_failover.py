@@ -0,0 +1,96 @@
+import pytest
+import requests
+
+from flink_rest_client.common import RestSession, RestTimeoutException, _execute_rest_request
+from flink_rest_client.failover import EndpointPool
+
+
+class TestEndpointPool:
+
+    def test_normalization(self):
+        pool = EndpointPool(["jm-0", "jm-1:8082", "https://jm-2"], default_port=8081)
+        assert [endpoint["base_url"] for endpoint in pool.status()] == [
+            "http://jm-0:8081", "http://jm-1:8082", "https://jm-2:8081"]
+        assert pool.primary == "http://jm-0:8081"
+        assert pool.owns("http://jm-1:8082/v1/overview")
+        assert not pool.owns("http://jm-1:8081/v1/overview")
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            EndpointPool([])
+
+    def test_candidates_order(self):
+        pool = EndpointPool(["jm-0", "jm-1", "jm-2"])
+        jm_0, jm_1, jm_2 = pool.candidates()
+        pool.mark_success(jm_0, 0.5)
+        pool.mark_success(jm_1, 0.1)
+        pool.mark_success(jm_2, 0.2)
+        assert pool.candidates() == [jm_1, jm_2, jm_0]
+
+        pool.mark_failure(jm_1)
+        assert pool.candidates() == [jm_2, jm_0, jm_1]
+
+        pool.mark_leader(jm_0)
+        assert pool.candidates() == [jm_0, jm_2, jm_1]
+
+    def test_cooldown(self):
+        pool = EndpointPool(["jm-0", "jm-1"], cooldown=0)
+        jm_0, jm_1 = pool.candidates()
+        pool.mark_success(jm_1, 0.1)
+        pool.mark_failure(jm_0)
+        assert pool.candidates() == [jm_0, jm_1]
+
+
+class TestFailover:
+
+    def test_failover_on_connection_error(self, requests_mock):
+        requests_mock.get('http://jm-0:8081/v1/overview', exc=requests.exceptions.ConnectionError)
+        requests_mock.get('http://jm-1:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession(endpoints=EndpointPool(["jm-0", "jm-1"]))
+
+        for _ in range(2):
+            response = _execute_rest_request(url='http://jm-0:8081/v1/overview', session=session)
+            assert response['taskmanagers'] == 1
+
+        # The failed endpoint is skipped during its cooldown.
+        assert requests_mock.call_count == 3
+        assert session.counters['failovers'] == 1
+        assert [endpoint['healthy'] for endpoint in session.endpoints.status()] == [False, True]
+
+    def test_failover_on_unavailable(self, requests_mock):
+        requests_mock.get('http://jm-0:8081/v1/overview', json={'errors': []}, status_code=503)
+        requests_mock.get('http://jm-1:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession(endpoints=EndpointPool(["jm-0", "jm-1"]))
+
+        assert _execute_rest_request(url='http://jm-0:8081/v1/overview', session=session)['taskmanagers'] == 1
+
+    def test_leader_redirect(self, requests_mock):
+        requests_mock.get('http://jm-0:8081/v1/overview', status_code=307,
+                          headers={'Location': 'http://jm-1:8081/v1/overview'})
+        requests_mock.get('http://jm-1:8081/v1/overview', json={'taskmanagers': 1})
+        requests_mock.get('http://jm-1:8081/v1/config', json={'flink-version': '1.14.0'})
+        session = RestSession(endpoints=EndpointPool(["jm-0", "jm-1"]))
+
+        assert _execute_rest_request(url='http://jm-0:8081/v1/overview', session=session)['taskmanagers'] == 1
+        assert session.endpoints.leader == 'http://jm-1:8081'
+        assert session.counters['leader_redirects'] == 1
+
+        # The following requests go to the leader directly.
+        _execute_rest_request(url='http://jm-0:8081/v1/config', session=session)
+        assert requests_mock.call_count == 3
+
+    def test_no_failover_of_executed_request(self, requests_mock):
+        requests_mock.post('http://jm-0:8081/v1/jars/test_jar_id/run', exc=requests.exceptions.ReadTimeout)
+        requests_mock.post('http://jm-1:8081/v1/jars/test_jar_id/run', json={'jobid': 'test_job_id'})
+        session = RestSession(endpoints=EndpointPool(["jm-0", "jm-1"]))
+
+        with pytest.raises(RestTimeoutException):
+            _execute_rest_request(url='http://jm-0:8081/v1/jars/test_jar_id/run', http_method='POST',
+                                  session=session)
+        assert requests_mock.call_count == 1
+
+    def test_other_hosts_are_not_routed(self, requests_mock):
+        requests_mock.get('http://other:8081/v1/overview', json={'taskmanagers': 1})
+        session = RestSession(endpoints=EndpointPool(["jm-0", "jm-1"]))
+
+        assert _execute_rest_request(url='http://other:8081/v1/overview', session=session)['taskmanagers'] == 1
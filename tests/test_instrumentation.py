@@ -0,0 +1,133 @@
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib3.util import connection
+
+from flink_rest_client.common import RestException, RestSession, _execute_rest_request
+from flink_rest_client.endpoints import endpoint_template
+from flink_rest_client.instrumentation import Instrumentation, LatencyHistogram
+from flink_rest_client.retry import RetryPolicy
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status = 503 if self.path.startswith('/v1/unavailable') else 200
+        payload = json.dumps({'taskmanagers': 1}).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_port():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+class TestEndpointTemplate:
+
+    def test_templates(self):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        assert endpoint_template(f'http://host:8081/v1/jobs/{jid}/vertices/v1/metrics') == \
+            '/jobs/:jobid/vertices/:vertexid/metrics'
+        assert endpoint_template(f'http://host:8081/v1/jobs/{jid}/vertices/v1/subtasks/metrics') == \
+            '/jobs/:jobid/vertices/:vertexid/subtasks/metrics'
+        assert endpoint_template(f'http://host:8081/v1/jobs/{jid}/vertices/v1/subtasks/0') == \
+            '/jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex'
+        assert endpoint_template('http://host:8081/v1/jobs/overview') == '/jobs/overview'
+        assert endpoint_template('http://host:8081/v1/jars/upload') == '/jars/upload'
+        assert endpoint_template('http://host:8081/v1/unknown/path') == '/v1/unknown/path'
+
+
+class TestLatencyHistogram:
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        for millis in range(1, 101):
+            histogram.record(millis / 1000)
+
+        assert histogram.count == 100
+        assert histogram.percentile(50) == pytest.approx(0.050, rel=0.2)
+        assert histogram.percentile(99) == pytest.approx(0.099, rel=0.2)
+        assert histogram.percentile(100) == pytest.approx(0.1)
+        assert histogram.as_dict()['mean'] == pytest.approx(0.0505)
+
+
+class TestInstrumentation:
+
+    def test_events(self, stub_port):
+        events = []
+        instrumentation = Instrumentation(hooks=[events.append])
+        session = RestSession(instrumentation=instrumentation)
+        for _ in range(2):
+            _execute_rest_request(url=f'http://localhost:{stub_port}/v1/overview', session=session)
+
+        first, second = events
+        assert first.method == 'GET'
+        assert first.endpoint == '/overview'
+        assert first.status_code == 200
+        assert first.bytes_received == len(json.dumps({'taskmanagers': 1}))
+        assert first.dns is not None and first.connect is not None
+        assert first.ttfb >= 0 and first.total >= first.ttfb
+        # The second call reuses the pooled connection.
+        assert second.dns is None and second.connect is None
+        assert instrumentation.histograms()['GET /overview']['count'] == 2
+
+    def test_connections_are_not_altered(self, stub_port, monkeypatch):
+        hosts = []
+        create_connection = connection.create_connection
+
+        def recording_create_connection(address, *args, **kwargs):
+            hosts.append(address[0])
+            return create_connection(address, *args, **kwargs)
+
+        monkeypatch.setattr(connection, 'create_connection', recording_create_connection)
+        events = []
+        session = RestSession(instrumentation=Instrumentation(hooks=[events.append]))
+        _execute_rest_request(url=f'http://localhost:{stub_port}/v1/overview', session=session)
+
+        # urllib3 resolves the name itself, so it can try every address of the host.
+        assert hosts == ['localhost']
+        assert events[0].dns is not None and events[0].connect is not None
+
+    def test_retries_and_errors(self, stub_port):
+        events = []
+        session = RestSession(instrumentation=Instrumentation(hooks=[events.append]),
+                              retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0))
+        with pytest.raises(RestException):
+            _execute_rest_request(url=f'http://localhost:{stub_port}/v1/unavailable', session=session)
+
+        assert events[0].status_code == 503
+        assert events[0].retries == 1
+
+    def test_dump(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/jobs/overview', json={'jobs': []})
+        instrumentation = Instrumentation()
+        session = RestSession(instrumentation=instrumentation)
+        _execute_rest_request(url='http://host:8081/v1/jobs/overview', session=session)
+
+        output = io.StringIO()
+        instrumentation.dump(output)
+        assert 'GET /jobs/overview' in output.getvalue()
+
+    def test_decode_histograms(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/jobs/overview', json={'jobs': []})
+        instrumentation = Instrumentation()
+        session = RestSession(instrumentation=instrumentation)
+        _execute_rest_request(url='http://host:8081/v1/jobs/overview', session=session)
+
+        assert instrumentation.decode_histograms()['GET /jobs/overview']['count'] == 1
+        instrumentation.reset()
+        assert instrumentation.decode_histograms() == {}
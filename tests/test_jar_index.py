@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from flink_rest_client.jar_index import JarIndex, _file_digest
+
+
+class TestJarIndex:
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / 'index' / 'jar_index.json')
+        index = JarIndex(path)
+        result = {'filename': '/tmp/flink-web-upload/c17af8f2-_job.jar', 'status': 'success'}
+        index.store('http://host:8081/v1/jars', 'digest', result)
+
+        reloaded = JarIndex(path)
+        assert reloaded.lookup('http://host:8081/v1/jars', 'digest') == result
+        assert reloaded.lookup('http://other:8081/v1/jars', 'digest') is None
+
+        reloaded.discard('http://host:8081/v1/jars', 'digest')
+        assert JarIndex(path).lookup('http://host:8081/v1/jars', 'digest') is None
+
+    def test_shared_index(self, tmp_path):
+        path = str(tmp_path / 'jar_index.json')
+        first, second = JarIndex(path), JarIndex(path)
+        first.store('cluster', 'first', {'status': 'success'})
+        second.store('cluster', 'second', {'status': 'success'})
+        first.discard('cluster', 'missing')
+
+        reloaded = JarIndex(path)
+        assert reloaded.lookup('cluster', 'first') == {'status': 'success'}
+        assert reloaded.lookup('cluster', 'second') == {'status': 'success'}
+
+    def test_failed_write_leaves_no_temporary_file(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'jar_index.json')
+        index = JarIndex(path)
+        index.store('cluster', 'digest', {'status': 'success'})
+
+        def fail(*args, **kwargs):
+            raise OSError('No space left on device')
+
+        monkeypatch.setattr(json, 'dump', fail)
+        with pytest.raises(OSError):
+            index.store('cluster', 'other', {'status': 'success'})
+        monkeypatch.undo()
+
+        assert not list(tmp_path.glob('*.tmp'))
+        assert JarIndex(path).lookup('cluster', 'digest') == {'status': 'success'}
+
+    def test_corrupt_index(self, tmp_path):
+        path = tmp_path / 'jar_index.json'
+        path.write_text('{not json')
+        assert JarIndex(str(path)).lookup('cluster', 'digest') is None
+
+    def test_file_digest(self, tmp_path):
+        path = tmp_path / 'job.jar'
+        path.write_bytes(b'content')
+        assert _file_digest(str(path)) == _file_digest(str(path), chunk_size=2)
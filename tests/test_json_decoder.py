@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from flink_rest_client import json_decoder
+from flink_rest_client.json_decoder import decode_json, iter_json_array
+
+
+def chunked(document, size):
+    return [document[start:start + size] for start in range(0, len(document), size)]
+
+
+class TestDecodeJson:
+
+    def test_decode_bytes(self):
+        assert decode_json(b'{"jobs": [{"id": "a", "status": "RUNNING"}]}') == \
+            {'jobs': [{'id': 'a', 'status': 'RUNNING'}]}
+
+    def test_fastest_available_decoder(self):
+        assert json_decoder.DECODER_NAME in ('orjson', 'ujson', 'json')
+
+    def test_fallback_to_standard_library(self):
+        # Flink serializes longs, which every decoder keeps exact.
+        assert decode_json(b'{"value": 9223372036854775807}')['value'] == 9223372036854775807
+        assert decode_json(b'[NaN]')[0] != decode_json(b'[NaN]')[0]
+
+    @pytest.mark.skipif(json_decoder._fast_loads is None, reason='no fast JSON decoder installed')
+    def test_invalid_body_is_parsed_once(self, monkeypatch):
+        def loads(body):
+            raise AssertionError('The body is parsed again.')
+
+        monkeypatch.setattr(json_decoder.json, 'loads', loads)
+        for body in [b'<html>Service Unavailable</html>', b'{"errors": [', '{"errors": [']:
+            with pytest.raises(ValueError):
+                decode_json(body)
+
+
+class TestIterJsonArray:
+
+    document = json.dumps({
+        'counts': {'total': 3},
+        'latest': {'completed': None},
+        'size': 1234567,
+        'history': [{'id': 3, 'path': 's3://bucket/\u00e9'}, 12345678, [1, 2], 'text'],
+        'tail': [1],
+    }).encode()
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 4096])
+    def test_chunk_boundaries(self, size):
+        items = list(iter_json_array(chunked(self.document, size), 'history'))
+        assert items == json.loads(self.document)['history']
+
+    def test_top_level_array(self):
+        assert list(iter_json_array(chunked(b' [1, 22 , {"a": [333]}] ', 2))) == [1, 22, {'a': [333]}]
+        assert list(iter_json_array([b'[]'])) == []
+
+    def test_items_are_yielded_incrementally(self):
+        def chunks():
+            yield b'{"jobs": [{"id": 1},'
+            raise AssertionError('The second chunk is not needed for the first item.')
+
+        assert next(iter_json_array(chunks(), 'jobs')) == {'id': 1}
+
+    def test_missing_key(self):
+        with pytest.raises(KeyError):
+            list(iter_json_array([self.document], 'missing'))
+        with pytest.raises(KeyError):
+            list(iter_json_array([b'{}'], 'jobs'))
+
+    def test_truncated_document(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"jobs": [{"id": 1}, {"id"'], 'jobs'))
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"jobs": [1, 2'], 'jobs'))
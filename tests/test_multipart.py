@@ -0,0 +1,35 @@
+from flink_rest_client.multipart import MultipartFileEncoder
+
+
+class TestMultipartFileEncoder:
+
+    def test_body(self, tmp_path):
+        path = tmp_path / 'job.jar'
+        path.write_bytes(b'0123456789' * 10)
+        encoder = MultipartFileEncoder('file', str(path), content_type='application/x-java-archive', chunk_size=16)
+
+        chunks = list(encoder)
+        body = b''.join(chunks)
+        boundary = encoder.content_type.split('boundary=')[1]
+
+        assert len(body) == len(encoder)
+        assert encoder.headers['Content-Length'] == str(len(body))
+        assert body.startswith(f'--{boundary}\r\n'.encode())
+        assert b'filename="job.jar"' in body
+        assert b'Content-Type: application/x-java-archive\r\n\r\n' + b'0123456789' * 10 in body
+        assert body.endswith(f'\r\n--{boundary}--\r\n'.encode())
+        assert max(len(chunk) for chunk in chunks[1:-1]) == 16
+
+    def test_progress_callback(self, tmp_path):
+        path = tmp_path / 'job.jar'
+        path.write_bytes(b'x' * 100)
+        progress = []
+        encoder = MultipartFileEncoder('file', str(path), chunk_size=40,
+                                       progress_callback=lambda sent, total, rate: progress.append((sent, total)))
+
+        list(encoder)
+        list(encoder)
+
+        assert len(progress) == 8
+        assert progress[3] == (len(encoder), len(encoder))
+        assert all(sent <= total for sent, total in progress)
@@ -0,0 +1,28 @@
+from flink_rest_client.resource_cache import ResourceCache
+
+
+class TestResourceCache:
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / 'resources.sqlite3')
+        cache = ResourceCache(path)
+        cache.put('cluster', 'job', 'plan', {'plan': {'nodes': []}})
+        cache.close()
+
+        cache = ResourceCache(path)
+        assert cache.get('cluster', 'job', 'plan') == {'plan': {'nodes': []}}
+        assert cache.get('other_cluster', 'job', 'plan') is None
+        assert len(cache) == 1
+
+    def test_discard(self, tmp_path):
+        cache = ResourceCache(str(tmp_path / 'resources.sqlite3'))
+        cache.put('cluster', 'job', 'plan', {})
+        cache.put('cluster', 'job', 'exceptions', {})
+        cache.put('cluster', 'other_job', 'plan', {})
+
+        cache.discard('cluster', 'job', 'plan')
+        assert cache.get('cluster', 'job', 'plan') is None
+        assert cache.get('cluster', 'job', 'exceptions') == {}
+
+        cache.discard('cluster', 'job')
+        assert len(cache) == 1
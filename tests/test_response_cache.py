@@ -0,0 +1,61 @@
+import time
+
+from flink_rest_client.response_cache import ResponseCache
+
+
+class TestResponseCache:
+
+    def test_rules(self):
+        cache = ResponseCache({'/jobs/:jobid': 5, '/jobs/overview': 1, '/jobs/:jobid/plan': 3600,
+                               '/jobs/:jobid/metrics': 0})
+        assert cache.ttl_for('http://host:8081/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c') == 5
+        assert cache.ttl_for('http://host:8081/v1/jobs/overview') == 1
+        assert cache.ttl_for('http://host:8081/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/plan') == 3600
+        assert cache.ttl_for('http://host:8081/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/metrics') is None
+        assert cache.ttl_for('http://host:8081/v1/overview') is None
+
+    def test_rules_do_not_cover_literal_siblings(self):
+        cache = ResponseCache({'/jobs/:jobid': 300, '/taskmanagers/:taskmanagerid': 300})
+        assert cache.ttl_for('http://host:8081/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c') == 300
+        assert cache.ttl_for('http://host:8081/v1/jobs/metrics') is None
+        assert cache.ttl_for('http://host:8081/v1/jobs/overview') is None
+        assert cache.ttl_for('http://host:8081/v1/taskmanagers/10.0.0.1:6122-d1f4c0') == 300
+        assert cache.ttl_for('http://host:8081/v1/taskmanagers/metrics') is None
+
+    def test_freshness(self):
+        cache = ResponseCache({'/overview': 0.05}, stale_while_revalidate=60)
+        cache.put('http://host:8081/v1/overview', {'taskmanagers': 1}, 0.05)
+        assert cache.get('http://host:8081/v1/overview') == ({'taskmanagers': 1}, True)
+        time.sleep(0.06)
+        assert cache.get('http://host:8081/v1/overview') == ({'taskmanagers': 1}, False)
+
+    def test_expiry_without_stale_mode(self):
+        cache = ResponseCache({'/overview': 0.05})
+        cache.put('http://host:8081/v1/overview', {'taskmanagers': 1}, 0.05)
+        time.sleep(0.06)
+        assert cache.get('http://host:8081/v1/overview') is None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache({'/jobs/:jobid': 60}, maxsize=2)
+        for job_id in ['a', 'b', 'c']:
+            cache.put(f'http://host:8081/v1/jobs/{job_id}', {'jid': job_id}, 60)
+        assert len(cache) == 2
+        assert cache.get('http://host:8081/v1/jobs/a') is None
+
+    def test_invalidate(self):
+        cache = ResponseCache({'/jobs/:jobid': 60})
+        for job_id in ['a', 'b']:
+            cache.put(f'http://host:8081/v1/jobs/{job_id}', {'jid': job_id}, 60)
+        cache.invalidate('http://host:8081/v1/jobs/a')
+        assert cache.get('http://host:8081/v1/jobs/a') is None
+        assert cache.get('http://host:8081/v1/jobs/b') is not None
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_put_after_invalidation_is_dropped(self):
+        cache = ResponseCache({'/jobs/:jobid': 60})
+        generation = cache.generation
+        cache.invalidate('http://host:8081/v1/jobs/a')
+        assert not cache.put('http://host:8081/v1/jobs/b', {'jid': 'b'}, 60, generation=generation)
+        assert cache.get('http://host:8081/v1/jobs/b') is None
+        assert cache.put('http://host:8081/v1/jobs/b', {'jid': 'b'}, 60, generation=cache.generation)
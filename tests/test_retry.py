@@ -0,0 +1,28 @@
+from flink_rest_client.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+
+    def test_defaults(self):
+        policy = RetryPolicy()
+        assert policy.can_retry('get', 1)
+        assert policy.can_retry('GET', 2)
+        assert not policy.can_retry('GET', 3)
+        assert not policy.can_retry('POST', 1)
+        assert policy.is_retryable_status(503)
+        assert not policy.is_retryable_status(404)
+
+    def test_opt_in_methods(self):
+        policy = RetryPolicy(methods=['GET', 'POST'])
+        assert policy.can_retry('POST', 1)
+        assert not policy.can_retry('PATCH', 1)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+        assert policy.backoff(1, retry_after=3) == 3
+        assert policy.backoff(1, retry_after=60) == 5
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff_factor=1)
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
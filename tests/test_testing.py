@@ -0,0 +1,146 @@
+import pytest
+
+from flink_rest_client.common import RestException, RestSession
+from flink_rest_client.retry import RetryPolicy
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
+
+
+@pytest.fixture
+def server():
+    cluster = FakeFlinkCluster(
+        jobs=2, vertices=3, parallelism=2, taskmanagers=2, metrics=5, checkpoints=3,
+        log_size=1000, seed=42,
+    )
+    with FakeFlinkServer(cluster, seed=42) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return FlinkRestClientV1(server.host, server.port)
+
+
+class TestFakeFlinkCluster:
+
+    def test_deterministic_ids(self):
+        assert list(FakeFlinkCluster(seed=1).jobs) == list(FakeFlinkCluster(seed=1).jobs)
+
+    def test_sizes(self):
+        cluster = FakeFlinkCluster(jobs=3, vertices=2, taskmanagers=5, metrics=8, log_size=100)
+        assert len(cluster.jobs) == 3
+        assert all(len(job["vertices"]) == 2 for job in cluster.jobs.values())
+        assert len(cluster.taskmanagers) == 5
+        assert len(cluster.metric_names["taskmanager"]) == 8
+        assert len(cluster.log) == 100
+
+
+class TestFakeFlinkServer:
+
+    def test_cluster_endpoints(self, client, server):
+        assert client.overview()["jobs-running"] == 2
+        assert client.config()["flink-version"] == "1.13.2"
+        assert len(client.jobmanager.config()) == 3
+
+    def test_jobs(self, client, server):
+        job_ids = client.jobs.job_ids()
+        assert job_ids == list(server.cluster.jobs)
+        assert len(client.jobs.overview()) == 2
+        job_id = job_ids[0]
+        assert client.jobs.get(job_id)["state"] == "RUNNING"
+        assert len(client.jobs.get_vertex_ids(job_id)) == 3
+        assert len(client.jobs.get_plan(job_id)["nodes"]) == 3
+        assert client.jobs.get_execution_result(job_id)["status"]["id"] == "IN_PROGRESS"
+
+    def test_metrics(self, client, server):
+        job_id = client.jobs.job_ids()[0]
+        vertex_id = client.jobs.get_vertex_ids(job_id)[0]
+
+        metrics = client.taskmanagers.metrics(agg_modes=["max"])
+        assert len(metrics) == 5
+        assert set(next(iter(metrics.values()))) == {"max"}
+        assert len(client.jobs.get_metrics(job_id)) == 5
+
+        vertex = client.jobs.get_vertex(job_id, vertex_id)
+        assert vertex.subtasks.subtask_ids() == [0, 1]
+        assert len(vertex.metrics()) == 5
+        assert len(vertex.subtasks.metrics()) == 5
+        assert vertex.subtasks.get(1)["subtask"] == 1
+
+    def test_checkpoint_details_with_subtasks(self, client):
+        job_id = client.jobs.job_ids()[0]
+        assert client.jobs.get_checkpoint_ids(job_id) == [3, 2, 1]
+
+        details = client.jobs.get_checkpoint_details(job_id, 2, show_subtasks=True)
+        assert details["status"] == "COMPLETED"
+        assert len(details["subtasks"]) == 3
+        assert details["subtask_errors"] == {}
+
+    def test_taskmanager_logs(self, client, server):
+        taskmanager_id = client.taskmanagers.taskmanager_ids()[0]
+        logs = client.taskmanagers.get_logs(taskmanager_id)
+        assert logs[0]["size"] == 1000
+        assert client.taskmanagers.get_log(taskmanager_id, logs[0]["name"]).encode() == server.cluster.log
+        assert len(client.taskmanagers.get_thread_dump(taskmanager_id)) == 8
+
+    def test_jar_upload_and_run(self, client, server, tmp_path):
+        jar_path = tmp_path / "job.jar"
+        jar_path.write_bytes(b"PK" + b"\0" * 100)
+
+        job_id = client.jars.upload_and_run(path_to_jar=str(jar_path))
+        assert job_id in server.cluster.jobs
+        jar_id = client.jars.all()["files"][0]["id"]
+        assert jar_id.endswith("_job.jar")
+        client.jars.delete(jar_id)
+        assert client.jars.all()["files"] == []
+
+    def test_savepoint_and_stop(self, client, server):
+        job_id = client.jobs.job_ids()[0]
+        trigger = client.jobs.create_savepoint(job_id, "s3://bucket/savepoints")
+        status = trigger.status
+        assert status["status"]["id"] == "COMPLETED"
+        assert status["operation"]["location"].startswith("s3://bucket/savepoints/")
+
+        client.jobs.stop(job_id, "s3://bucket/savepoints").status
+        assert server.cluster.jobs[job_id]["state"] == "FINISHED"
+
+        other_job_id = client.jobs.job_ids()[1]
+        client.jobs.terminate(other_job_id)
+        assert server.cluster.jobs[other_job_id]["state"] == "CANCELED"
+
+    def test_trigger_duration(self):
+        cluster = FakeFlinkCluster(jobs=1, trigger_duration=60)
+        with FakeFlinkServer(cluster) as server:
+            client = FlinkRestClientV1(server.host, server.port)
+            trigger = client.jobs.create_savepoint(client.jobs.job_ids()[0], "/tmp")
+            assert trigger.status["status"]["id"] == "IN_PROGRESS"
+
+    def test_not_found(self, client):
+        with pytest.raises(RestException):
+            client.jobs.get("0" * 32)
+
+    def test_request_counts(self, client, server):
+        client.jobs.all()
+        client.jobs.all()
+        assert server.request_counts["GET /jobs"] == 2
+
+    def test_set_route(self, client, server):
+        server.set_route("GET", "/overview", lambda request: (200, {"jobs-running": 99}))
+        assert client.overview()["jobs-running"] == 99
+
+    def test_fail_next_with_retries(self, server):
+        session = RestSession(retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0))
+        client = FlinkRestClientV1(server.host, server.port, session=session)
+        server.fail_next(count=2, status=503)
+        assert client.overview()["taskmanagers"] == 2
+        assert server.request_counts["GET /overview"] == 3
+
+        server.fail_next(count=3, status=500)
+        with pytest.raises(RestException):
+            client.overview()
+
+    def test_failure_rate(self):
+        with FakeFlinkServer(failure_rate=1.0, failure_status=502) as server:
+            client = FlinkRestClientV1(server.host, server.port)
+            with pytest.raises(RestException):
+                client.overview()
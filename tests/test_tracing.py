@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from flink_rest_client.common import RestSession
+from flink_rest_client.tracing import Tracer
+from flink_rest_client.v1.client import FlinkRestClientV1
+
+
+class TestTracer:
+
+    def test_nested_spans(self):
+        finished = []
+        tracer = Tracer(on_span_end=lambda span: finished.append(span.to_otel()))
+        with tracer.span('parent') as parent:
+            with tracer.span('child', kind='client', attributes={'http.method': 'GET'}):
+                pass
+
+        child, root = tracer.spans()
+        assert root is parent
+        assert root.parent_id is None
+        assert child.parent_id == root.span_id
+        assert child.trace_id == root.trace_id
+        assert root.start_time <= child.start_time <= child.end_time <= root.end_time
+        assert [span['name'] for span in finished] == ['child', 'parent']
+        assert finished[0]['kind'] == 'SPAN_KIND_CLIENT'
+        assert finished[0]['attributes'] == {'http.method': 'GET'}
+
+    def test_error(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError):
+            with tracer.span('failing'):
+                raise ValueError('boom')
+
+        assert tracer.spans()[0].to_otel()['status']['status_code'] == 'ERROR'
+
+    def test_max_spans(self):
+        tracer = Tracer(max_spans=2)
+        for name in ['a', 'b', 'c']:
+            with tracer.span(name):
+                pass
+
+        assert [span.name for span in tracer.spans()] == ['b', 'c']
+
+    def test_chrome_trace(self, tmp_path):
+        tracer = Tracer()
+        with tracer.span('parent'):
+            pass
+        path = tmp_path / 'trace.json'
+        tracer.export_chrome_trace(str(path))
+
+        event, = json.loads(path.read_text())['traceEvents']
+        assert event['name'] == 'parent'
+        assert event['ph'] == 'X'
+        assert event['dur'] >= 0
+
+
+class TestClientTracing:
+
+    def test_checkpoint_details(self, requests_mock):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        prefix = f'http://host:8081/v1/jobs/{jid}/checkpoints/details/1'
+        requests_mock.get(prefix, json={'id': 1, 'status': 'COMPLETED', 'tasks': {'v1': {}, 'v2': {}}})
+        requests_mock.get(f'{prefix}/subtasks/v1', json={'id': 'v1'})
+        requests_mock.get(f'{prefix}/subtasks/v2', json={'id': 'v2'})
+        tracer = Tracer()
+        client = FlinkRestClientV1('host', 8081, session=RestSession(tracer=tracer))
+
+        client.jobs.get_checkpoint_details(jid, 1, show_subtasks=True)
+
+        *requests, parent = tracer.spans()
+        assert parent.name == 'JobsClient.get_checkpoint_details'
+        assert len(requests) == 3
+        assert all(span.parent_id == parent.span_id for span in requests)
+        assert {span.name for span in requests} == {
+            'GET /jobs/:jobid/checkpoints/details/:checkpointid',
+            'GET /jobs/:jobid/checkpoints/details/:checkpointid/subtasks/:vertexid',
+        }
+        assert all(span.attributes['http.status_code'] == 200 for span in requests)
+
+    def test_untraced_session(self, requests_mock):
+        requests_mock.get('http://host:8081/v1/jobs', json={'jobs': []})
+        client = FlinkRestClientV1('host', 8081)
+
+        assert client.jobs.all() == []
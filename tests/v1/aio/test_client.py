@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import importlib_resources
+import pytest
+
+from flink_rest_client import FlinkRestClient
+from flink_rest_client.aio import AsyncRestSession
+from flink_rest_client.common import RestException
+from flink_rest_client.v1.aio import jobs as aio_jobs
+
+pytest.importorskip("aiohttp")
+
+ROUTES = {
+    ('GET', '/v1/overview'): (200, {'taskmanagers': 1, 'flink-version': '1.12.4'}),
+    ('GET', '/v1/jobs'): (200, {'jobs': [{'id': 'a0d4b5b51065202b788bbd0a80251a3c', 'status': 'RUNNING'}]}),
+    ('GET', '/v1/jobs/missing'): (404, {'errors': ['Job not found.']}),
+    ('GET', '/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/checkpoints/details/1'): (200, {'id': 1, 'tasks': {
+        'v1': {}, 'v2': {}}}),
+    ('GET', '/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/checkpoints/details/1/subtasks/v1'): (200, {'id': 'v1'}),
+    ('GET', '/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/checkpoints/details/1/subtasks/v2'): (200, {'id': 'v2'}),
+    ('GET', '/v1/jobs/a0d4b5b51065202b788bbd0a80251a3c/vertices/v1/subtasks/metrics'): (200, [
+        {'id': 'numRecordsIn', 'min': 1.0, 'max': 2.0, 'avg': 1.5, 'sum': 3.0}]),
+    ('GET', '/v1/jobmanager/logs/jobmanager.log'): (200, 'content_of_the_log_file'),
+    ('POST', '/v1/jars/upload'): (200, {'filename': '/tmp/flink-web-upload/c17af8f2-_StateMachineExample.jar',
+                                        'status': 'success'}),
+    ('POST', '/v1/jars/c17af8f2-_StateMachineExample.jar/run'): (200, {'jobid': 'bdtg564'}),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, method):
+        length = int(self.headers.get('Content-Length', 0))
+        if length:
+            self.rfile.read(length)
+        status, body = ROUTES.get((method, urlparse(self.path).path), (404, {'errors': ['Not found.']}))
+        payload = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._reply('GET')
+
+    def do_POST(self):
+        self._reply('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_port():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+def run(stub_port, query):
+    async def _run():
+        async with FlinkRestClient.get_async('127.0.0.1', stub_port) as client:
+            return await query(client)
+    return asyncio.run(_run())
+
+
+class TestAsyncClientV1:
+
+    def test_overview(self, stub_port):
+        response = run(stub_port, lambda client: client.overview())
+
+        assert isinstance(response, dict)
+        assert response['flink-version'] == '1.12.4'
+
+    def test_jobs_all(self, stub_port):
+        response = run(stub_port, lambda client: client.jobs.all())
+
+        assert response[0]['id'] == 'a0d4b5b51065202b788bbd0a80251a3c'
+
+    def test_error(self, stub_port):
+        with pytest.raises(RestException):
+            run(stub_port, lambda client: client.jobs.get('missing'))
+
+    def test_checkpoint_details(self, stub_port):
+        response = run(stub_port, lambda client: client.jobs.get_checkpoint_details(
+            'a0d4b5b51065202b788bbd0a80251a3c', 1, show_subtasks=True))
+
+        assert response['subtasks']['v1']['id'] == 'v1'
+        assert response['subtasks']['v2']['id'] == 'v2'
+
+    def test_subtask_metrics(self, stub_port):
+        response = run(stub_port, lambda client: client.jobs.get_vertex(
+            'a0d4b5b51065202b788bbd0a80251a3c', 'v1').subtasks.metrics(metric_names=['numRecordsIn'],
+                                                                       subtask_ids=[0, 1]))
+
+        assert response['numRecordsIn']['sum'] == 3.0
+
+    def test_get_log(self, stub_port):
+        response = run(stub_port, lambda client: client.jobmanager.get_log('jobmanager.log'))
+
+        assert response == 'content_of_the_log_file'
+
+    def test_upload_and_run(self, stub_port):
+        with importlib_resources.path("tests.data.sample_jars", "StateMachineExample.jar") as fpath:
+            response = run(stub_port, lambda client: client.jars.upload_and_run(fpath))
+
+        assert response == 'bdtg564'
+
+    def test_checkpoint_subtasks_are_bounded(self, monkeypatch):
+        in_flight, peak = [0], [0]
+
+        async def execute(url, session, **kwargs):
+            if url.endswith('/checkpoints/details/1'):
+                return {'id': 1, 'tasks': {f'v{index}': {} for index in range(10)}}
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return {'id': url.rsplit('/', 1)[-1]}
+
+        monkeypatch.setattr(aio_jobs, '_execute_async_rest_request', execute)
+        response = run(0, lambda client: client.jobs.get_checkpoint_details(
+            'a0d4b5b51065202b788bbd0a80251a3c', 1, show_subtasks=True, max_workers=3))
+
+        assert len(response['subtasks']) == 10
+        assert peak[0] == 3
+
+    def test_session_timeouts(self):
+        async def _timeout():
+            async with AsyncRestSession(connect_timeout=2, read_timeout=30) as session:
+                return session._client_session().timeout
+
+        timeout = asyncio.run(_timeout())
+        assert (timeout.total, timeout.sock_connect, timeout.sock_read) == (None, 2, 30)
@@ -1,5 +1,9 @@
 
-from flink_rest_client.v1.client import DatasetTrigger
+import time
+
+from flink_rest_client.common import RestTimeoutException
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import DatasetTrigger, FlinkRestClientV1
 from tests.v1.test_base import TestBase
 
 
@@ -17,6 +21,13 @@ class TestClientV1(TestBase):
     def test_jars(self, simple_client):
         assert simple_client.jars.prefix == 'http://host:8081/v1/jars'
 
+    def test_shared_session(self, simple_client):
+        assert simple_client.jobmanager._session is simple_client.session
+        assert simple_client.taskmanagers._session is simple_client.session
+        assert simple_client.jars._session is simple_client.session
+        assert simple_client.jobs._session is simple_client.session
+        assert simple_client.jobs.get_vertex('job', 'vertex').subtasks._session is simple_client.session
+
     def test_overview(self, simple_client, requests_mock):
         requests_mock.get(f'{simple_client.api_url}/overview', json={
             'taskmanagers': 1,
@@ -75,3 +86,50 @@ class TestClientV1(TestBase):
 
 
 
+
+
+class TestSnapshot:
+
+    def test_snapshot(self):
+        cluster = FakeFlinkCluster(jobs=10, taskmanagers=3, metrics=4, checkpoints=5)
+        with FakeFlinkServer(cluster, latency=0.05) as server:
+            client = FlinkRestClientV1(server.host, server.port)
+            started_at = time.monotonic()
+            snapshot = client.snapshot(include_metrics=True, include_checkpoints=True)
+            elapsed = time.monotonic() - started_at
+
+        job_ids = list(cluster.jobs)
+        assert snapshot['overview']['jobs-running'] == 10
+        assert len(snapshot['jobs_overview']) == 10
+        assert len(snapshot['taskmanagers']) == 3
+        assert list(snapshot['jobs']) == job_ids
+        assert all(len(metrics) == 4 for metrics in snapshot['job_metrics'].values())
+        assert snapshot['checkpoints'][job_ids[0]]['counts']['completed'] == 5
+        assert 'history' not in snapshot['checkpoints'][job_ids[0]]
+        assert snapshot['errors'] == {}
+        assert len(snapshot['timestamps']) == 3 + 3 * 10
+        assert snapshot['started'] <= snapshot['timestamps']['overview'] <= snapshot['finished']
+        assert snapshot['skew'] < elapsed
+        # 33 requests of 50 ms each are executed concurrently, sequentially they would take at least 1.65 seconds.
+        assert elapsed < 33 * 0.05
+
+    def test_job_filter(self):
+        cluster = FakeFlinkCluster(jobs=3)
+        job_ids = list(cluster.jobs)
+        cluster.set_job_state(job_ids[0], 'FINISHED')
+        with FakeFlinkServer(cluster) as server:
+            snapshot = FlinkRestClientV1(server.host, server.port).snapshot(
+                job_filter=lambda job: job['state'] == 'RUNNING')
+
+        assert list(snapshot['jobs']) == job_ids[1:]
+        assert 'job_metrics' not in snapshot and 'checkpoints' not in snapshot
+
+    def test_timeout(self):
+        with FakeFlinkServer(FakeFlinkCluster(jobs=2), latency=0.5) as server:
+            snapshot = FlinkRestClientV1(server.host, server.port).snapshot(timeout=0.1)
+
+        assert snapshot['overview'] is None
+        assert set(snapshot['errors']) == {'overview', 'jobs_overview', 'taskmanagers'}
+        assert all(isinstance(error, RestTimeoutException) for error in snapshot['errors'].values())
+        assert snapshot['jobs'] == {}
+        assert snapshot['timestamps'] == {}
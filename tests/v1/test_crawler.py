@@ -0,0 +1,90 @@
+import pytest
+
+from flink_rest_client.common import RestException
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
+from flink_rest_client.v1.crawler import crawl_topology
+
+
+@pytest.fixture
+def server():
+    cluster = FakeFlinkCluster(jobs=3, vertices=2, parallelism=3, seed=7)
+    with FakeFlinkServer(cluster) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return FlinkRestClientV1(server.host, server.port)
+
+
+class TestCrawlTopology:
+
+    def test_whole_tree(self, client, server):
+        cluster = server.cluster
+        job_id = next(iter(cluster.jobs))
+        vertex_id = cluster.jobs[job_id]["vertices"][1]["id"]
+        cluster.restart_subtask(job_id, vertex_id, 2)
+        cluster.restart_subtask(job_id, vertex_id, 2)
+
+        topology = client.jobs.topology()
+
+        assert topology.errors == {}
+        assert list(topology.jobs) == list(cluster.jobs)
+        job = topology.jobs[job_id]
+        assert job.state == 'RUNNING'
+        assert [vertex.vertex_id for vertex in job.vertices] == [
+            vertex['id'] for vertex in cluster.jobs[job_id]['vertices']
+        ]
+        assert len(list(topology.iter_subtasks())) == 3 * 2 * 3
+
+        subtask = job.vertices[1].subtasks[2]
+        assert [attempt.attempt for attempt in subtask.attempts] == [0, 1, 2]
+        assert [attempt.status for attempt in subtask.attempts] == ['FAILED', 'FAILED', 'RUNNING']
+        assert subtask.current.accumulators == []
+        assert all(attempt.accumulators == [] for attempt in subtask.attempts)
+        assert len(job.vertices[0].subtasks[0].attempts) == 1
+
+        # One request per job, two per vertex, and two per previous attempt of the restarted subtask.
+        counts = server.request_counts
+        assert counts['GET /jobs/:jobid'] == 3
+        assert counts['GET /jobs/:jobid/vertices/:vertexid'] == 6
+        assert counts['GET /jobs/:jobid/vertices/:vertexid/subtasks/accumulators'] == 6
+        assert counts['GET /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex/attempts/:attempt'] == 2
+        assert counts['GET /jobs/:jobid/vertices/:vertexid/subtasks/:subtaskindex'] == 0
+
+    def test_selected_levels(self, client, server):
+        job_ids = list(server.cluster.jobs)[:2]
+        topology = crawl_topology(client.jobs, job_ids=job_ids + job_ids[:1], levels=['subtasks'])
+
+        assert list(topology.jobs) == job_ids
+        assert server.request_counts['GET /jobs/:jobid'] == 2
+        assert server.request_counts['GET /jobs/:jobid/vertices/:vertexid/subtasks/accumulators'] == 0
+        subtask = topology.jobs[job_ids[0]].vertices[0].subtasks[0]
+        assert subtask.current.accumulators is None
+
+        jobs_only = client.jobs.topology(job_ids=job_ids, levels=[])
+        assert jobs_only.jobs[job_ids[0]].vertices is None
+        assert jobs_only.as_dict()['jobs'][job_ids[0]]['vertices'] is None
+
+    def test_invalid_level(self, client):
+        with pytest.raises(RestException, match='tasks'):
+            client.jobs.topology(levels=['tasks'])
+
+    def test_missing_parts(self, client, server):
+        job_id, other_job_id = list(server.cluster.jobs)[:2]
+        vertex_id = server.cluster.jobs[job_id]['vertices'][0]['id']
+
+        def vertex(request):
+            if request.path_params['vertexid'] == vertex_id:
+                return 500, {'errors': ['Internal server error.']}
+            return server._vertex(request)
+
+        server.set_route('GET', '/jobs/:jobid/vertices/:vertexid', vertex)
+        topology = client.jobs.topology(job_ids=[job_id, other_job_id, '0' * 32])
+
+        assert set(topology.errors) == {f'jobs/{"0" * 32}', f'jobs/{job_id}/vertices/{vertex_id}'}
+        assert list(topology.jobs) == [job_id, other_job_id]
+        assert topology.jobs[job_id].vertices[0].subtasks is None
+        assert len(topology.jobs[job_id].vertices[1].subtasks) == 3
+        assert 'Internal server error.' in topology.as_dict()['errors'][f'jobs/{job_id}/vertices/{vertex_id}']
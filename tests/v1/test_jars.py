@@ -1,5 +1,7 @@
 import importlib_resources
 
+from flink_rest_client.jar_index import JarIndex
+from flink_rest_client.v1.client import FlinkRestClientV1
 from tests.v1.test_base import TestBase
 
 
@@ -25,6 +27,25 @@ class TestJarClient(TestBase):
         assert response['status'] == 'success'
         assert response['filename'] == '/tmp/flink-web-dc68d2c5/flink-web-upload/c17af8f2-_StateMachineExample.jar'
 
+    def test_upload_deduplicated(self, requests_mock, tmp_path):
+        client = FlinkRestClientV1('host', 8081, jar_index=JarIndex(str(tmp_path / 'jar_index.json')))
+        jar_id = 'c17af8f2-_StateMachineExample.jar'
+        requests_mock.post(f'{client.jars.prefix}/upload', json={
+            'filename': f'/tmp/flink-web-dc68d2c5/flink-web-upload/{jar_id}',
+            'status': 'success'})
+        requests_mock.get(f'{client.jars.prefix}', json={'files': [{'id': jar_id}]})
+
+        with importlib_resources.path("tests.data.sample_jars", "StateMachineExample.jar") as fpath:
+            first = client.jars.upload(fpath)
+            second = client.jars.upload(fpath)
+
+            assert first == second
+            assert [request.method for request in requests_mock.request_history] == ['POST', 'GET']
+
+            requests_mock.get(f'{client.jars.prefix}', json={'files': []})
+            client.jars.upload(fpath)
+            assert [request.method for request in requests_mock.request_history] == ['POST', 'GET', 'GET', 'POST']
+
     def test_run(self, simple_client, requests_mock):
         jar_id = 'test_jar_id'
         job_id = "bdtg564"
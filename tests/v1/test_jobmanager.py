@@ -1,4 +1,6 @@
+import pytest
 
+from flink_rest_client.common import RestException
 from tests.v1.test_base import TestBase
 
 
@@ -41,6 +43,36 @@ class TestJobmanagerClient(TestBase):
         assert isinstance(response, str)
         assert response == content
 
+    def test_stream_log(self, simple_client, requests_mock):
+        log_file = "flink--standalonesession-1-64c17dab68c5.log"
+        content = "".join(f"line {index} \u00e9\n" for index in range(100)) + "last line"
+
+        requests_mock.get(f'{simple_client.jobmanager.prefix}/logs/{log_file}', text=content)
+        chunks = list(simple_client.jobmanager.stream_log(log_file, chunk_size=64))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == content
+        assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+    def test_download_log(self, simple_client, requests_mock, tmp_path):
+        log_file = "flink--standalonesession-1-64c17dab68c5.log"
+        content = "content_of_the_log_file\n" * 100
+
+        requests_mock.get(f'{simple_client.jobmanager.prefix}/logs/{log_file}', text=content)
+        target = tmp_path / log_file
+        written = simple_client.jobmanager.download_log(log_file, str(target), buffer_size=64)
+
+        assert written == len(content)
+        assert target.read_text() == content
+
+    def test_get_log_error(self, simple_client, requests_mock):
+        log_file = "missing.log"
+        requests_mock.get(f'{simple_client.jobmanager.prefix}/logs/{log_file}', json={'errors': ['Not found.']},
+                          status_code=404)
+
+        with pytest.raises(RestException):
+            simple_client.jobmanager.get_log(log_file)
+
     def test_metric_names(self, simple_client, requests_mock):
         requests_mock.get(f'{simple_client.jobmanager.prefix}/metrics', json=[
             {'id': 'Status.JVM.GarbageCollector.PS_MarkSweep.Time'},
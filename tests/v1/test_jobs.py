@@ -1,5 +1,13 @@
 import math
+import re
 
+import pytest
+
+from flink_rest_client.common import Deadline, RestException, RestSession, RestTimeoutException
+from flink_rest_client.resource_cache import ResourceCache
+from flink_rest_client.response_cache import ResponseCache
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
 from flink_rest_client.v1.jobs import JobTrigger, JobVertexClient
 from tests.v1.test_base import TestBase
 
@@ -42,6 +50,30 @@ class TestJobsClient(TestBase):
         assert response[0]['name'] == 'State machine job'
         assert response[0]['state'] == 'RUNNING'
 
+    def test_iter_all(self, simple_client, requests_mock):
+        requests_mock.get(f'{simple_client.jobs.prefix}', json={'jobs': [
+            {'id': 'a0d4b5b51065202b788bbd0a80251a3c', 'status': 'RUNNING'},
+            {'id': 'b0d4b5b51065202b788bbd0a80251a3c', 'status': 'FINISHED'},
+        ]})
+        jobs = simple_client.jobs.iter_all(chunk_size=16)
+
+        assert next(jobs)['id'] == 'a0d4b5b51065202b788bbd0a80251a3c'
+        assert [job['status'] for job in jobs] == ['FINISHED']
+
+    def test_iter_overview(self, simple_client, requests_mock):
+        requests_mock.get(f'{simple_client.jobs.prefix}/overview', json={'jobs': [
+            {'jid': f'{index:032x}', 'name': 'State machine job', 'state': 'FINISHED'} for index in range(1000)
+        ]})
+        jobs = list(simple_client.jobs.iter_overview())
+
+        assert len(jobs) == 1000
+        assert jobs[-1]['jid'] == f'{999:032x}'
+
+    def test_iter_overview_error(self, simple_client, requests_mock):
+        requests_mock.get(f'{simple_client.jobs.prefix}/overview', status_code=500, json={'errors': ['Boom.']})
+        with pytest.raises(RestException, match='Boom.'):
+            list(simple_client.jobs.iter_overview())
+
     def test_metric_names(self, simple_client, requests_mock):
         requests_mock.get(f'{simple_client.jobs.prefix}/metrics', json=[
             {'id': 'numberOfFailedCheckpoints'},
@@ -222,6 +254,18 @@ class TestJobsClient(TestBase):
         assert isinstance(response['summary'], dict)
         assert response['counts']['restored'] == 0
 
+    def test_iter_checkpoints(self, simple_client, requests_mock):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        requests_mock.get(f'{simple_client.jobs.prefix}/{jid}/checkpoints', json={
+            'counts': {'restored': 0, 'total': 22645},
+            'summary': {'state_size': {'min': 0, 'max': 1024}},
+            'latest': {'completed': {'id': 22819}, 'failed': None},
+            'history': [{'@class': 'completed', 'id': 22819 - index, 'status': 'COMPLETED'} for index in range(50)]
+        })
+        checkpoint_ids = [elem['id'] for elem in simple_client.jobs.iter_checkpoints(jid, chunk_size=32)]
+
+        assert checkpoint_ids == list(range(22819, 22769, -1))
+
     def test_get_checkpoint_ids(self, simple_client, requests_mock):
         jid = 'a0d4b5b51065202b788bbd0a80251a3c'
         requests_mock.get(f'{simple_client.jobs.prefix}/{jid}/checkpoints', json={
@@ -293,6 +337,26 @@ class TestJobsClient(TestBase):
         assert response['id'] == cid
         assert len(response['subtasks']) == 1
 
+    def test_get_checkpoint_details_with_subtask_errors(self, simple_client, requests_mock):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        cid = 23342
+        vertex_ids = ['20ba6b65f97481d5570070de90e4e791', 'bc764cd8ddf7a0cff126f51c16239658']
+        requests_mock.get(f'{simple_client.jobs.prefix}/{jid}/checkpoints/details/{cid}', json={
+            'id': cid,
+            'status': 'COMPLETED',
+            'tasks': {vertex_id: {'id': cid, 'status': 'COMPLETED'} for vertex_id in vertex_ids}
+        })
+        requests_mock.get(f'{simple_client.jobs.prefix}/{jid}/checkpoints/details/{cid}/subtasks/{vertex_ids[0]}',
+                          json={'id': cid, 'status': 'COMPLETED'})
+        requests_mock.get(f'{simple_client.jobs.prefix}/{jid}/checkpoints/details/{cid}/subtasks/{vertex_ids[1]}',
+                          json={'errors': ['Vertex not found.']}, status_code=404)
+
+        response = simple_client.jobs.get_checkpoint_details(jid, cid, show_subtasks=True, max_workers=2)
+
+        assert list(response['subtasks'].keys()) == [vertex_ids[0]]
+        assert list(response['subtask_errors'].keys()) == [vertex_ids[1]]
+        assert isinstance(response['subtask_errors'][vertex_ids[1]], RestException)
+
     def test_rescale(self, simple_client, requests_mock):
         jid = 'a0d4b5b51065202b788bbd0a80251a3c'
         tid = 'test_trigger_id'
@@ -362,3 +426,180 @@ class TestJobsClient(TestBase):
         assert isinstance(response, JobVertexClient)
         assert response.job_id == jid
         assert response.vertex_id == vertex_id
+
+    def test_stop_invalidates_cached_job(self, requests_mock):
+        client = FlinkRestClientV1('host', 8081, session=RestSession(
+            response_cache=ResponseCache({'/jobs/:jobid': 60, '/jobs/overview': 60})))
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        requests_mock.get(f'{client.jobs.prefix}/{jid}', [{'json': {'state': 'RUNNING'}},
+                                                          {'json': {'state': 'FINISHED'}}])
+        requests_mock.get(f'{client.jobs.prefix}/overview', json={'jobs': []})
+        requests_mock.post(f'{client.jobs.prefix}/{jid}/stop', json={'request-id': 'test_trigger_id'},
+                           status_code=202)
+
+        assert client.jobs.get(jid)['state'] == 'RUNNING'
+        client.jobs.overview()
+        client.jobs.stop(jid, 'test')
+        assert client.jobs.get(jid)['state'] == 'FINISHED'
+        assert len(client.session.response_cache) == 1
+
+    def test_cancel_invalidates_cached_job_ids(self, requests_mock):
+        client = FlinkRestClientV1('host', 8081, session=RestSession(metadata_ttl=60))
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        requests_mock.get(client.jobs.prefix, [{'json': {'jobs': [{'id': jid, 'status': 'RUNNING'}]}},
+                                               {'json': {'jobs': []}}])
+        requests_mock.patch(f'{client.jobs.prefix}/{jid}', json={}, status_code=202)
+
+        assert client.jobs.job_ids() == [jid]
+        client.jobs.terminate(jid)
+        assert client.jobs.job_ids() == []
+
+    def test_immutable_resources(self, requests_mock, tmp_path):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        prefix = 'http://host:8081/v1/jobs'
+        requests_mock.get(f'{prefix}/{jid}/plan', json={'plan': {'jid': jid}})
+        requests_mock.get(f'{prefix}/{jid}/execution-result', [
+            {'json': {'status': {'id': 'IN_PROGRESS'}}},
+            {'json': {'status': {'id': 'COMPLETED'}, 'job-execution-result': {'id': jid}}},
+        ])
+        requests_mock.get(f'{prefix}/{jid}/exceptions', json={'all-exceptions': []})
+        requests_mock.get(f'{prefix}/{jid}', json={'jid': jid, 'state': 'FINISHED'})
+        requests_mock.get(f'{prefix}/{jid}/checkpoints/details/1', json={'id': 1, 'status': 'COMPLETED'})
+        requests_mock.get(f'{prefix}/{jid}/checkpoints/details/2', json={'id': 2, 'status': 'IN_PROGRESS'})
+
+        path = str(tmp_path / 'resources.sqlite3')
+        for _ in range(2):
+            client = FlinkRestClientV1('host', 8081, resource_cache=ResourceCache(path))
+            assert client.jobs.get_plan(jid) == {'jid': jid}
+            client.jobs.get_execution_result(jid)
+            client.jobs.get_exceptions(jid)
+            client.jobs.get_checkpoint_details(jid, 1)
+            client.jobs.get_checkpoint_details(jid, 2)
+
+        counts = {}
+        for request in requests_mock.request_history:
+            counts[request.path] = counts.get(request.path, 0) + 1
+        assert counts == {
+            f'/v1/jobs/{jid}/plan': 1,
+            f'/v1/jobs/{jid}/execution-result': 2,
+            f'/v1/jobs/{jid}/exceptions': 1,
+            f'/v1/jobs/{jid}': 1,
+            f'/v1/jobs/{jid}/checkpoints/details/1': 1,
+            f'/v1/jobs/{jid}/checkpoints/details/2': 2,
+        }
+        assert client.jobs.get_execution_result(jid)['status']['id'] == 'COMPLETED'
+
+    def test_exceptions_of_running_job_are_not_cached(self, requests_mock, tmp_path):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        prefix = 'http://host:8081/v1/jobs'
+        requests_mock.get(f'{prefix}/{jid}/exceptions', json={'all-exceptions': []})
+        requests_mock.get(f'{prefix}/{jid}', json={'jid': jid, 'state': 'RUNNING'})
+
+        client = FlinkRestClientV1('host', 8081, resource_cache=ResourceCache(str(tmp_path / 'resources.sqlite3')))
+        client.jobs.get_exceptions(jid)
+
+        assert len(client.resource_cache) == 0
+
+    def test_exceptions_fetched_before_termination_are_not_cached(self, requests_mock, tmp_path):
+        jid = 'a0d4b5b51065202b788bbd0a80251a3c'
+        prefix = 'http://host:8081/v1/jobs'
+        state = {'state': 'RUNNING'}
+
+        def exceptions(request, context):
+            # The job terminates right after its exceptions have been taken.
+            exceptions = {'all-exceptions': [], 'truncated': state['state'] == 'RUNNING'}
+            state['state'] = 'FAILED'
+            return exceptions
+
+        requests_mock.get(f'{prefix}/{jid}/exceptions', json=exceptions)
+        requests_mock.get(f'{prefix}/{jid}', json=lambda request, context: {'jid': jid, 'state': state['state']})
+
+        client = FlinkRestClientV1('host', 8081, resource_cache=ResourceCache(str(tmp_path / 'resources.sqlite3')))
+        assert client.jobs.get_exceptions(jid)['truncated']
+        assert len(client.resource_cache) == 0
+        assert not client.jobs.get_exceptions(jid)['truncated']
+        assert not client.jobs.get_exceptions(jid)['truncated']
+        assert len(client.resource_cache) == 1
+
+
+class TestBulkOperations:
+
+    @pytest.fixture
+    def cluster(self):
+        return FakeFlinkCluster(jobs=6, trigger_duration=0.2, seed=7)
+
+    @pytest.fixture
+    def client(self, cluster):
+        with FakeFlinkServer(cluster) as server:
+            yield FlinkRestClientV1(server.host, server.port)
+
+    def test_bulk_savepoint(self, cluster, client):
+        results = client.jobs.bulk_savepoint('s3://bucket/savepoints', max_parallelism=2,
+                                             max_requests_per_second=200)
+
+        assert list(results) == list(cluster.jobs)
+        rows = [result.as_dict() for result in results.values()]
+        assert all(row['succeeded'] for row in rows)
+        assert all(row['location'].startswith('s3://bucket/savepoints/') for row in rows)
+        assert all(row['duration'] >= 0.2 for row in rows)
+        # Only two savepoints are in progress at once.
+        queued = sorted(row['queued'] for row in rows)
+        assert queued[1] < 0.1 and queued[2] >= 0.2 and queued[4] >= 0.4
+        assert all(job['state'] == 'RUNNING' for job in cluster.jobs.values())
+
+    def test_bulk_stop_with_predicate(self, cluster, client):
+        job_ids = list(cluster.jobs)
+        cluster.set_job_state(job_ids[0], 'FAILED')
+        cluster.jobs[job_ids[1]]['name'] = 'other'
+
+        results = client.jobs.bulk_stop('s3://bucket/savepoints', max_requests_per_second=200,
+                                        predicate=lambda job: job['state'] == 'RUNNING' and job['name'] != 'other')
+
+        assert list(results) == job_ids[2:]
+        assert all(result.succeeded for result in results.values())
+        assert [job['state'] for job in cluster.jobs.values()] == ['FAILED', 'RUNNING'] + ['FINISHED'] * 4
+
+    def test_errors_and_timeout(self, cluster, client):
+        unknown_job_id = '0' * 32
+        results = client.jobs.bulk_savepoint('s3://bucket/savepoints', job_ids=[unknown_job_id] + list(cluster.jobs),
+                                             max_parallelism=1, timeout=0.35, max_requests_per_second=200)
+
+        assert isinstance(results[unknown_job_id].error, RestException)
+        assert results[unknown_job_id].trigger is None
+        assert results[unknown_job_id].as_dict()['job_id'] == unknown_job_id
+        assert [result.as_dict()['job_id'] for result in results.values()] == list(results)
+        outcomes = [result.succeeded for result in results.values()]
+        assert outcomes[1] is True
+        assert not any(outcomes[2:])
+        assert all(isinstance(result.error, RestTimeoutException) for result in list(results.values())[2:])
+
+    def test_timeout_reports_enclosing_deadline(self, cluster, client):
+        with Deadline(0.35):
+            results = client.jobs.bulk_savepoint('s3://bucket/savepoints', max_parallelism=1, timeout=60,
+                                                 max_requests_per_second=200)
+
+        errors = [str(result.error) for result in list(results.values())[1:]]
+        assert 'was not completed within' in errors[0] and 'was not triggered within' in errors[-1]
+        assert all(re.search(r'within 0\.\d+ seconds', error) for error in errors)
+
+    def test_duplicates_and_unexpected_errors(self, cluster, monkeypatch):
+        job_ids = list(cluster.jobs)[:3]
+        with FakeFlinkServer(cluster) as server:
+            client = FlinkRestClientV1(server.host, server.port)
+            create_savepoint = client.jobs.create_savepoint
+
+            def flaky_create_savepoint(job_id, *args):
+                if job_id == job_ids[1]:
+                    raise ValueError('Unexpected response')
+                return create_savepoint(job_id, *args)
+
+            jobs = client.jobs
+            monkeypatch.setattr(jobs, 'create_savepoint', flaky_create_savepoint)
+            results = jobs.bulk_savepoint('s3://bucket/savepoints', job_ids=job_ids + job_ids[:1],
+                                          max_requests_per_second=200)
+
+            assert list(results) == job_ids
+            assert server.request_counts['POST /jobs/:jobid/savepoints'] == 2
+        assert isinstance(results[job_ids[1]].error, ValueError)
+        assert results[job_ids[1]].as_dict()['job_id'] == job_ids[1]
+        assert results[job_ids[0]].succeeded and results[job_ids[2]].succeeded
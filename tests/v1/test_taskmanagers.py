@@ -1,5 +1,7 @@
 import math
 
+from flink_rest_client.common import RestSession
+from flink_rest_client.v1.client import FlinkRestClientV1
 from tests.v1.test_base import TestBase
 
 
@@ -66,6 +68,27 @@ class TestTaskmanagerClient(TestBase):
         assert math.isclose(response['Status.Network.AvailableMemorySegments']['min'], 4092.0)
         assert math.isclose(response['Status.JVM.Memory.Mapped.TotalCapacity']['min'], 0.0)
 
+    def test_metrics_with_metadata_cache(self, requests_mock):
+        client = FlinkRestClientV1("host", 8081, session=RestSession(metadata_ttl=60))
+        requests_mock.get(f'{client.taskmanagers.prefix}', json={'taskmanagers': [
+            {'id': '172.18.0.3:42073-c8a6ca'}
+        ]})
+        requests_mock.get(f'{client.taskmanagers.prefix}/metrics', json=[
+            {'id': 'Status.Network.AvailableMemorySegments',
+             'min': 4092.0, 'max': 4092.0, 'avg': 4092.0, 'sum': 4092.0},
+        ])
+
+        client.taskmanagers.metrics()
+        assert requests_mock.call_count == 3
+
+        response = client.taskmanagers.metrics()
+        assert requests_mock.call_count == 4
+        assert math.isclose(response['Status.Network.AvailableMemorySegments']['min'], 4092.0)
+
+        client.session.metadata_cache.invalidate_prefix(client.taskmanagers.prefix)
+        client.taskmanagers.metrics()
+        assert requests_mock.call_count == 7
+
     def test_get(self, simple_client, requests_mock):
         tid = '172.18.0.3:42073-c8a6ca'
         requests_mock.get(f'{simple_client.taskmanagers.prefix}/{tid}', json={
@@ -92,6 +115,15 @@ class TestTaskmanagerClient(TestBase):
         assert len(response) == 1
         assert response[0]['name'] == 'flink--taskexecutor-0-88d2501520f8.log'
 
+    def test_get_log(self, simple_client, requests_mock):
+        tid = '172.18.0.3:42073-c8a6ca'
+        log_file = 'flink--taskexecutor-0-64c17dab68c5.log'
+        content = 'content_of_the_log_file\n'
+        requests_mock.get(f'{simple_client.taskmanagers.prefix}/{tid}/logs/{log_file}', text=content)
+
+        assert simple_client.taskmanagers.get_log(tid, log_file) == content
+        assert "".join(simple_client.taskmanagers.stream_log(tid, log_file)) == content
+
     def test_get_metrics(self, simple_client, requests_mock):
         tid = '172.18.0.3:42073-c8a6ca'
 
@@ -131,3 +163,16 @@ class TestTaskmanagerClient(TestBase):
         assert isinstance(response, dict)
         assert len(response) == 1
         assert response['flink-taskexecutor-io-thread-1'] == '"flink-taskexecutor-io-thread-1"'
+
+    def test_iter_thread_dump(self, simple_client, requests_mock):
+        tid = '172.18.0.3:42073-c8a6ca'
+        requests_mock.get(f'{simple_client.taskmanagers.prefix}/{tid}/thread-dump', json={
+            'threadInfos': [
+                {'threadName': f'thread-{index}', 'stringifiedThreadInfo': f'"thread-{index}" RUNNABLE'}
+                for index in range(100)
+            ]
+        })
+        threads = simple_client.taskmanagers.iter_thread_dump(tid, chunk_size=64)
+
+        assert next(threads) == ('thread-0', '"thread-0" RUNNABLE')
+        assert len(list(threads)) == 99
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from flink_rest_client.common import Deadline, RestTimeoutException
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
+from flink_rest_client.v1.triggers import DatasetTrigger, JobTrigger, wait_all
+
+JOB_ID = 'a0d4b5b51065202b788bbd0a80251a3c'
+PREFIX = 'http://localhost:8081/v1/jobs'
+
+
+class TestJobTrigger:
+
+    def test_wait_polls_until_completed(self, requests_mock):
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/savepoints/t1', [
+            {'json': {'status': {'id': 'IN_PROGRESS'}}},
+            {'json': {'status': {'id': 'IN_PROGRESS'}}},
+            {'json': {'status': {'id': 'COMPLETED'}, 'operation': {'location': 's3://savepoints/savepoint-1'}}},
+        ])
+        result = JobTrigger(PREFIX, 'savepoints', JOB_ID, 't1').wait(initial_interval=0.01)
+
+        assert result.succeeded
+        assert result.status == 'COMPLETED'
+        assert result.location == 's3://savepoints/savepoint-1'
+        assert result.polls == 3
+        assert result.duration >= 0.01 + 0.015
+
+    def test_wait_reports_failure_cause(self, requests_mock):
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/savepoints/t1', json={
+            'status': {'id': 'COMPLETED'},
+            'operation': {'failure-cause': {'class': 'java.util.concurrent.CompletionException', 'stack-trace': ''}}
+        })
+        result = JobTrigger(PREFIX, 'savepoints', JOB_ID, 't1').wait()
+
+        assert not result.succeeded
+        assert result.location is None
+        assert result.as_dict()['failure_cause'] == 'java.util.concurrent.CompletionException'
+
+    def test_wait_timeout(self, requests_mock):
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/rescaling/t1', json={'status': {'id': 'IN_PROGRESS'}})
+        trigger = JobTrigger(PREFIX, 'rescaling', JOB_ID, 't1')
+
+        started_at = time.monotonic()
+        with pytest.raises(RestTimeoutException, match='t1'):
+            trigger.wait(timeout=0.2, initial_interval=0.05)
+        assert time.monotonic() - started_at < 1
+
+    def test_wait_reports_enclosing_deadline(self, requests_mock):
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/rescaling/t1', json={'status': {'id': 'IN_PROGRESS'}})
+        trigger = JobTrigger(PREFIX, 'rescaling', JOB_ID, 't1')
+
+        with Deadline(0.1):
+            with pytest.raises(RestTimeoutException, match=r'within 0\.\d+ seconds') as info:
+                trigger.wait(timeout=60, initial_interval=0.02)
+        assert '60' not in str(info.value)
+
+    def test_dataset_trigger(self, requests_mock):
+        requests_mock.get('http://localhost:8081/v1/datasets/delete/t1', json={'status': {'id': 'COMPLETED'}})
+        result = DatasetTrigger('http://localhost:8081/v1/datasets/delete', 't1').wait()
+
+        assert result.succeeded
+        assert result.operation == {}
+
+
+class TestWaitAll:
+
+    def test_wait_for_savepoints(self):
+        cluster = FakeFlinkCluster(jobs=10, trigger_duration=0.2)
+        with FakeFlinkServer(cluster) as server:
+            client = FlinkRestClientV1(server.host, server.port)
+            triggers = [client.jobs.stop(job_id, 's3://savepoints') for job_id in client.jobs.job_ids()]
+
+            started_at = time.monotonic()
+            results = wait_all(triggers, max_requests_per_second=50, initial_interval=0.05)
+            elapsed = time.monotonic() - started_at
+
+            assert [result.trigger for result in results] == triggers
+            assert all(result.succeeded for result in results)
+            assert all(result.location.startswith('s3://savepoints/') for result in results)
+            assert all(job['state'] == 'FINISHED' for job in cluster.jobs.values())
+            # The polls of all triggers share the request budget.
+            polls = server.request_counts['GET /jobs/:jobid/savepoints/:triggerid']
+            assert polls == sum(result.polls for result in results)
+            assert polls <= 50 * elapsed + 1
+
+    def test_timeout_and_errors(self, requests_mock):
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/savepoints/done', json={'status': {'id': 'COMPLETED'}})
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/savepoints/running', json={'status': {'id': 'IN_PROGRESS'}})
+        requests_mock.get(f'{PREFIX}/{JOB_ID}/savepoints/unknown', status_code=404, json={'errors': ['Not found.']})
+        triggers = [JobTrigger(PREFIX, 'savepoints', JOB_ID, trigger_id) for trigger_id in ['done', 'running', 'unknown']]
+
+        done, running, unknown = wait_all(triggers, timeout=0.3, initial_interval=0.05)
+
+        assert done.succeeded
+        assert isinstance(running.error, RestTimeoutException)
+        assert running.polls > 1
+        assert not unknown.succeeded and 'Not found.' in str(unknown.error)
+
+    def test_empty(self):
+        assert wait_all([]) == []
@@ -0,0 +1,190 @@
+import threading
+
+import pytest
+import requests
+
+from flink_rest_client.common import RestException
+from flink_rest_client.testing import FakeFlinkCluster, FakeFlinkServer
+from flink_rest_client.v1.client import FlinkRestClientV1
+from flink_rest_client.v1.watcher import (
+    JobFailed,
+    JobFinished,
+    JobRestarted,
+    JobStarted,
+    JobStateChanged,
+    JobWatcher,
+)
+
+
+@pytest.fixture
+def server():
+    with FakeFlinkServer(FakeFlinkCluster(jobs=2, seed=3)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return FlinkRestClientV1(server.host, server.port)
+
+
+def summary(events):
+    return [(type(event).__name__, event.job_id, event.previous_state, event.state) for event in events]
+
+
+class TestJobWatcher:
+
+    def test_events(self, client, server):
+        cluster = server.cluster
+        first, second = cluster.jobs
+        watcher = JobWatcher(client.jobs)
+
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+
+        third = cluster.add_job('New job')
+        cluster.set_job_state(first, 'FAILED')
+        assert summary(watcher.poll()) == [
+            ('JobStateChanged', first, 'RUNNING', 'FAILED'),
+            ('JobFailed', first, 'RUNNING', 'FAILED'),
+            ('JobStarted', third, None, 'RUNNING'),
+        ]
+
+        cluster.set_job_state(second, 'RESTARTING')
+        cluster.set_job_state(third, 'CANCELED')
+        assert summary(watcher.poll()) == [
+            ('JobStateChanged', second, 'RUNNING', 'RESTARTING'),
+            ('JobRestarted', second, 'RUNNING', 'RESTARTING'),
+            ('JobStateChanged', third, 'RUNNING', 'CANCELED'),
+            ('JobFinished', third, 'RUNNING', 'CANCELED'),
+        ]
+
+        cluster.set_job_state(second, 'RUNNING')
+        assert summary(watcher.poll()) == [('JobStateChanged', second, 'RESTARTING', 'RUNNING')]
+
+    def test_task_transitions_are_not_restarts(self, client, server):
+        cluster = server.cluster
+        watcher = JobWatcher(client.jobs)
+        watcher.poll()
+
+        job_id = cluster.add_job('New job')
+        assert summary(watcher.poll()) == [('JobStarted', job_id, None, 'RUNNING')]
+        cluster.transition_tasks(job_id)
+        cluster.transition_tasks(job_id)
+        assert watcher.poll() == []
+
+        cluster.set_job_state(job_id, 'RESTARTING')
+        cluster.set_job_state(job_id, 'RUNNING')
+        assert watcher.poll() == []
+
+    def test_track_restarts(self, client, server):
+        cluster = server.cluster
+        job_id = next(iter(cluster.jobs))
+        watcher = JobWatcher(client.jobs, track_restarts=True)
+        watcher.poll()
+
+        cluster.transition_tasks(job_id)
+        assert watcher.poll() == []
+
+        cluster.set_job_state(job_id, 'RESTARTING')
+        cluster.set_job_state(job_id, 'RUNNING')
+        events = watcher.poll()
+        assert summary(events) == [('JobRestarted', job_id, 'RUNNING', 'RUNNING')]
+        assert events[0].as_dict()['timestamp'] == cluster.jobs[job_id]['last-modification']
+
+        cluster.set_job_state(job_id, 'RESTARTING')
+        assert [type(event) for event in watcher.poll()] == [JobStateChanged, JobRestarted]
+        cluster.set_job_state(job_id, 'RUNNING')
+        assert [type(event) for event in watcher.poll()] == [JobStateChanged]
+        cluster.transition_tasks(job_id)
+        assert watcher.poll() == []
+
+        # The metric is queried only for the running jobs that changed.
+        assert server.request_counts['GET /jobs/:jobid/metrics'] == 2 + 4
+
+    def test_include_existing(self, client, server):
+        server.cluster.set_job_state(next(iter(server.cluster.jobs)), 'FINISHED')
+        events = JobWatcher(client.jobs, include_existing=True).poll()
+
+        assert [type(event) for event in events] == [JobStarted, JobFinished, JobStarted]
+
+    def test_callbacks(self, client, server):
+        job_id = next(iter(server.cluster.jobs))
+        watcher = JobWatcher(client.jobs)
+        received, failures = [], []
+        watcher.add_callback(received.append)
+        watcher.add_callback(failures.append, [JobFailed, JobRestarted])
+        watcher.poll()
+
+        server.cluster.set_job_state(job_id, 'FAILED')
+        watcher.poll()
+
+        assert [type(event) for event in received] == [JobStateChanged, JobFailed]
+        assert [type(event) for event in failures] == [JobFailed]
+
+    def test_events_iterator(self, client, server):
+        job_id = next(iter(server.cluster.jobs))
+        watcher = JobWatcher(client.jobs, interval=0.05)
+        iterator = watcher.events()
+        server.cluster.add_job('Late job')
+        threading.Timer(0.1, server.cluster.set_job_state, [job_id, 'FAILED']).start()
+
+        events = [next(iterator), next(iterator)]
+        assert [type(event) for event in events] == [JobStateChanged, JobFailed]
+        assert list(JobWatcher(client.jobs, interval=0.05).events(timeout=0.12)) == []
+        assert server.request_counts['GET /jobs/overview'] >= 3 + 3
+
+    def test_background_thread(self, client, server):
+        job_id = next(iter(server.cluster.jobs))
+        failed, errors = threading.Event(), []
+        watcher = JobWatcher(client.jobs, interval=0.02)
+        watcher.add_callback(lambda event: failed.set(), [JobFailed])
+        watcher.poll()
+
+        with watcher:
+            with pytest.raises(RestException):
+                watcher.start()
+            server.fail_next(count=1, status=500)
+            server.cluster.set_job_state(job_id, 'FAILED')
+            assert failed.wait(timeout=5)
+        assert watcher._thread is None
+
+        watcher.start(error_callback=errors.append)
+        server.fail_next(count=1, status=500)
+        try:
+            for _ in range(100):
+                if errors:
+                    break
+                threading.Event().wait(0.02)
+        finally:
+            watcher.stop()
+        assert isinstance(errors[0], RestException)
+
+    def test_background_thread_survives_failures(self, client, server):
+        job_id = next(iter(server.cluster.jobs))
+        failed, errors = threading.Event(), []
+        watcher = JobWatcher(client.jobs, interval=0.02)
+        watcher.poll()
+
+        def callback(event):
+            failed.set()
+            raise ValueError('broken callback')
+
+        watcher.add_callback(callback, [JobFailed])
+        server.drop_next(count=3)
+        watcher.start(error_callback=errors.append)
+        try:
+            for _ in range(250):
+                if len(errors) >= 3:
+                    break
+                threading.Event().wait(0.02)
+            server.cluster.set_job_state(job_id, 'FAILED')
+            assert failed.wait(timeout=5)
+            for _ in range(250):
+                if len(errors) >= 4:
+                    break
+                threading.Event().wait(0.02)
+            assert watcher._thread.is_alive()
+        finally:
+            watcher.stop()
+        assert all(isinstance(error, requests.exceptions.ConnectionError) for error in errors[:3])
+        assert isinstance(errors[3], ValueError)